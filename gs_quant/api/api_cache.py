@@ -14,27 +14,33 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import getpass
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import cachetools
-import pandas as pd
 
-from gs_quant.base import Base
+from gs_quant.base import structural_digest
 from gs_quant.session import GsSession
 
 
 class CacheEvent(Enum):
     PUT = 'Put'
     GET = 'Get'
+    MISS = 'Miss'
 
 
 class ApiRequestCache(ABC):
     def get(self, session: GsSession, key: Any, **kwargs):
         cache_lookup = self._get(session, key, **kwargs)
-        if cache_lookup is not None:
-            self.record(session, key, CacheEvent.GET, **kwargs)
+        self.record(session, key, CacheEvent.MISS if cache_lookup is None else CacheEvent.GET, **kwargs)
         return cache_lookup
 
     @abstractmethod
@@ -65,13 +71,7 @@ class InMemoryApiRequestCache(ApiRequestCache):
         self._records.clear()
 
     def _make_str_key(self, key: Any):
-        if isinstance(key, (list, tuple)):
-            return "_".join(self._make_str_key(k) for k in key)
-        elif isinstance(key, (Base, pd.DataFrame)):
-            return key.to_json()
-        elif isinstance(key, dict):
-            return self._make_str_key(list(key.items()))
-        return str(key)
+        return structural_digest(key)
 
     def _get(self, session: GsSession, key: Any, **kwargs):
         return self._cache.get(self._make_str_key(key))
@@ -81,3 +81,185 @@ class InMemoryApiRequestCache(ApiRequestCache):
 
     def _put(self, session: GsSession, key, value, **kwargs):
         self._cache[self._make_str_key(key)] = value
+
+
+class DiskApiRequestCache(ApiRequestCache):
+    """
+    Persistent API response cache backed by a SQLite file
+
+    Responses are keyed on a structural digest of the request and of the session it was made with (its environment,
+    domain and client or user), so they survive the process and can be shared by several processes using the same file
+    without serving one environment's or user's responses to another. Entries expire after a time to live, which can be
+    set per dataset, and the least recently used entries are evicted once the file holds more than max_size_bytes of
+    responses.
+
+    Values are stored with pickle, so the file should only be shared with trusted processes.
+
+    :param path: location of the cache file (defaults to ~/.gs_quant/api_cache.db)
+    :param max_size_bytes: maximum total size of cached responses
+    :param ttl_in_seconds: default time to live of an entry, None to keep entries until evicted
+    :param dataset_ttls: time to live by dataset id, overriding the default, e.g. {'EDRVOL_PERCENT_STANDARD': None}
+    """
+
+    __DATASET_PATTERN = re.compile(r'^/data/(?:datasets/)?([^/]+)')
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size_bytes: int = 1 << 30,
+        ttl_in_seconds: Optional[float] = 86400,
+        dataset_ttls: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        self.__path = path or os.path.join(os.path.expanduser('~'), '.gs_quant', 'api_cache.db')
+        self.__max_size_bytes = max_size_bytes
+        self.__ttl_in_seconds = ttl_in_seconds
+        self.__dataset_ttls = dict(dataset_ttls or {})
+        self.__local = threading.local()
+        self.__stats_lock = threading.Lock()
+        self.__stats = dict.fromkeys(CacheEvent, 0)
+
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        os.makedirs(directory, exist_ok=True)
+        with self.__connection() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, dataset TEXT, value BLOB NOT NULL, '
+                'size INTEGER NOT NULL, expires REAL, accessed REAL NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)')
+            connection.execute('CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)')
+            # the total size of the entries is kept up to date by triggers, so puts need not sum it
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute('CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+                connection.execute(
+                    "INSERT OR IGNORE INTO totals (name, value) SELECT 'size', COALESCE(SUM(size), 0) FROM entries"
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS entries_inserted AFTER INSERT ON entries BEGIN '
+                    "UPDATE totals SET value = value + NEW.size WHERE name = 'size'; END"
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS entries_deleted AFTER DELETE ON entries BEGIN '
+                    "UPDATE totals SET value = value - OLD.size WHERE name = 'size'; END"
+                )
+                connection.execute(
+                    'CREATE TRIGGER IF NOT EXISTS entries_resized AFTER UPDATE OF size ON entries BEGIN '
+                    "UPDATE totals SET value = value + NEW.size - OLD.size WHERE name = 'size'; END"
+                )
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def stats(self) -> Dict[CacheEvent, int]:
+        """Number of hits, misses and puts recorded by this process"""
+        with self.__stats_lock:
+            return dict(self.__stats)
+
+    def __connection(self) -> sqlite3.Connection:
+        # sqlite connections cannot be shared across threads, nor inherited by forked processes
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None or self.__local.pid != os.getpid():
+            connection = sqlite3.connect(self.__path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self.__local.connection, self.__local.pid = connection, os.getpid()
+        return connection
+
+    @classmethod
+    def _session_scope(cls, session: Optional[GsSession]) -> Optional[tuple]:
+        if session is None:
+            return None
+        environment = getattr(session, 'environment', None)
+        identity = getattr(session, 'client_id', None) or getattr(session, 'token', None)
+        if identity is None:
+            try:
+                identity = getpass.getuser()
+            except (KeyError, OSError):
+                identity = os.getuid() if hasattr(os, 'getuid') else None
+        return getattr(environment, 'name', environment), str(getattr(session, 'domain', None)), identity
+
+    @classmethod
+    def _make_hash_key(cls, key: Any, session: Optional[GsSession] = None) -> str:
+        return structural_digest((cls._session_scope(session), key))
+
+    @classmethod
+    def _dataset(cls, key: Any) -> Optional[str]:
+        # GsDataApi keys are (url, method, kwargs), with urls such as /data/{dataset_id}/query
+        url = key[0] if isinstance(key, (list, tuple)) and key else key
+        match = cls.__DATASET_PATTERN.match(url) if isinstance(url, str) else None
+        return match.group(1) if match else None
+
+    def record(self, session: GsSession, key: Any, method: CacheEvent, **kwargs):
+        with self.__stats_lock:
+            self.__stats[method] += 1
+
+    def _get(self, session: GsSession, key: Any, **kwargs):
+        hash_key, now = self._make_hash_key(key, session), time.time()
+        connection = self.__connection()
+        row = connection.execute('SELECT value, expires FROM entries WHERE key = ?', (hash_key,)).fetchone()
+        if row is None:
+            return None
+        value, expires = row
+        if expires is not None and expires <= now:
+            connection.execute('DELETE FROM entries WHERE key = ? AND expires <= ?', (hash_key, now))
+            return None
+        connection.execute('UPDATE entries SET accessed = ? WHERE key = ?', (now, hash_key))
+        return pickle.loads(value)
+
+    def _put(self, session: GsSession, key: Any, value, **kwargs):
+        dataset = self._dataset(key)
+        ttl = self.__dataset_ttls.get(dataset, self.__ttl_in_seconds)
+        if ttl is not None and ttl <= 0:
+            return
+
+        blob, now = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), time.time()
+        if len(blob) > self.__max_size_bytes:
+            return
+        connection = self.__connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute(
+                'INSERT INTO entries (key, dataset, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET dataset = excluded.dataset, value = excluded.value, '
+                'size = excluded.size, expires = excluded.expires, accessed = excluded.accessed',
+                (self._make_hash_key(key, session), dataset, blob, len(blob), None if ttl is None else now + ttl, now),
+            )
+            self.__evict(connection, now)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def __evict(self, connection: sqlite3.Connection, now: float):
+        connection.execute('DELETE FROM entries WHERE expires <= ?', (now,))
+        total = connection.execute("SELECT value FROM totals WHERE name = 'size'").fetchone()[0]
+        excess = total - self.__max_size_bytes
+        if excess <= 0:
+            return
+
+        evicted = []
+        cursor = connection.execute('SELECT key, size FROM entries ORDER BY accessed')
+        for key, size in cursor:
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        cursor.close()
+        connection.executemany('DELETE FROM entries WHERE key = ?', evicted)
+
+    def clear(self, dataset: Optional[str] = None):
+        """
+        Remove cached responses
+
+        :param dataset: dataset id whose responses to remove, or None to remove all responses
+        """
+        if dataset is None:
+            self.__connection().execute('DELETE FROM entries')
+        else:
+            self.__connection().execute('DELETE FROM entries WHERE dataset = ?', (dataset,))
@@ -19,19 +19,21 @@ import datetime as dt
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy, deepcopy
 from enum import Enum
 from itertools import chain
-from typing import Iterable, List, Optional, Tuple, Union, Dict
+from typing import Callable, Iterable, List, Optional, Tuple, Union, Dict
 
 import cachetools
+import numpy as np
 import pandas as pd
 from cachetools import TTLCache
 from dateutil import parser
 from pydash import get
 
 from gs_quant.api.data import DataApi
-from gs_quant.base import Base
+from gs_quant.base import Base, structural_digest
 from gs_quant.common import MarketDataVendor, PricingLocation, Format
 from gs_quant.data.core import DataContext, DataFrequency
 from gs_quant.data.log import log_debug, log_warning
@@ -197,6 +199,7 @@ class GsDataApi(DataApi):
     __asset_coordinates_cache = TTLCache(10000, 86400)
     _api_request_cache: ApiRequestCache = None
     DEFAULT_SCROLL = '30s'
+    MAX_PAGE_WORKERS = 8
 
     # DataApi interface
 
@@ -211,8 +214,9 @@ class GsDataApi(DataApi):
                 return v.isoformat()
 
         def serialize_value(v):
-            if any(isinstance(v, class_) for class_ in {MDAPIDataQuery, DataQuery}):
-                return v.to_json(sort_keys=True, default=fallback_encoder)
+            if isinstance(v, (MDAPIDataQuery, DataQuery)):
+                # memoised on the query, so lookups do not re-serialise large payloads
+                return structural_digest(v)
             encoded_v = fallback_encoder(v)
             return encoded_v or v
 
@@ -221,17 +225,18 @@ class GsDataApi(DataApi):
         return cache_key
 
     @classmethod
-    def _check_cache(cls, url, **kwargs):
+    def _check_cache(cls, url, domain=None, **kwargs):
         session = cls.get_session()
         cached_val, cache_key = None, None
         if cls._api_request_cache:
-            cache_key = cls._construct_cache_key(url, **kwargs)
+            # responses routed to another domain, such as MDS, are cached apart from those of the session's domain
+            cache_key = cls._construct_cache_key(url, **kwargs, **({'domain': domain} if domain else {}))
             cached_val = cls._api_request_cache.get(session, cache_key)
         return cached_val, cache_key, session
 
     @classmethod
     def _post_with_cache_check(cls, url, validator=lambda x: x, domain=None, **kwargs):
-        result, cache_key, session = cls._check_cache(url=url, **kwargs)
+        result, cache_key, session = cls._check_cache(url, domain=domain, **kwargs)
         if result is None:
             result = validator(session.sync.post(url, domain=domain, **kwargs))
             if cls._api_request_cache:
@@ -240,7 +245,7 @@ class GsDataApi(DataApi):
 
     @classmethod
     def _get_with_cache_check(cls, url, validator=lambda x: x, domain=None, **kwargs):
-        result, cache_key, session = cls._check_cache(url, **kwargs)
+        result, cache_key, session = cls._check_cache(url, domain=domain, **kwargs)
         if result is None:
             result = validator(session.sync.get(url, domain=domain, **kwargs))
             if cls._api_request_cache:
@@ -249,7 +254,7 @@ class GsDataApi(DataApi):
 
     @classmethod
     async def _get_with_cache_check_async(cls, url, validator=lambda x: x, domain=None, **kwargs):
-        result, cache_key, session = cls._check_cache(url, **kwargs)
+        result, cache_key, session = cls._check_cache(url, domain=domain, **kwargs)
         if result is None:
             result = await session.async_.get(url, domain=domain, **kwargs)
             result = validator(result)
@@ -259,7 +264,7 @@ class GsDataApi(DataApi):
 
     @classmethod
     async def _post_with_cache_check_async(cls, url, validator=lambda x: x, domain=None, **kwargs):
-        result, cache_key, session = cls._check_cache(url, **kwargs)
+        result, cache_key, session = cls._check_cache(url, domain=domain, **kwargs)
         if result is None:
             result = await session.async_.post(url, domain=domain, **kwargs)
             result = validator(result)
@@ -332,7 +337,7 @@ class GsDataApi(DataApi):
     async def _check_data_on_cloud_async(cls, dataset_id: str):
         session = cls.get_session()
         if session.redirect_to_mds and dataset_id != 'coordinates':
-            dataset_data = await cls._get_with_cache_check(f'/data/datasets/{dataset_id}')
+            dataset_data = await cls._get_with_cache_check_async(f'/data/datasets/{dataset_id}')
             database_id_exists = get(dataset_data, 'parameters.databaseId')
 
             if database_id_exists:
@@ -357,37 +362,96 @@ class GsDataApi(DataApi):
             results = response.data if response.data is not None else ()
         return results, total_pages
 
+    @staticmethod
+    def _fetch_page(session, data_context, span, dataset_id: str, query: DataQuery, page: int):
+        query = deepcopy(query)
+        query.page = page
+        with Tracer.activate_span(span), session:
+            with data_context:
+                return GsDataApi._get_results(GsDataApi.execute_query(dataset_id, query))[0]
+
     @staticmethod
     def get_results(
-        dataset_id: str, response: Union[DataQueryResponse, dict], query: DataQuery
+        dataset_id: str,
+        response: Union[DataQueryResponse, dict],
+        query: DataQuery,
+        max_workers: Optional[int] = None,
+        on_page: Optional[Callable[[Union[list, tuple]], None]] = None,
     ) -> Union[list, Tuple[list, list]]:
+        """
+        The results of a query from every page of its response
+
+        Pages after the first are fetched concurrently and their results are returned in page order.
+
+        :param dataset_id: id of the dataset queried
+        :param response: the response to the query
+        :param query: the query, which is not modified
+        :param max_workers: maximum number of pages fetched at once, defaults to MAX_PAGE_WORKERS
+        :param on_page: called with the results of each page in page order as soon as it and the pages before it have
+                        been fetched, so callers can process results before the last page is received
+        :return: results of all the pages, with the fields they are grouped by if the query groups them
+        """
         results, total_pages = GsDataApi._get_results(response)
-        if total_pages:
-            if query.page is None:
-                query.page = total_pages - 1
-                results = results + GsDataApi.get_results(dataset_id, GsDataApi.execute_query(dataset_id, query), query)
-            elif query.page - 1 > 0:
-                query.page -= 1
-                results = results + GsDataApi.get_results(dataset_id, GsDataApi.execute_query(dataset_id, query), query)
-            else:
-                return results
-        return results
+        if on_page is not None:
+            on_page(results)
+        last_page = (total_pages if query.page is None else query.page) if total_pages else 0
+        pages = range(1, last_page)
+        if not pages:
+            return results
+
+        grouped = isinstance(response, dict) and isinstance(results, tuple)
+        chunks = [None] * (len(pages) + 1)
+        chunks[0] = results
+        context = (GsDataApi.get_session(), DataContext.current, Tracer.active_span())
+        executor = ThreadPoolExecutor(max_workers=min(max_workers or GsDataApi.MAX_PAGE_WORKERS, len(pages)))
+        try:
+            futures = [executor.submit(GsDataApi._fetch_page, *context, dataset_id, query, page) for page in pages]
+            for i, future in enumerate(futures, 1):
+                chunks[i] = future.result()
+                if on_page is not None:
+                    on_page(chunks[i])
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return GsDataApi._merge_pages(chunks, grouped)
+
+    @staticmethod
+    def _merge_pages(chunks: List[Union[list, tuple]], grouped: bool) -> Union[list, Tuple[list, list]]:
+        if grouped:
+            rows = list(chain.from_iterable(chunk[0] for chunk in chunks))
+            return rows, list(dict.fromkeys(chain.from_iterable(chunk[1] for chunk in chunks)))
+        return list(chain.from_iterable(chunks))
+
+    @staticmethod
+    async def _fetch_page_async(dataset_id: str, query: DataQuery, page: int):
+        query = deepcopy(query)
+        query.page = page
+        return GsDataApi._get_results(await GsDataApi.execute_query_async(dataset_id, query))[0]
 
     @staticmethod
     async def get_results_async(
         dataset_id: str, response: Union[DataQueryResponse, dict], query: DataQuery
     ) -> Union[list, Tuple[list, list]]:
+        """
+        The results of a query from every page of its response
+
+        Pages after the first are requested at once on the session's async client, which bounds how many are in flight
+        to each host, and their results are returned in page order.
+
+        :param dataset_id: id of the dataset queried
+        :param response: the response to the query
+        :param query: the query, which is not modified
+        :return: results of all the pages, with the fields they are grouped by if the query groups them
+        """
         results, total_pages = GsDataApi._get_results(response)
-        if total_pages and total_pages > 1:
-            futures = []
-            for page in range(1, total_pages):
-                query = deepcopy(query)
-                query.page = page
-                futures.append(GsDataApi.execute_query_async(dataset_id, query))
-            all_responses = await asyncio.gather(*futures, return_exceptions=True)
-            for response_crt in all_responses:
-                results += GsDataApi._get_results(response_crt)[0]
-        return results
+        last_page = (total_pages if query.page is None else query.page) if total_pages else 0
+        if last_page <= 1:
+            return results
+
+        pages = await asyncio.gather(
+            *(GsDataApi._fetch_page_async(dataset_id, query, page) for page in range(1, last_page))
+        )
+        return GsDataApi._merge_pages([results, *pages], isinstance(response, dict) and isinstance(results, tuple))
 
     @classmethod
     def last_data(
@@ -406,6 +470,23 @@ class GsDataApi(DataApi):
             )
             return result.get('data', ())
 
+    @classmethod
+    async def last_data_async(
+        cls, query: Union[DataQuery, MDAPIDataQuery], dataset_id: str = None, timeout: int = None
+    ) -> Union[list, tuple]:
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        if getattr(query, 'marketDataCoordinates', None):
+            result = await cls._post_with_cache_check_async('/data/coordinates/query/last', payload=query, **kwargs)
+            return result.get('responses', ())
+        else:
+            domain = await cls._check_data_on_cloud_async(dataset_id)
+            result = await cls._post_with_cache_check_async(
+                '/data/{}/last/query'.format(dataset_id), payload=query, domain=domain, **kwargs
+            )
+            return result.get('data', ())
+
     @classmethod
     def symbol_dimensions(cls, dataset_id: str) -> tuple:
         definition = cls.get_definition(dataset_id)
@@ -630,6 +711,39 @@ class GsDataApi(DataApi):
         limit: int = 100,
         return_type: type = str,
     ) -> Union[Tuple[str, ...], Tuple[MarketDataCoordinate, ...]]:
+        query = cls._many_coordinates_query(mkt_type, mkt_asset, mkt_class, mkt_point, limit)
+        results = cls._post_with_cache_check('/data/mdapi/query', payload=query)['results']
+        return cls._coordinates_from_results(results, return_type)
+
+    @classmethod
+    async def get_many_coordinates_async(
+        cls,
+        mkt_type: str = None,
+        mkt_asset: str = None,
+        mkt_class: str = None,
+        mkt_point: Tuple[str, ...] = (),
+        *,
+        limit: int = 100,
+        return_type: type = str,
+    ) -> Union[Tuple[str, ...], Tuple[MarketDataCoordinate, ...]]:
+        key = cachetools.keys.hashkey(
+            cls, mkt_type, mkt_asset, mkt_class, mkt_point, limit=limit, return_type=return_type
+        )
+        coordinates = cls.__asset_coordinates_cache.get(key)
+        if coordinates is None:
+            query = cls._many_coordinates_query(mkt_type, mkt_asset, mkt_class, mkt_point, limit)
+            results = (await cls._post_with_cache_check_async('/data/mdapi/query', payload=query))['results']
+            coordinates = cls.__asset_coordinates_cache[key] = cls._coordinates_from_results(results, return_type)
+        return coordinates
+
+    @staticmethod
+    def _many_coordinates_query(
+        mkt_type: Optional[str],
+        mkt_asset: Optional[str],
+        mkt_class: Optional[str],
+        mkt_point: Tuple[str, ...],
+        limit: int,
+    ) -> EntityQuery:
         where = FieldFilterMap(
             mkt_type=mkt_type.upper() if mkt_type is not None else None,
             mkt_asset=mkt_asset.upper() if mkt_asset is not None else None,
@@ -638,9 +752,12 @@ class GsDataApi(DataApi):
         for index, point in enumerate(mkt_point):
             setattr(where, 'mkt_point' + str(index + 1), point.upper())
 
-        query = EntityQuery(where=where, limit=limit)
-        results = cls._post_with_cache_check('/data/mdapi/query', payload=query)['results']
+        return EntityQuery(where=where, limit=limit)
 
+    @staticmethod
+    def _coordinates_from_results(
+        results: Iterable[dict], return_type: type
+    ) -> Union[Tuple[str, ...], Tuple[MarketDataCoordinate, ...]]:
         if return_type is str:
             return tuple(coordinate['name'] for coordinate in results)
         elif return_type is MarketDataCoordinate:
@@ -1065,55 +1182,75 @@ class GsDataApi(DataApi):
     @classmethod
     def get_market_data(cls, query, request_id=None, ignore_errors: bool = False) -> pd.DataFrame:
         with Tracer('GsDataApi.get_market_data') as scope:
+            start = time.perf_counter()
+            try:
+                body = cls._post_with_cache_check(
+                    url='/data/measures', validator=cls._validate_market_data, payload=query
+                )
+            except Exception as e:
+                tag_error(scope)
+                log_warning(request_id, _logger, f'Market data query {query} failed due to {e}')
+                raise e
+            return cls._market_data_frame(scope, body, query, start, request_id, ignore_errors)
 
-            def validate(body):
-                for e in body['responses']:
-                    container = e['queryResponse'][0]
-                    if 'errorMessages' in container:
-                        msg = f'measure service request {body["requestId"]} failed: {container["errorMessages"]}'
-                        raise MqValueError(msg)
-                return body
-
+    @classmethod
+    async def get_market_data_async(cls, query, request_id=None, ignore_errors: bool = False) -> pd.DataFrame:
+        with Tracer('GsDataApi.get_market_data_async') as scope:
             start = time.perf_counter()
             try:
-                body = cls._post_with_cache_check(url='/data/measures', validator=validate, payload=query)
+                body = await cls._post_with_cache_check_async(
+                    url='/data/measures', validator=cls._validate_market_data, payload=query
+                )
             except Exception as e:
                 tag_error(scope)
                 log_warning(request_id, _logger, f'Market data query {query} failed due to {e}')
                 raise e
-            log_debug(
-                request_id,
-                _logger,
-                'market data query (%s) with payload (%s) ran in %.3f ms',
-                body.get('requestId'),
-                query,
-                (time.perf_counter() - start) * 1000,
-            )
+            return cls._market_data_frame(scope, body, query, start, request_id, ignore_errors)
 
-            ids = []
-            parts = []
-            for e in body['responses']:
-                container = e['queryResponse'][0]
-                ids.extend(container.get('dataSetIds', ()))
-                if 'errorMessages' in container:
-                    msg = f'measure service request {body["requestId"]} failed: {container["errorMessages"]}'
-                    if ignore_errors:
-                        log_warning(request_id, _logger, msg)
-                    else:
-                        raise MqValueError(msg)
-                if 'response' in container:
-                    df = MarketDataResponseFrame(container['response']['data'])
-                    df = df.set_index('date' if 'date' in df.columns else 'time')
-                    df.index = pd.to_datetime(df.index)
-                    parts.append(df)
-
-            log_debug(request_id, _logger, f'fetched data from {ids}')
-            df = pd.concat(parts) if len(parts) > 0 else MarketDataResponseFrame()
-            df.dataset_ids = tuple(ids)
-            tag_request_id(scope, body)
-            scope.span.set_tag('dataset_ids', str(ids))
-            tag_row_count(scope, df)
-            return df
+    @staticmethod
+    def _validate_market_data(body):
+        for e in body['responses']:
+            container = e['queryResponse'][0]
+            if 'errorMessages' in container:
+                msg = f'measure service request {body["requestId"]} failed: {container["errorMessages"]}'
+                raise MqValueError(msg)
+        return body
+
+    @staticmethod
+    def _market_data_frame(scope, body, query, start: float, request_id, ignore_errors: bool) -> pd.DataFrame:
+        log_debug(
+            request_id,
+            _logger,
+            'market data query (%s) with payload (%s) ran in %.3f ms',
+            body.get('requestId'),
+            query,
+            (time.perf_counter() - start) * 1000,
+        )
+
+        ids = []
+        parts = []
+        for e in body['responses']:
+            container = e['queryResponse'][0]
+            ids.extend(container.get('dataSetIds', ()))
+            if 'errorMessages' in container:
+                msg = f'measure service request {body["requestId"]} failed: {container["errorMessages"]}'
+                if ignore_errors:
+                    log_warning(request_id, _logger, msg)
+                else:
+                    raise MqValueError(msg)
+            if 'response' in container:
+                df = MarketDataResponseFrame(container['response']['data'])
+                df = df.set_index('date' if 'date' in df.columns else 'time')
+                df.index = pd.to_datetime(df.index)
+                parts.append(df)
+
+        log_debug(request_id, _logger, f'fetched data from {ids}')
+        df = pd.concat(parts) if len(parts) > 0 else MarketDataResponseFrame()
+        df.dataset_ids = tuple(ids)
+        tag_request_id(scope, body)
+        scope.span.set_tag('dataset_ids', str(ids))
+        tag_row_count(scope, df)
+        return df
 
     @classmethod
     def __normalise_coordinate_data(
@@ -1233,7 +1370,56 @@ class GsDataApi(DataApi):
             kwargs['timeout'] = timeout
 
         data = cls.last_data(query, **kwargs)
+        return cls._coordinates_last_result(data, market_data_coordinates, as_of, as_dataframe)
+
+    @classmethod
+    async def coordinates_last_async(
+        cls,
+        coordinates: Union[Iterable[str], Iterable[MarketDataCoordinate]],
+        as_of: Union[dt.datetime, dt.date] = None,
+        vendor: MarketDataVendor = MarketDataVendor.Goldman_Sachs,
+        as_dataframe: bool = False,
+        pricing_location: Optional[PricingLocation] = None,
+        timeout: int = None,
+    ) -> Union[Dict, pd.DataFrame]:
+        """
+        Get last value of coordinates data
+
+        :param coordinates: market data coordinate(s)
+        :param as_of: snapshot date or time
+        :param vendor: data vendor
+        :param as_dataframe: whether to return the result as Dataframe
+        :param pricing_location: the location where close data has been recorded (not used for real-time query)
+        :param timeout: data query timeout; if timeout is not set then the default timeout is used
+        :return: Dataframe or dictionary of the returned data
+
+        **Examples**
+
+        >>> coordinate = ("FX Fwd_USD/EUR_Fwd Pt_2y",)
+        >>> data = await GsDataApi.coordinates_last_async(coordinate, dt.datetime(2019, 11, 19))
+        """
+        market_data_coordinates = tuple(
+            cls._coordinate_from_str(coord) if isinstance(coord, str) else coord for coord in coordinates
+        )
+        query = cls.build_query(
+            end=as_of, market_data_coordinates=market_data_coordinates, vendor=vendor, pricing_location=pricing_location
+        )
+
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+
+        data = await cls.last_data_async(query, **kwargs)
+        return cls._coordinates_last_result(data, market_data_coordinates, as_of, as_dataframe)
 
+    @classmethod
+    def _coordinates_last_result(
+        cls,
+        data: Iterable[Union[MDAPIDataQueryResponse, Dict]],
+        market_data_coordinates: Tuple[MarketDataCoordinate, ...],
+        as_of: Union[dt.datetime, dt.date],
+        as_dataframe: bool,
+    ) -> Union[Dict, pd.DataFrame]:
         if not as_dataframe:
             ret = {coordinate: None for coordinate in market_data_coordinates}
             for idx, row in enumerate(cls.__normalise_coordinate_data(data)):
@@ -1290,8 +1476,56 @@ class GsDataApi(DataApi):
         >>> coordinate = ("FX Fwd_USD/EUR_Fwd Pt_2y",)
         >>> data = GsDataApi.coordinates_data(coordinate, dt.datetime(2019, 11, 18), dt.datetime(2019, 11, 19))
         """
+        query = cls._coordinates_data_query(coordinates, start, end, vendor, pricing_location, fields, **kwargs)
+        return cls._coordinates_data_result(cls.query_data(query), fields, as_multiple_dataframes)
+
+    @classmethod
+    async def coordinates_data_async(
+        cls,
+        coordinates: Union[str, MarketDataCoordinate, Iterable[str], Iterable[MarketDataCoordinate]],
+        start: Union[dt.datetime, dt.date] = None,
+        end: Union[dt.datetime, dt.date] = None,
+        vendor: MarketDataVendor = MarketDataVendor.Goldman_Sachs,
+        as_multiple_dataframes: bool = False,
+        pricing_location: Optional[PricingLocation] = None,
+        fields: Optional[Tuple[MDAPIQueryField, ...]] = None,
+        **kwargs,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame]]:
+        """
+        Get coordinates data
+
+        :param coordinates: market data coordinate(s)
+        :param start: start date or time
+        :param end: end date or time
+        :param vendor: data vendor
+        :param as_multiple_dataframes: whether to return the result as one or multiple Dataframe(s)
+        :param pricing_location: the location where close data has been recorded (not used for real-time query)
+        :param fields: value fields to return
+        :param kwargs: Extra query arguments
+        :return: Dataframe(s) of the returned data
+
+        **Examples**
+
+        >>> coordinate = ("FX Fwd_USD/EUR_Fwd Pt_2y",)
+        >>> data = await GsDataApi.coordinates_data_async(coordinate, dt.datetime(2019, 11, 18),
+        >>>                                               dt.datetime(2019, 11, 19))
+        """
+        query = cls._coordinates_data_query(coordinates, start, end, vendor, pricing_location, fields, **kwargs)
+        return cls._coordinates_data_result(await cls.query_data_async(query), fields, as_multiple_dataframes)
+
+    @classmethod
+    def _coordinates_data_query(
+        cls,
+        coordinates: Union[str, MarketDataCoordinate, Iterable[str], Iterable[MarketDataCoordinate]],
+        start: Union[dt.datetime, dt.date],
+        end: Union[dt.datetime, dt.date],
+        vendor: MarketDataVendor,
+        pricing_location: Optional[PricingLocation],
+        fields: Optional[Tuple[MDAPIQueryField, ...]],
+        **kwargs,
+    ) -> Union[DataQuery, MDAPIDataQuery]:
         coordinates_iterable = (coordinates,) if isinstance(coordinates, (MarketDataCoordinate, str)) else coordinates
-        query = cls.build_query(
+        return cls.build_query(
             market_data_coordinates=tuple(
                 cls._coordinate_from_str(coord) if isinstance(coord, str) else coord for coord in coordinates_iterable
             ),
@@ -1303,7 +1537,14 @@ class GsDataApi(DataApi):
             **kwargs,
         )
 
-        results = cls.__normalise_coordinate_data(cls.query_data(query), fields=fields)
+    @classmethod
+    def _coordinates_data_result(
+        cls,
+        data: Iterable[Union[MDAPIDataQueryResponse, Dict]],
+        fields: Optional[Tuple[MDAPIQueryField, ...]],
+        as_multiple_dataframes: bool,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame]]:
+        results = cls.__normalise_coordinate_data(data, fields=fields)
 
         if as_multiple_dataframes:
             return tuple(GsDataApi.__df_from_coordinate_data(r) for r in results)
@@ -1345,7 +1586,51 @@ class GsDataApi(DataApi):
             as_multiple_dataframes=True,
             **kwargs,
         )
+        return cls._coordinates_series(coordinates, dfs)
+
+    @classmethod
+    async def coordinates_data_series_async(
+        cls,
+        coordinates: Union[str, MarketDataCoordinate, Iterable[str], Iterable[MarketDataCoordinate]],
+        start: Union[dt.datetime, dt.date] = None,
+        end: Union[dt.datetime, dt.date] = None,
+        vendor: MarketDataVendor = MarketDataVendor.Goldman_Sachs,
+        pricing_location: Optional[PricingLocation] = None,
+        **kwargs,
+    ) -> Union[pd.Series, Tuple[pd.Series]]:
+        """
+        Get coordinates data series
 
+        :param coordinates: market data coordinate(s)
+        :param start: start date or time
+        :param end: end date or time
+        :param vendor: data vendor
+        :param pricing_location: the location where close data has been recorded (not used for real-time query)
+        :param kwargs: Extra query arguments
+        :return: Series of the returned data
+
+        **Examples**
+
+        >>> coordinate = ("FX Fwd_USD/EUR_Fwd Pt_2y",)
+        >>> data = await GsDataApi.coordinates_data_series_async(coordinate, dt.datetime(2019, 11, 18),
+        >>>                                                      dt.datetime(2019, 11, 19))
+        """
+        dfs = await cls.coordinates_data_async(
+            coordinates,
+            start=start,
+            end=end,
+            pricing_location=pricing_location,
+            vendor=vendor,
+            as_multiple_dataframes=True,
+            **kwargs,
+        )
+        return cls._coordinates_series(coordinates, dfs)
+
+    @staticmethod
+    def _coordinates_series(
+        coordinates: Union[str, MarketDataCoordinate, Iterable[str], Iterable[MarketDataCoordinate]],
+        dfs: Tuple[pd.DataFrame],
+    ) -> Union[pd.Series, Tuple[pd.Series]]:
         ret = tuple(
             pd.Series(dtype=float) if df.empty else pd.Series(index=df.index, data=df.value.values) for df in dfs
         )
@@ -1385,9 +1670,41 @@ class GsDataApi(DataApi):
             return field_types
         return {}
 
+    @staticmethod
+    def _typed_column(values: np.ndarray, type_name: Optional[str], categorical: bool = False):
+        """
+        A column of values, decoded according to the type of its field
+
+        Dates and categoricals are parsed once for each distinct value and numbers are cast straight to an integer or
+        float array. Anything else has its type inferred, as the dataframe constructor would.
+        """
+        if categorical:
+            return pd.Categorical.from_codes(*pd.factorize(values, sort=True))
+        if type_name == 'number':
+            kind = pd.api.types.infer_dtype(values, skipna=False)
+            if kind in ('floating', 'mixed-integer-float', 'integer'):
+                try:
+                    return values.astype(np.int64 if kind == 'integer' else np.float64)
+                except OverflowError:
+                    pass
+        elif type_name in ('date', 'date-time'):
+            codes, uniques = pd.factorize(values)
+            if (codes >= 0).any():
+                if int(pd.__version__.split('.')[0]) > 1:
+                    uniques = pd.to_datetime(uniques, format='ISO8601')
+                else:
+                    uniques = pd.to_datetime(uniques)
+                return uniques.take(codes, allow_fill=True, fill_value=pd.NaT)
+        return pd.Series(values).infer_objects()
+
     @classmethod
     def construct_dataframe_with_types(
-        cls, dataset_id: str, data: Union[Base, List, Tuple], schema_varies=False, standard_fields=False
+        cls,
+        dataset_id: str,
+        data: Union[Base, List, Tuple],
+        schema_varies=False,
+        standard_fields=False,
+        categorical_fields: Optional[Iterable[str]] = None,
     ) -> pd.DataFrame:
         """
         Constructs a dataframe with correct date types.
@@ -1395,34 +1712,32 @@ class GsDataApi(DataApi):
         :param data: data to convert with correct types
         :param schema_varies: if set, method will not assume that all rows have the same columns
         :param standard_fields: if set, will use fields api instead of catalog api to get fieldTypes
+        :param categorical_fields: fields to decode as categoricals, such as the symbol dimensions of the dataset
         :return: dataframe with correct types
         """
         if len(data):
             # Use first row to infer fields from data
             sample = data if schema_varies else [data[0]]
-            incoming_data_data_types = pd.DataFrame(sample).dtypes.to_dict()
+            incoming_fields = list(dict.fromkeys(chain.from_iterable(sample)))
             dataset_types = (
-                cls.get_types(dataset_id)
-                if not standard_fields
-                else cls.get_field_types(field_names=list(incoming_data_data_types.keys()))
+                cls.get_types(dataset_id) if not standard_fields else cls.get_field_types(field_names=incoming_fields)
             )
 
             # fallback approach in case fields api doesn't return results
             if dataset_types == {} and standard_fields:
                 dataset_types = cls.get_types(dataset_id)
 
-            df = pd.DataFrame(data, columns={**dataset_types, **incoming_data_data_types})
-
-            for field_name, type_name in dataset_types.items():
-                if (
-                    df.get(field_name) is not None
-                    and type_name in ('date', 'date-time')
-                    and len(df.get(field_name).value_counts()) > 0
-                ):
-                    if int(pd.__version__.split('.')[0]) > 1:
-                        df[field_name] = pd.to_datetime(df[field_name], format='ISO8601')
-                    else:
-                        df[field_name] = pd.to_datetime(df[field_name])
+            # read the rows without inferring types, then decode each column from the types of the fields
+            raw = pd.DataFrame(data, columns=list(dict.fromkeys(chain(dataset_types, incoming_fields))), dtype=object)
+            categorical_fields = set(categorical_fields or ())
+            df = pd.DataFrame(
+                {
+                    field_name: cls._typed_column(
+                        raw[field_name].to_numpy(), dataset_types.get(field_name), field_name in categorical_fields
+                    )
+                    for field_name in raw.columns
+                }
+            )
 
             field_names = dataset_types.keys()
 
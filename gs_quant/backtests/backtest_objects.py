@@ -114,9 +114,10 @@ class BackTest(BaseBacktest):
         self._results = defaultdict(list)
         self._trade_exit_risk_results = defaultdict(list)
         self.risks = make_list(self.risks)  # list of risks to calculate
-        self._risk_summary_dict = None  # Summary dict shared between output views, only initialized once
+        self._results_cache = {}  # values derived from the results of each date, with the results they came from
         self._calc_calls = 0
         self._calculations = 0
+        self._calculations_saved = 0
 
     @property
     def cash_dict(self):
@@ -199,27 +200,52 @@ class BackTest(BaseBacktest):
     def calculations(self, calculations):
         self._calculations = calculations
 
+    @property
+    def calculations_saved(self):
+        """
+        Risk calculations needed by the backtest which were not requested, as their results were already available or
+        were requested for another position, and which are not counted in calculations
+        """
+        return self._calculations_saved
+
+    @calculations_saved.setter
+    def calculations_saved(self, calculations_saved):
+        self._calculations_saved = calculations_saved
+
+    def _cached_by_date(self, kind: str, date: dt.date, results, compute: Callable):
+        """
+        A value computed from the results of a date, recomputed only when the results of that date are replaced
+        """
+        cached = self._results_cache.get((kind, date))
+        if cached is None or cached[0] is not results:
+            cached = (results, compute(results))
+            self._results_cache[(kind, date)] = cached
+        return cached[1]
+
+    @staticmethod
+    def _aggregate_risks(results) -> dict:
+        summary = {}
+        for risk in results.risk_measures:
+            try:
+                value = results[risk].aggregate(True, True)
+            except TypeError:
+                value = ErrorValue(None, error='Could not aggregate risk results')
+            summary[risk] = value
+        return summary
+
     def get_risk_summary_df(self, zero_on_empty_dates=False):
-        if self._risk_summary_dict is not None:
-            summary_dict = self._risk_summary_dict
-        else:
-            if not self._results:
-                return pd.DataFrame(columns=self.risks)
-            dates_with_results = list(filter(lambda x: len(x[1]), self._results.items()))
-            summary_dict = defaultdict(dict)
-            for date, results in dates_with_results:
-                for risk in results.risk_measures:
-                    try:
-                        value = results[risk].aggregate(True, True)
-                    except TypeError:
-                        value = ErrorValue(None, error='Could not aggregate risk results')
-                    summary_dict[date][risk] = value
-            self._risk_summary_dict = summary_dict
+        if not self._results:
+            return pd.DataFrame(columns=self.risks)
+
+        # only dates whose results have been added or replaced since the last call are aggregated again
+        summary_dict = defaultdict(dict)
+        for date, results in self._results.items():
+            if len(results):
+                summary_dict[date] = self._cached_by_date('risk_summary', date, results, self._aggregate_risks)
         zero_risk_sd_copy = summary_dict.copy()
         if zero_on_empty_dates:
             for cash_only_date in set(self._cash_dict.keys()).difference(zero_risk_sd_copy.keys()):
-                for risk in self.risks:
-                    zero_risk_sd_copy[cash_only_date][risk] = 0
+                zero_risk_sd_copy[cash_only_date] = {risk: 0 for risk in self.risks}
         result = pd.DataFrame(zero_risk_sd_copy).T.sort_index()
         return result
 
@@ -267,7 +293,7 @@ class BackTest(BaseBacktest):
         # with the entry and exit are used in the open value and close value and PnL calc.  If the PnL is None it
         # means the instrument is still live and therefore will show up in the PV
         ledger = {}
-        names = []
+        names = set()
         for date in sorted(self.cash_payments.keys()):
             cash_list = self.cash_payments[date]
             for cash in cash_list:
@@ -289,7 +315,7 @@ class BackTest(BaseBacktest):
                         ledger[cash.trade.name]['Trade PnL'] = ledger[cash.trade.name]['Close Value'] + open_value
                         ledger[cash.trade.name]['Status'] = 'closed'
                 else:
-                    names.append(cash.trade.name)
+                    names.add(cash.trade.name)
                     ledger[cash.trade.name] = {
                         'Open': date,
                         'Close': None,
@@ -313,10 +339,13 @@ class BackTest(BaseBacktest):
         cp_table = cp_table.set_index(['Pricing Date', 'Instrument Name']).sort_index()
         cp_table.columns = pd.MultiIndex.from_product([['Cash Payments'], cp_table.columns])
 
+        def risk_measure_frame(date):
+            return lambda risk_res: risk_res.to_frame(
+                values='value', index='instrument_name', columns='risk_measure'
+            ).assign(pricing_date=[date] * len(risk_res))
+
         risk_measure_dict = {
-            date: risk_res.to_frame(values='value', index='instrument_name', columns='risk_measure').assign(
-                pricing_date=[date] * len(risk_res)
-            )
+            date: self._cached_by_date('risk_measures', date, risk_res, risk_measure_frame(date))
             for date, risk_res in self.results.items()
         }
         risk_measure_table = pd.concat(risk_measure_dict.values())
@@ -331,7 +360,12 @@ class BackTest(BaseBacktest):
 
         risk_and_cp_joined = risk_measure_table.join(cp_table, how='outer')
 
-        static_inst_info = pd.concat([info.portfolio.to_frame() for info in self.results.values()])
+        static_inst_info = pd.concat(
+            [
+                self._cached_by_date('static_info', date, info, lambda res: res.portfolio.to_frame())
+                for date, info in self.results.items()
+            ]
+        )
         static_inst_info = static_inst_info.rename(columns={'name': 'Instrument Name'})
         static_inst_info = static_inst_info.set_index(['Instrument Name'])
         static_inst_info = static_inst_info[~static_inst_info.index.duplicated(keep='first')]
@@ -784,16 +818,35 @@ class PredefinedAssetBacktest(BaseBacktest):
     initial_value: float
 
     def __post_init__(self):
-        self.performance = pd.Series(dtype=float)
+        # daily values are collected in dicts, as enlarging a series on each valuation copies it
+        self._performance = {}
         self.cash_asset = Cash('USD')
         self.holdings = defaultdict(float)
-        self.historical_holdings = pd.Series(dtype=float)
-        self.historical_weights = pd.Series(dtype=float)
+        self._historical_holdings = {}
+        self._historical_weights = {}
         self.orders = []
         self.results = {}
 
+    @staticmethod
+    def _daily_series(values: dict, dtype=None) -> pd.Series:
+        if not values:
+            return pd.Series(dtype=float)
+        return pd.Series(list(values.values()), index=list(values.keys()), dtype=dtype)
+
+    @property
+    def performance(self) -> pd.Series:
+        return self._daily_series(self._performance, float)
+
+    @property
+    def historical_holdings(self) -> pd.Series:
+        return self._daily_series(self._historical_holdings, object)
+
+    @property
+    def historical_weights(self) -> pd.Series:
+        return self._daily_series(self._historical_weights, object)
+
     def set_start_date(self, start: dt.date):
-        self.performance[start] = self.initial_value
+        self._performance[start] = self.initial_value
         self.holdings[self.cash_asset] = self.initial_value
 
     def record_orders(self, orders: Iterable[OrderBase]):
@@ -865,11 +918,11 @@ class PredefinedAssetBacktest(BaseBacktest):
         epsilon = 1e-12
         date = state.date()
         mtm = 0
-        self.historical_holdings[date] = {}
-        self.historical_weights[date] = {}
+        holdings = self._historical_holdings[date] = {}
+        weights = self._historical_weights[date] = {}
         for instrument, units in self.holdings.items():
             if abs(units) > epsilon:
-                self.historical_holdings[date][instrument] = units
+                holdings[instrument] = units
 
                 if isinstance(instrument, Cash):
                     fixing = 1
@@ -884,16 +937,16 @@ class PredefinedAssetBacktest(BaseBacktest):
                         fixing = self.data_handler.get_data(state.date(), instrument, tag)
 
                 notional = fixing * units
-                self.historical_weights[date][instrument] = notional
+                weights[instrument] = notional
                 mtm += notional
 
-        self.performance[date] = mtm
+        self._performance[date] = mtm
 
-        for instrument, notional in self.historical_weights[date].items():
-            self.historical_weights[date][instrument] = notional / mtm
+        for instrument, notional in weights.items():
+            weights[instrument] = notional / mtm
 
     def get_level(self, date: dt.date) -> float:
-        return self.performance[date]
+        return self._performance[date]
 
     def get_costs(self) -> pd.Series(dtype=float):
         costs = defaultdict(float)
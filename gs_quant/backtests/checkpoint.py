@@ -0,0 +1,84 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import gzip
+import logging
+import os
+import pickle
+from typing import Any, Optional
+
+from gs_quant.base import structural_digest
+
+logger = logging.getLogger(__name__)
+
+
+class BacktestCheckpoint:
+    """
+    A file holding the state of a backtest part way through its dates, from which a run of the same backtest resumes
+
+    The state is pickled and compressed, and the file is replaced in one step, so a run which stops while saving leaves
+    the previous checkpoint intact. A checkpoint records a digest of the definition of the backtest which wrote it and
+    is only loaded by a run with the same definition.
+
+    Checkpoints are pickles, so should only be loaded from trusted locations.
+
+    :param path: location of the checkpoint file
+    :param definition: the values which define the backtest, such as its strategy, dates and risks
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, definition: Any):
+        self.__path = path
+        self.__fingerprint = structural_digest(definition)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def load(self) -> Optional[dict]:
+        """
+        The state saved by a run of the same backtest, or None if there is no checkpoint
+
+        :return: dict of the saved state
+        """
+        if not os.path.exists(self.__path):
+            return None
+        with gzip.open(self.__path, 'rb') as f:
+            saved = pickle.load(f)
+        if saved.get('version') != self.VERSION or saved.get('fingerprint') != self.__fingerprint:
+            raise ValueError(f'checkpoint {self.__path} was saved by a different backtest, remove it to start afresh')
+        return saved['state']
+
+    def save(self, **state):
+        """
+        Replace the checkpoint with the given state
+
+        :param state: the values needed to resume the backtest
+        """
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        os.makedirs(directory, exist_ok=True)
+        saved = {'version': self.VERSION, 'fingerprint': self.__fingerprint, 'state': state}
+        temp_path = f'{self.__path}.{os.getpid()}.tmp'
+        try:
+            with gzip.open(temp_path, 'wb', compresslevel=1) as f:
+                pickle.dump(saved, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.__path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.debug(f'Saved backtest checkpoint to {self.__path}')
@@ -22,30 +22,34 @@ from gs_quant.backtests.data_sources import DataManager
 class Clock(object):
     def __init__(self):
         self._time = None
+        self._wall_time = None
+        self._date = None
         self.reset()
 
+    def __set_time(self, time: dt.datetime):
+        # naive times are compared with the wall time of the clock, so it is found once for each update
+        self._time = time
+        self._wall_time = time if time.tzinfo is None else time.replace(tzinfo=None)
+        self._date = time.date()
+
     def update(self, time: dt.datetime):
-        compare_time = (
-            self._time.replace(tzinfo=None)
-            if time.tzinfo is None or time.tzinfo.utcoffset(time) is None
-            else self._time
-        )
+        compare_time = self._wall_time if time.tzinfo is None or time.tzinfo.utcoffset(time) is None else self._time
 
         if time < compare_time:
             raise RuntimeError(f'current time is {compare_time}, cannot run backwards to {time}')
-        self._time = time
+        self.__set_time(time)
 
     def reset(self):
-        self._time = dt.datetime(1900, 1, 1).replace(tzinfo=dt.timezone.utc)
+        self.__set_time(dt.datetime(1900, 1, 1).replace(tzinfo=dt.timezone.utc))
 
     def time_check(self, state: Union[dt.date, dt.datetime]):
         if isinstance(state, dt.datetime):
             if state.tzinfo is None or state.tzinfo.utcoffset(state) is None:  # timezone naive
-                lookahead = state > self._time.replace(tzinfo=None)
+                lookahead = state > self._wall_time
             else:
                 lookahead = state > self._time
         else:
-            lookahead = state > self._time.date()
+            lookahead = state > self._date
 
         if lookahead:
             raise RuntimeError(f'accessing data at {state} not allowed, current time is {self._time}')
@@ -57,6 +61,10 @@ class DataHandler(object):
         self._clock = Clock()
         self._tz = tz
 
+    @property
+    def data_mgr(self) -> DataManager:
+        return self._data_mgr
+
     def reset_clock(self):
         self._clock.reset()
 
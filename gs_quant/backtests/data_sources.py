@@ -20,7 +20,7 @@ import datetime as dt
 from enum import Enum
 import numpy as np
 import pandas as pd
-from typing import Union, Iterable, ClassVar, List
+from typing import Union, Iterable, ClassVar, List, Tuple
 
 from gs_quant.backtests.core import ValuationFixingType
 from gs_quant.base import field_metadata, static_field
@@ -35,6 +35,23 @@ class MissingDataStrategy(Enum):
     fail = 'fail'
 
 
+_EPOCH = dt.datetime(1970, 1, 1)
+
+
+def _nanos(time: Union[dt.date, dt.datetime, pd.Timestamp]) -> int:
+    """Nanoseconds since the epoch, treating dates as midnight and naive times as UTC"""
+    if isinstance(time, pd.Timestamp):
+        return (time if time.tzinfo is None else time.tz_convert('UTC').tz_localize(None)).value
+    if isinstance(time, dt.datetime):
+        if time.tzinfo is not None and time.utcoffset() is not None:
+            time = time.astimezone(dt.timezone.utc).replace(tzinfo=None)
+        delta = time - _EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+    if isinstance(time, dt.date):
+        return (time.toordinal() - _EPOCH.toordinal()) * 86400 * 1_000_000_000
+    return pd.Timestamp(time).value
+
+
 @dataclass_json
 @dataclass
 class DataSource:
@@ -117,45 +134,91 @@ class GenericDataSource(DataSource):
         return self.missing_data_strategy == other.missing_data_strategy and self.data_set.equals(other.data_set)
 
     def __post_init__(self):
-        self._tz_aware = isinstance(self.data_set.index[0], dt.datetime) and self.data_set.index[0].tzinfo is not None
+        self._indexed = None
+
+    def __index(self) -> Tuple[pd.Series, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The data set sorted by time, with its times as UTC nanoseconds and the positions of the last valid value at
+        or before, and the first valid value at or after, each point
+        """
+        if self._indexed is None or self._indexed[0] is not self.data_set:
+            data_set = self.data_set if self.data_set.index.is_monotonic_increasing else self.data_set.sort_index()
+            index = data_set.index
+            if isinstance(index, pd.DatetimeIndex):
+                index = index if index.tz is None else index.tz_convert('UTC').tz_localize(None)
+                times = index.values.astype('datetime64[ns]').view(np.int64)
+            else:
+                times = np.fromiter((_nanos(t) for t in index), dtype=np.int64, count=len(data_set))
+            try:
+                values = data_set.to_numpy(dtype=float)
+            except (TypeError, ValueError):
+                values = data_set.to_numpy()
+
+            positions = np.arange(len(values))
+            valid = ~pd.isna(values)
+            last_valid = np.maximum.accumulate(np.where(valid, positions, -1)) if len(values) else positions
+            first_valid = (
+                np.minimum.accumulate(np.where(valid, positions, len(values))[::-1])[::-1] if len(values) else positions
+            )
+            self._indexed = (self.data_set, data_set, times, values, last_valid, first_valid)
+
+        return self._indexed[1:]
+
+    def __missing_values(self, positions: np.ndarray, values: np.ndarray, last_valid, first_valid) -> np.ndarray:
+        # value for a time which falls before positions, as if it were inserted and the series filled
+        before = np.where(positions > 0, last_valid[np.maximum(positions - 1, 0)], -1)
+        has_before = before >= 0
+        filled = np.where(has_before, values[np.maximum(before, 0)], np.nan)
+        if self.missing_data_strategy == MissingDataStrategy.fill_forward:
+            return filled
+        elif self.missing_data_strategy == MissingDataStrategy.interpolate:
+            # pandas interpolates linearly in position, with the missing point one step after positions - 1
+            after = first_valid[np.minimum(positions, len(values) - 1)] if len(values) else positions
+            has_after = (positions < len(values)) & (after < len(values))
+            after = np.minimum(after, len(values) - 1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                weight = (positions - before) / (after + 1 - before)
+                interpolated = filled + (values[after] - filled) * weight
+            return np.where(has_before & has_after, interpolated, filled)
+        else:
+            raise RuntimeError(f'unrecognised missing data strategy: {str(self.missing_data_strategy)}')
 
     def get_data(self, state: Union[dt.date, dt.datetime, Iterable]):
         """
-        Get the value of the dataset at a time or date.  If a list of dates or times is provided return list of values
+        Get the value of the dataset at a time or date.  If a list of dates or times is provided return an array of
+        values
         :param state: a date, datetime or a list of dates or datetimes
-        :return: float value
+        :return: float value, or array of values
         """
 
         if state is None:
             return self.data_set
 
-        if isinstance(state, Iterable):
-            return [self.get_data(i) for i in state]
-
-        if self._tz_aware and (state.tzinfo is None or state.tzinfo.utcoffset(state) is None):
-            state = state.replace(tzinfo=dt.timezone.utc)
-        if pd.Timestamp(state) in self.data_set:
-            return self.data_set[pd.Timestamp(state)]
-        elif state in self.data_set or self.missing_data_strategy == MissingDataStrategy.fail:
-            return self.data_set[state]
-        else:
-            if isinstance(self.data_set.index, pd.DatetimeIndex):
-                self.data_set.at[pd.to_datetime(state)] = np.nan
-                self.data_set = self.data_set.sort_index()
-            else:
-                self.data_set.at[state] = np.nan
-            self.data_set.sort_index()
-            if self.missing_data_strategy == MissingDataStrategy.interpolate:
-                self.data_set = self.data_set.interpolate()
-            elif self.missing_data_strategy == MissingDataStrategy.fill_forward:
-                self.data_set = self.data_set.ffill()
-            else:
-                raise RuntimeError(f'unrecognised missing data strategy: {str(self.missing_data_strategy)}')
-            return (
-                self.data_set[pd.to_datetime(state)]
-                if isinstance(self.data_set.index, pd.DatetimeIndex)
-                else self.data_set[state]
-            )
+        data_set, times, values, last_valid, first_valid = self.__index()
+        if not isinstance(state, Iterable):
+            target = _nanos(state)
+            position = times.searchsorted(target)
+            if position < len(times) and times[position] == target:
+                return values[position]
+            elif self.missing_data_strategy == MissingDataStrategy.fail:
+                raise KeyError(state)
+            return self.__missing_values(np.array([position]), values, last_valid, first_valid)[0]
+
+        states = list(state)
+        targets = np.fromiter((_nanos(s) for s in states), dtype=np.int64, count=len(states))
+        positions = times.searchsorted(targets)
+        found = positions < len(times)
+        found[found] = times[positions[found]] == targets[found]
+        if found.all():
+            return values[positions]
+        elif self.missing_data_strategy == MissingDataStrategy.fail:
+            raise KeyError(states[int(np.argmin(found))])
+
+        return np.where(
+            found,
+            values[np.minimum(positions, len(values) - 1)] if len(values) else np.nan,
+            self.__missing_values(positions, values, last_valid, first_valid),
+        )
 
     def get_data_range(self, start: Union[dt.date, dt.datetime], end: Union[dt.date, dt.datetime, int]):
         """
@@ -166,9 +229,28 @@ class GenericDataSource(DataSource):
         :return: pd.Series
         """
 
+        data_set, times, _, _, _ = self.__index()
         if isinstance(end, int):
-            return self.data_set.loc[self.data_set.index < start].tail(end)
-        return self.data_set.loc[(start < self.data_set.index) & (self.data_set.index <= end)]
+            stop = np.searchsorted(times, _nanos(start), side='left')
+            return data_set.iloc[max(stop - end, 0) : stop] if end > 0 else data_set.iloc[:0]
+        first = np.searchsorted(times, _nanos(start), side='right')
+        return data_set.iloc[first : max(np.searchsorted(times, _nanos(end), side='right'), first)]
+
+    def get_data_windows(self, states: Iterable[Union[dt.date, dt.datetime]], size: int) -> np.ndarray:
+        """
+        get the values which get_data_range(state, size) returns for each of a list of dates or times.
+        :param states: a list of dates or datetimes
+        :param size: the number of data points back from each state
+        :return: 2d array with a row per state, padded at the start with nan where fewer data points are available
+        """
+
+        _, times, values, _, _ = self.__index()
+        states = list(states)
+        if size <= 0:
+            return np.empty((len(states), 0))
+        targets = np.fromiter((_nanos(s) for s in states), dtype=np.int64, count=len(states))
+        padded = np.concatenate((np.full(size, np.nan), values))
+        return np.lib.stride_tricks.sliding_window_view(padded, size)[times.searchsorted(targets, side='left')]
 
 
 @dataclass_json
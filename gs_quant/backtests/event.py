@@ -18,28 +18,38 @@ from gs_quant.backtests.order import OrderBase
 
 
 class Event(object):
-    pass
+    __slots__ = ()
+
+    type: str = None
 
 
 class MarketEvent(Event):
-    def __init__(self):
-        self.type = 'Market'
+    __slots__ = ()
+
+    type = 'Market'
 
 
 class ValuationEvent(Event):
-    def __init__(self):
-        self.type = 'Valuation'
+    __slots__ = ()
+
+    type = 'Valuation'
 
 
 class OrderEvent(Event):
+    __slots__ = ('order',)
+
+    type = 'Order'
+
     def __init__(self, order: OrderBase):
-        self.type = 'Order'
         self.order = order
 
 
 class FillEvent(Event):
+    __slots__ = ('order', 'filled_units', 'filled_price')
+
+    type = 'Fill'
+
     def __init__(self, order: OrderBase, filled_units: float, filled_price: float):
-        self.type = 'Fill'
         self.order = order
         self.filled_units = filled_units
         self.filled_price = filled_price
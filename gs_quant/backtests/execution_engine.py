@@ -14,7 +14,9 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import bisect
 import datetime as dt
+from typing import Optional
 
 from gs_quant.backtests.data_handler import DataHandler
 from gs_quant.backtests.event import OrderEvent, FillEvent
@@ -31,13 +33,19 @@ class SimulatedExecutionEngine(ExecutionEngine):
         self.orders = []
 
     def submit_order(self, order: OrderEvent):
-        self.orders.append(order)
-        self.orders.sort(key=lambda e: e.order.execution_end_time())
+        # orders are kept sorted by execution end time, after any already submitted with the same time
+        bisect.insort_right(self.orders, order, key=lambda e: e.order.execution_end_time())
+
+    def next_execution_time(self) -> Optional[dt.datetime]:
+        """
+        The earliest execution end time of the submitted orders, or None if no orders are pending
+        """
+        return self.orders[0].order.execution_end_time() if self.orders else None
 
     def ping(self, state: dt.datetime):
         fill_events = []
-        while self.orders:
-            order: OrderBase = self.orders[0].order
+        for event in self.orders:
+            order: OrderBase = event.order
             end_time = order.execution_end_time()
             if end_time > state:
                 break
@@ -48,5 +56,5 @@ class SimulatedExecutionEngine(ExecutionEngine):
                     filled_units=order.execution_quantity(),
                 )
                 fill_events.append(fill)
-                self.orders.pop(0)
+        del self.orders[: len(fill_events)]
         return fill_events
@@ -37,6 +37,7 @@ from gs_quant.backtests.actions import (
 from gs_quant.backtests.backtest_engine import BacktestBaseEngine
 from gs_quant.backtests.backtest_objects import BackTest, CashPayment, PnlDefinition
 from gs_quant.backtests.backtest_utils import make_list, CalcType, get_final_date, map_ccy_name_to_ccy
+from gs_quant.backtests.checkpoint import BacktestCheckpoint
 from gs_quant.backtests.generic_engine_action_impls import (
     AddTradeActionImpl,
     AddScaledTradeActionImpl,
@@ -47,6 +48,7 @@ from gs_quant.backtests.generic_engine_action_impls import (
     EarlyExitPositionLimitScaledActionImpl,
 )
 from gs_quant.backtests.strategy import Strategy
+from gs_quant.backtests.triggers import TriggerInfo
 from gs_quant.common import Currency, ParameterisedRiskMeasure, RiskMeasure
 from gs_quant.context_base import nullcontext
 from gs_quant.datetime.relative_date import RelativeDateSchedule
@@ -67,6 +69,93 @@ def raiser(ex):
 logger = logging.getLogger(__name__)
 
 
+class _RiskPlan:
+    """
+    The risk calculations needed by a backtest, collected before any is requested so that they are sent together in
+    one pricing context, each instrument once per date, leaving out those whose results the backtest already has
+
+    Instruments with the same dates and risks are grouped into the same risk requests by the pricing context, so the
+    requests are as few and as large as the plan allows.
+    """
+
+    def __init__(self, backtest: BackTest, risks):
+        self.__backtest = backtest
+        self.__risks = tuple(risks)
+        self.__by_date = {}  # date -> (portfolio as given, if only one, instruments to calculate by name)
+        self.__historical = {}  # (dates, instruments) -> (portfolio, scaling portfolios which share its results)
+        self.__needed = 0
+        self.__requested = 0
+
+    def add(self, date: dt.date, portfolio: Portfolio):
+        """
+        Calculate the risks of the instruments of a portfolio on a date, other than those already calculated
+        """
+        existing = self.__backtest.results.get(date)
+        priced = existing.portfolio if isinstance(existing, PortfolioRiskResult) else ()
+        if date in self.__by_date:
+            # the results of several portfolios on one date cannot keep the structure of any one of them
+            _, planned = self.__by_date[date]
+            self.__by_date[date] = (None, planned)
+        else:
+            planned = {}
+            self.__by_date[date] = (portfolio, planned)
+        for instrument in portfolio:
+            self.__needed += len(self.__risks)
+            if instrument.name not in priced and instrument.name not in planned:
+                planned[instrument.name] = instrument
+                self.__requested += len(self.__risks)
+
+    def add_historical(self, scaling_portfolio, portfolio: Portfolio):
+        """
+        Calculate the risks of a portfolio on each of the dates of a scaling portfolio, setting its results. Scaling
+        portfolios of the same instruments and dates share one calculation
+        """
+        dates = tuple(scaling_portfolio.dates)
+        instruments = tuple(portfolio.all_instruments)
+        count = len(self.__risks) * len(dates) * len(instruments)
+        self.__needed += count
+        key = (dates, instruments)
+        if key in self.__historical:
+            self.__historical[key][1].append(scaling_portfolio)
+        else:
+            self.__historical[key] = (portfolio, [scaling_portfolio])
+            self.__requested += count
+
+    def calculate(self):
+        """
+        Request the planned calculations, adding their results to the backtest, and count them
+        """
+        backtest = self.__backtest
+        results_by_date = {}
+        historical_results = []
+        if any(planned for _, planned in self.__by_date.values()) or self.__historical:
+            backtest.calc_calls += 1
+            with PricingContext():
+                for date, (portfolio, planned) in self.__by_date.items():
+                    if planned:
+                        with PricingContext(pricing_date=date):
+                            # the portfolio itself, when none of it is left out, keeps its structure in the results
+                            whole = portfolio is not None and planned.keys() == {i.name for i in portfolio}
+                            port = portfolio if whole else Portfolio(list(planned.values()))
+                            results_by_date[date] = port.calc(self.__risks)
+                for (dates, _), (portfolio, scaling_portfolios) in self.__historical.items():
+                    with HistoricalPricingContext(dates=dates):
+                        historical_results.append((portfolio.calc(self.__risks), scaling_portfolios))
+
+        for date, results in results_by_date.items():
+            backtest.add_results(date, results)
+        for results, scaling_portfolios in historical_results:
+            for scaling_portfolio in scaling_portfolios:
+                scaling_portfolio.results = results
+
+        saved = self.__needed - self.__requested
+        backtest.calculations += self.__requested
+        backtest.calculations_saved += saved
+        if saved:
+            logger.debug(f'Requested {self.__requested} risk calculations, {saved} already calculated or duplicated')
+        self.__by_date, self.__historical, self.__needed, self.__requested = {}, {}, 0, 0
+
+
 class GenericEngineActionFactory(ActionHandlerBaseFactory):
     def __init__(self, action_impl_map=None):
         self.action_impl_map = {
@@ -152,6 +241,8 @@ class GenericEngine(BacktestBaseEngine):
         is_batch: bool = True,
         calc_risk_at_trade_exits: bool = False,
         pnl_explain: Optional[PnlDefinition] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_frequency: int = 100,
     ):
         """
         run the backtest following the triggers and actions defined in the strategy.  If states are entered run on
@@ -174,9 +265,14 @@ class GenericEngine(BacktestBaseEngine):
         :param calc_risk_at_trade_exits: separate results for requested risk measures on tradable exit dates;
                                          not to be included in main results but useful for PnL decomposition
         :param pnl_explain: a Pnl Definition object which defines the risk attribution and mkt data for a pnl explain
+        :param checkpoint_path: file in which to save the state of the backtest as its dates are processed. A run with
+                                the same strategy and arguments resumes from the last date saved in the file
+        :param checkpoint_frequency: number of dates processed between checkpoints
         :return: a backtest object containing the portfolios on each day and results which show all risks on all days
 
         """
+        if checkpoint_frequency < 1:
+            raise ValueError('checkpoint_frequency must be at least 1')
 
         logger.info(f'Starting Backtest: Building Date Schedule - {dt.datetime.now()}')
         self._tracing_enabled = Tracer.active_span() is not None and Tracer.active_span().is_recording()
@@ -201,6 +297,8 @@ class GenericEngine(BacktestBaseEngine):
                 holiday_calendar,
                 calc_risk_at_trade_exits,
                 pnl_explain,
+                checkpoint_path,
+                checkpoint_frequency,
             )
 
     def _trace(self, label: str):
@@ -222,6 +320,8 @@ class GenericEngine(BacktestBaseEngine):
         holiday_calendar,
         calc_risk_at_trade_exits,
         pnl_explain,
+        checkpoint_path=None,
+        checkpoint_frequency=100,
     ):
         """
         Run the backtest strategy using the ambient pricing context
@@ -269,50 +369,77 @@ class GenericEngine(BacktestBaseEngine):
         else:
             price_risk = self.price_measure
 
-        backtest = BackTest(strategy, strategy_pricing_dates, risks, price_risk, holiday_calendar, pnl_explain)
-
-        logger.info('Resolving initial portfolio')
-        with self._trace('Resolve initial portfolio'):
-            self._resolve_initial_portfolio(
-                strategy.initial_portfolio, backtest, strategy_start_date, strategy_pricing_dates, holiday_calendar
+        checkpoint = None
+        if checkpoint_path is not None:
+            # the strategy is part of the definition before any of its triggers has been evaluated
+            pricing_params = {k: self._pricing_context_params[k] for k in ('csa_term', 'market_data_location')}
+            definition = (strategy, strategy_pricing_dates, risks, price_risk, initial_value, holiday_calendar)
+            definition += (calc_risk_at_trade_exits, pnl_explain, pricing_params)
+            checkpoint = BacktestCheckpoint(checkpoint_path, definition)
+
+        saved = checkpoint.load() if checkpoint is not None else None
+        if saved is not None:
+            # the strategy is restored along with the backtest, as its triggers may hold state from the dates processed
+            strategy, backtest, schedules, processed = (
+                saved['strategy'],
+                saved['backtest'],
+                saved['schedules'],
+                saved['processed'],
             )
+            logger.info(f'Resuming backtest after {processed} of {len(strategy_pricing_dates)} dates from checkpoint')
+        else:
+            processed = 0
+            backtest = BackTest(strategy, strategy_pricing_dates, risks, price_risk, holiday_calendar, pnl_explain)
 
-        logger.info('Building simple and semi-deterministic triggers and actions')
-        self._build_simple_and_semi_triggers_and_actions(strategy, backtest, strategy_pricing_dates)
-
-        logger.info(f'Filtering strategy calculations to run from {strategy_start_date} to {strategy_end_date}')
-        backtest.portfolio_dict = defaultdict(
-            Portfolio,
-            {
-                k: backtest.portfolio_dict[k]
-                for k in backtest.portfolio_dict
-                if strategy_start_date <= k <= strategy_end_date
-            },
-        )
-        backtest.hedges = defaultdict(
-            list, {k: backtest.hedges[k] for k in backtest.hedges if strategy_start_date <= k <= strategy_end_date}
-        )
-        backtest.weighted_trades = defaultdict(
-            list,
-            {
-                k: backtest.weighted_trades[k]
-                for k in backtest.weighted_trades
-                if strategy_start_date <= k <= strategy_end_date
-            },
-        )
+            logger.info('Resolving initial portfolio')
+            with self._trace('Resolve initial portfolio'):
+                self._resolve_initial_portfolio(
+                    strategy.initial_portfolio, backtest, strategy_start_date, strategy_pricing_dates, holiday_calendar
+                )
+
+            logger.info('Building simple and semi-deterministic triggers and actions')
+            schedules = self._build_simple_and_semi_triggers_and_actions(strategy, backtest, strategy_pricing_dates)
+
+            logger.info(f'Filtering strategy calculations to run from {strategy_start_date} to {strategy_end_date}')
+            backtest.portfolio_dict = defaultdict(
+                Portfolio,
+                {
+                    k: backtest.portfolio_dict[k]
+                    for k in backtest.portfolio_dict
+                    if strategy_start_date <= k <= strategy_end_date
+                },
+            )
+            backtest.hedges = defaultdict(
+                list, {k: backtest.hedges[k] for k in backtest.hedges if strategy_start_date <= k <= strategy_end_date}
+            )
+            backtest.weighted_trades = defaultdict(
+                list,
+                {
+                    k: backtest.weighted_trades[k]
+                    for k in backtest.weighted_trades
+                    if strategy_start_date <= k <= strategy_end_date
+                },
+            )
 
-        logger.info('Pricing simple and semi-deterministic triggers and actions')
-        with self._trace('Pricing semi-det Triggers'):
-            self._price_semi_det_triggers(backtest, risks)
+            logger.info('Pricing simple and semi-deterministic triggers and actions')
+            with self._trace('Pricing semi-det Triggers'):
+                self._price_semi_det_triggers(backtest, risks)
+            if checkpoint is not None:
+                checkpoint.save(strategy=strategy, backtest=backtest, schedules=schedules, processed=processed)
 
         logger.info('Scaling semi-determ triggers and actions and calculating path dependent triggers and actions')
         with self._trace('Process dates') as scope:
             if scope:
                 scope.span.set_tag('dates.length', len(strategy_pricing_dates))
-            for d in strategy_pricing_dates:
+            for d in strategy_pricing_dates[processed:]:
                 if scope:
                     scope.span.log_kv({'date': str(d)})
-                self._process_triggers_and_actions_for_date(d, strategy, backtest, risks)
+                self._process_triggers_and_actions_for_date(d, strategy, backtest, risks, schedules)
+                processed += 1
+                if checkpoint is not None and (
+                    processed % checkpoint_frequency == 0 or processed == len(strategy_pricing_dates)
+                ):
+                    checkpoint.save(strategy=strategy, backtest=backtest, schedules=schedules, processed=processed)
 
         with self._trace('Calc New Trades'):
             self._calc_new_trades(backtest, risks)
@@ -372,19 +499,25 @@ class GenericEngine(BacktestBaseEngine):
                     ):
                         backtest.portfolio_dict[d].append(init_port.instruments)
 
-    def _build_simple_and_semi_triggers_and_actions(self, strategy, backtest, strategy_pricing_dates):
-        for trigger in strategy.triggers:
+    def _build_simple_and_semi_triggers_and_actions(self, strategy, backtest, strategy_pricing_dates) -> list:
+        """
+        Apply the actions of triggers which are not path dependent
+        :return: for each trigger, its schedule of triggered date to TriggerInfo where this does not depend on the
+                 state of the backtest, otherwise None
+        """
+        schedules = [None] * len(strategy.triggers)
+        for i, trigger in enumerate(strategy.triggers):
             if trigger.calc_type != CalcType.path_dependent:
-                triggered_dates = []
                 trigger_infos = defaultdict(list)
                 with self._trace('Build semi-det trigger') as scope:
-                    for d in strategy_pricing_dates:
-                        t_info = trigger.has_triggered(d, backtest)
-                        if t_info:
-                            triggered_dates.append(d)
-                            if t_info.info_dict:
-                                for k, v in t_info.info_dict.items():
-                                    trigger_infos[k].append(v)
+                    schedule = trigger.schedule(strategy_pricing_dates, backtest)
+                    if not trigger.depends_on_backtest:
+                        schedules[i] = schedule
+                    triggered_dates = list(schedule)
+                    for t_info in schedule.values():
+                        if t_info.info_dict:
+                            for k, v in t_info.info_dict.items():
+                                trigger_infos[k].append(v)
                     if scope:
                         scope.span.set_tag('trigger.type', type(trigger).__name__)
                         scope.span.set_tag('dates.triggered', len(triggered_dates))
@@ -404,62 +537,42 @@ class GenericEngine(BacktestBaseEngine):
                                             trigger_info = action_trigger_info
                                             break
                                 self.get_action_handler(action).apply_action(triggered_dates, backtest, trigger_info)
+        return schedules
 
     @staticmethod
     def _price_semi_det_triggers(backtest, risks):
-        with PricingContext():
-            backtest.calc_calls += 1
-            for day, portfolio in backtest.portfolio_dict.items():
-                if isinstance(day, dt.date):
-                    with PricingContext(day):
-                        backtest.calculations += len(portfolio) * len(risks)
-                        backtest.add_results(day, portfolio.calc(tuple(risks)))
-
-            # semi path dependent initial calc for hedges
-            for _, hedge_list in backtest.hedges.items():
-                scaling_list = [h.scaling_portfolio for h in hedge_list]
-                for p in scaling_list:
-                    with HistoricalPricingContext(dates=p.dates):
-                        backtest.calculations += len(risks) * len(p.dates)
-                        port = p.trade if isinstance(p.trade, Portfolio) else Portfolio([p.trade])
-                        p.results = port.calc(tuple(risks))
-
-            # semi path dependent initial calc for weighted trades
-            for _, weighted_trade_list in backtest.weighted_trades.items():
-                for wt in weighted_trade_list:
-                    sp = wt.scaling_portfolio
-                    with HistoricalPricingContext(dates=sp.dates):
-                        backtest.calculations += len(risks) * len(sp.dates) * len(sp.trades)
-                        sp.results = sp.trades.calc(tuple(risks))
+        # everything known before the dates are processed is planned and requested together
+        plan = _RiskPlan(backtest, risks)
+        for day, portfolio in backtest.portfolio_dict.items():
+            if isinstance(day, dt.date):
+                plan.add(day, portfolio)
+
+        # semi path dependent initial calc for hedges
+        for _, hedge_list in backtest.hedges.items():
+            for p in [h.scaling_portfolio for h in hedge_list]:
+                plan.add_historical(p, p.trade if isinstance(p.trade, Portfolio) else Portfolio([p.trade]))
+
+        # semi path dependent initial calc for weighted trades
+        for _, weighted_trade_list in backtest.weighted_trades.items():
+            for wt in weighted_trade_list:
+                plan.add_historical(wt.scaling_portfolio, wt.scaling_portfolio.trades)
+        plan.calculate()
 
     @staticmethod
     def __ensure_risk_results(dates, backtest: BackTest, risks):
-        port_by_date = {}
+        plan = _RiskPlan(backtest, risks)
         for d in dates:
-            port = []
-            for t in backtest.portfolio_dict[d]:
-                if not backtest.results[d] or t.name not in backtest.results[d].portfolio:
-                    port.append(t)
-            if len(port):
-                port_by_date[d] = port
-
-        if len(port_by_date):
-            results_by_date = {}
-            with PricingContext():
-                for d, port in port_by_date.items():
-                    with PricingContext(pricing_date=d):
-                        results_by_date[d] = Portfolio(port).calc(tuple(risks))
+            plan.add(d, backtest.portfolio_dict[d])
+        plan.calculate()
 
-            for d, results in results_by_date.items():
-                backtest.add_results(d, results)
-
-    def _process_triggers_and_actions_for_date(self, d, strategy, backtest: BackTest, risks):
+    def _process_triggers_and_actions_for_date(self, d, strategy, backtest: BackTest, risks, schedules=None):
         logger.debug(f'{d}: Processing triggers and actions')
 
         # need to ensure risk results for the day are available prior to the path-dependent action/trigger being applied
         # note that __ensure_risk_results sends a risk calculation for the day, so it should only happen when required
         trigger_infos = defaultdict(list)
-        for trigger in strategy.triggers:
+        for i, trigger in enumerate(strategy.triggers):
+            schedule = schedules[i] if schedules else None
             if trigger.calc_type == CalcType.path_dependent:
                 t_info = trigger.has_triggered(d, backtest)
                 if t_info:
@@ -473,7 +586,10 @@ class GenericEngine(BacktestBaseEngine):
             else:
                 for action in trigger.actions:
                     if action.calc_type == CalcType.path_dependent:
-                        t_info = trigger.has_triggered(d, backtest)
+                        if schedule is not None:
+                            t_info = schedule.get(d, TriggerInfo(False))
+                        else:
+                            t_info = trigger.has_triggered(d, backtest)
                         if t_info:
                             trigger_info = t_info.info_dict.get(type(action), None) if t_info.info_dict else None
                             self.__ensure_risk_results([d], backtest, risks)
@@ -481,13 +597,12 @@ class GenericEngine(BacktestBaseEngine):
         # explicit check needed because backtest.hedges is a defaultdict that gets populated on access below
         if d not in backtest.hedges and d not in backtest.weighted_trades:
             return
+        plan = _RiskPlan(backtest, risks)
         for hedge in backtest.hedges[d]:
             sp = hedge.scaling_portfolio
             if sp.results is None:
-                with HistoricalPricingContext(dates=sp.dates):
-                    backtest.calculations += len(risks) * len(sp.dates)
-                    port_sp = sp.trade if isinstance(sp.trade, Portfolio) else Portfolio([sp.trade])
-                    sp.results = port_sp.calc(tuple(risks))
+                plan.add_historical(sp, sp.trade if isinstance(sp.trade, Portfolio) else Portfolio([sp.trade]))
+        plan.calculate()
 
         # semi path dependent scaling for hedges; only apply if there are any hedges to scale
         if backtest.hedges[d]:
@@ -545,12 +660,14 @@ class GenericEngine(BacktestBaseEngine):
 
         # semi path dependent scaling for weighted trades
         if d in backtest.weighted_trades and backtest.weighted_trades[d]:
+            plan = _RiskPlan(backtest, risks)
+            for weighted_trade in backtest.weighted_trades[d]:
+                if weighted_trade.scaling_portfolio.results is None:
+                    plan.add_historical(weighted_trade.scaling_portfolio, weighted_trade.scaling_portfolio.trades)
+            plan.calculate()
+
             for weighted_trade in backtest.weighted_trades[d]:
                 sp = weighted_trade.scaling_portfolio
-                if sp.results is None:
-                    with HistoricalPricingContext(dates=sp.dates):
-                        backtest.calculations += len(risks) * len(sp.dates) * len(sp.trades)
-                        sp.results = sp.trades.calc(tuple(risks))
 
                 # Get risk for each instrument on the entry date
                 instrument_risks = {}
@@ -14,11 +14,11 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import bisect
 import datetime as dt
-from collections import deque
 from functools import reduce
 from itertools import compress
-from typing import Union, Tuple
+from typing import Callable, Optional, Union, Tuple
 
 import pandas as pd
 from pandas.tseries.offsets import BDay  # noqa
@@ -32,9 +32,10 @@ from gs_quant.backtests.backtest_objects import PredefinedAssetBacktest
 from gs_quant.backtests.core import ValuationMethod
 from gs_quant.backtests.data_handler import DataHandler
 from gs_quant.backtests.data_sources import DataManager
-from gs_quant.backtests.event import ValuationEvent, OrderEvent, MarketEvent
+from gs_quant.backtests.event import OrderEvent
 from gs_quant.backtests.execution_engine import SimulatedExecutionEngine
 from gs_quant.backtests.order import OrderAtMarket
+from gs_quant.backtests.triggers import OrdersGeneratorTrigger
 from gs_quant.datetime import is_business_day, prev_business_date, business_day_offset
 
 
@@ -216,42 +217,92 @@ class PredefinedAssetEngine(BacktestBaseEngine):
         self._run(strategy, timer, backtest)
         return backtest
 
+    @staticmethod
+    def _evaluation(trigger, schedule: Optional[dict], timer, backtest) -> Tuple[Optional[set], Callable]:
+        """
+        The states of the timer at which a trigger may fire, or None if it must be evaluated at every state, and the
+        function which evaluates it at one of those states
+        """
+        if schedule is not None:
+            return set(schedule), schedule.__getitem__
+        if (
+            isinstance(trigger, OrdersGeneratorTrigger)
+            and type(trigger).has_triggered is OrdersGeneratorTrigger.has_triggered
+        ):
+            # orders are only generated at the trigger times
+            trigger_times = set(trigger.get_trigger_times())
+            evaluated = {state for state in timer if state.time() in trigger_times}
+            return evaluated, lambda state: trigger.orders_at_trigger_time(state, backtest)
+        return None, lambda state: trigger.has_triggered(state, backtest)
+
     def _run(self, strategy, timer, backtest: PredefinedAssetBacktest):
-        events = deque()
-
-        for state in tqdm(timer):
-            # update to latest data
-            self.data_handler.update(state)
-
-            # see if any submitted orders have been executed
-            fills = self.execution_engine.ping(state)
-            events.extend(fills)
-
-            # generate a market event
-            events.append(MarketEvent())
-
-            # create valuation event when it's due for daily valuation
-            if state.time() == self._eod_valuation_time():
-                events.append(ValuationEvent())
-
-            while events:
-                event = events.popleft()
-
-                if event.type == 'Market':  # market event (new mkt data coming in)
-                    for trigger in strategy.triggers:
-                        trigger_info = trigger.has_triggered(state, backtest)
-                        if trigger_info.triggered:
-                            for action in trigger.actions:
-                                info_dict = trigger_info.info_dict
-                                info = info_dict[type(action)] if info_dict and type(action) in info_dict else None
-                                orders = self.get_action_handler(action).apply_action(state, backtest, info)
-                                backtest.record_orders(orders)
-                                events.extend([OrderEvent(o) for o in orders])
-                elif event.type == 'Order':  # order event (submit the order to execution engine)
-                    self.execution_engine.submit_order(event)
-                elif event.type == 'Fill':  # fill event (update backtest with the fill results)
-                    backtest.update_fill(event)
-                elif event.type == 'Valuation':  # valuation event (calculate daily level)
+        eod_valuation_time = self._eod_valuation_time()
+        execution_engine = self.execution_engine
+
+        # triggers which do not depend on the state of the backtest are evaluated over the whole timer up front
+        schedules = [
+            None if getattr(trigger, 'depends_on_backtest', True) else trigger.schedule(timer, backtest)
+            for trigger in strategy.triggers
+        ]
+        triggers = [
+            (
+                *self._evaluation(trigger, schedule, timer, backtest),
+                [(action, self.get_action_handler(action)) for action in trigger.actions],
+            )
+            for trigger, schedule in zip(strategy.triggers, schedules)
+        ]
+
+        # states at which no trigger can fire, no valuation is due and no order completes are skipped
+        if any(evaluated is None for evaluated, _, _ in triggers):
+            active = range(len(timer))
+        else:
+            evaluated = set().union(*(evaluated for evaluated, _, _ in triggers))
+            active = [i for i, state in enumerate(timer) if state in evaluated or state.time() == eod_valuation_time]
+
+        with tqdm(total=len(timer)) as progress:
+            position, next_active = -1, 0
+            while True:
+                next_position = active[next_active] if next_active < len(active) else len(timer)
+                next_execution_time = execution_engine.next_execution_time()
+                if next_execution_time is not None:
+                    next_position = min(next_position, bisect.bisect_left(timer, next_execution_time, position + 1))
+                if next_position >= len(timer):
+                    break
+                if next_active < len(active) and active[next_active] == next_position:
+                    next_active += 1
+                position = next_position
+                state = timer[position]
+
+                # update to latest data
+                self.data_handler.update(state)
+
+                # see if any submitted orders have been executed, and update the backtest with the fills
+                for fill in execution_engine.ping(state):
+                    backtest.update_fill(fill)
+
+                # new market data: orders from the triggers which fire
+                orders = []
+                for evaluated, evaluate, handlers in triggers:
+                    if evaluated is not None and state not in evaluated:
+                        continue
+                    trigger_info = evaluate(state)
+                    if trigger_info.triggered:
+                        info_dict = trigger_info.info_dict
+                        for action, handler in handlers:
+                            info = info_dict[type(action)] if info_dict and type(action) in info_dict else None
+                            action_orders = handler.apply_action(state, backtest, info)
+                            backtest.record_orders(action_orders)
+                            orders.extend(action_orders)
+
+                # daily valuation
+                if state.time() == eod_valuation_time:
                     backtest.mark_to_market(state, self.valuation_method)
 
+                # submit the new orders to the execution engine
+                for order in orders:
+                    execution_engine.submit_order(OrderEvent(order))
+
+                progress.update(position + 1 - progress.n)
+            progress.update(len(timer) - progress.n)
+
         return backtest
@@ -0,0 +1,245 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import copy
+import dataclasses
+import inspect
+import itertools
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from gs_quant.backtests.backtest_engine import BacktestBaseEngine
+from gs_quant.backtests.backtest_objects import BackTest
+from gs_quant.backtests.data_handler import DataHandler
+from gs_quant.backtests.strategy import Strategy
+from gs_quant.context_base import nullcontext
+from gs_quant.markets import PricingContext
+from gs_quant.session import GsSession
+from gs_quant.tracing import Tracer
+
+logger = logging.getLogger(__name__)
+
+
+def _replaced(obj, path: Tuple[str, ...], value):
+    # dataclasses are rebuilt rather than modified, so anything derived from their fields is derived afresh
+    if not path:
+        return value
+    part, rest = path[0], path[1:]
+    if isinstance(obj, (list, tuple)):
+        items = list(obj)
+        items[int(part)] = _replaced(items[int(part)], rest, value)
+        return type(obj)(items)
+    if dataclasses.is_dataclass(obj) and part in {f.name for f in dataclasses.fields(obj) if f.init}:
+        return dataclasses.replace(obj, **{part: _replaced(getattr(obj, part), rest, value)})
+    raise ValueError(f'cannot set {part} on {type(obj).__name__}')
+
+
+def _engine_for_run(engine: BacktestBaseEngine) -> BacktestBaseEngine:
+    # engines keep the state of a run on themselves, but their market data is read only so is shared between runs
+    data_handler = getattr(engine, 'data_handler', None)
+    memo = {id(data_handler.data_mgr): data_handler.data_mgr} if isinstance(data_handler, DataHandler) else {}
+    return copy.deepcopy(engine, memo)
+
+
+def _summary_stats(backtest, annualisation_factor: int) -> pd.Series:
+    if isinstance(backtest, BackTest):
+        return backtest.summary_stats(annualisation_factor)
+
+    levels = backtest.performance.sort_index().astype(float)
+    if levels.empty:
+        return pd.Series(dtype=float)
+    daily_pnl = levels.diff().dropna()
+    return pd.Series(
+        {
+            'Start Date': levels.index[0],
+            'End Date': levels.index[-1],
+            'Final Level': levels.iloc[-1],
+            'Total PnL': levels.iloc[-1] - levels.iloc[0],
+            'Annualised Volatility': daily_pnl.std() * np.sqrt(annualisation_factor),
+            'Max Drawdown': (levels - levels.cummax()).min(),
+            'Total Orders': len(backtest.orders),
+        }
+    )
+
+
+def _run_point(
+    engine: BacktestBaseEngine,
+    strategy: Strategy,
+    run_kwargs: dict,
+    annualisation_factor: int,
+    return_backtest: bool,
+    session: Optional[GsSession] = None,
+    span=None,
+):
+    with Tracer.activate_span(span), session or nullcontext():
+        # runs share results through the pricing cache, in which identical instruments find each other's results
+        with PricingContext(use_cache=True, set_parameters_only=True):
+            backtest = _engine_for_run(engine).run_backtest(copy.deepcopy(strategy), **run_kwargs)
+    return _summary_stats(backtest, annualisation_factor), backtest if return_backtest else None
+
+
+class BacktestSweep:
+    """
+    Run a backtest of a strategy for each point of a grid of parameters
+
+    Each grid parameter is either an argument of the engine's run_backtest, such as start, end or states, or a path to
+    a field of the strategy, with attribute names and positions separated by dots e.g.
+    'triggers.0.trigger_requirements.trigger_level'. Strategy fields are set by rebuilding each dataclass on the path.
+
+    Runs are independent: each has its own copy of the engine and strategy. They share the PricingCache, so instrument
+    resolutions and risk results requested by one run are not requested again by another. The first point with each
+    distinct set of run_backtest arguments is run before the rest, so that the results the points have in common are
+    cached before the remaining runs start.
+
+    :param engine: the engine to run the backtests
+    :param strategy: the strategy to which the grid parameters are applied
+    :param grid: a mapping of parameter to values, swept over every combination, or an iterable of mappings of
+                 parameter to value, one for each point
+    :param run_kwargs: arguments for run_backtest which are the same for every point
+
+    **Examples**
+
+    >>> sweep = BacktestSweep(
+    >>>     GenericEngine(),
+    >>>     strategy,
+    >>>     {'triggers.0.trigger_requirements.trigger_level': (0.9, 1.0, 1.1), 'start': (dt.date(2023, 1, 3),)},
+    >>>     end=dt.date(2024, 1, 2),
+    >>>     frequency='1b',
+    >>> )
+    >>> stats = sweep.run(max_workers=4)
+    """
+
+    def __init__(
+        self,
+        engine: BacktestBaseEngine,
+        strategy: Strategy,
+        grid: Union[Mapping[str, Iterable[Any]], Iterable[Mapping[str, Any]]],
+        **run_kwargs,
+    ):
+        self.__engine = engine
+        self.__strategy = strategy
+        if isinstance(grid, Mapping):
+            names = tuple(grid)
+            self.__points = [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+        else:
+            self.__points = [dict(point) for point in grid]
+
+        run_arguments = set(inspect.signature(engine.run_backtest).parameters) - {'strategy'}
+        self.__runs = []
+        for point in self.__points:
+            strategy_params = {k: v for k, v in point.items() if k not in run_arguments}
+            run_params = {**run_kwargs, **{k: v for k, v in point.items() if k in run_arguments}}
+            self.__runs.append((self.__strategy_for(strategy_params), run_params))
+        self.__backtests = [None] * len(self.__points)
+
+    def __strategy_for(self, params: dict) -> Strategy:
+        strategy = self.__strategy
+        for path, value in params.items():
+            try:
+                strategy = _replaced(strategy, tuple(path.split('.')), value)
+            except (AttributeError, IndexError, TypeError, ValueError) as e:
+                raise ValueError(f'{path} is neither an argument of run_backtest nor a field of the strategy') from e
+        return strategy
+
+    @property
+    def points(self) -> List[dict]:
+        """The parameters of each point of the grid"""
+        return list(self.__points)
+
+    @property
+    def strategies(self) -> List[Strategy]:
+        """The strategy run for each point of the grid"""
+        return [strategy for strategy, _ in self.__runs]
+
+    @property
+    def backtests(self) -> list:
+        """The backtest for each point of the grid, once run, or None where it was not kept or failed"""
+        return list(self.__backtests)
+
+    def run(
+        self,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        keep_backtests: bool = True,
+        annualisation_factor: int = 252,
+    ) -> pd.DataFrame:
+        """
+        Run the backtest for every point of the grid
+
+        Runs which raise are logged and reported in an Error column rather than stopping the sweep.
+
+        :param max_workers: number of runs in parallel, when no executor is given
+        :param executor: executor for the runs, defaults to a thread pool. The runs of a ProcessPoolExecutor must be
+                         picklable, each process needs its own GsSession (e.g. from the executor's initializer) and the
+                         pricing cache is only shared between processes through a DiskPricingCacheBackend
+        :param keep_backtests: keep the backtest of each point, available from backtests
+        :param annualisation_factor: number of periods per year for the summary statistics
+        :return: dataframe with a row for each point, of its parameters and the summary statistics of its backtest
+        """
+        own_executor = executor is None
+        executor = ThreadPoolExecutor(max_workers=max_workers) if own_executor else executor
+        in_process = isinstance(executor, ThreadPoolExecutor)
+        session = GsSession.current if in_process and GsSession.current_is_set else None
+        span = Tracer.active_span() if in_process else None
+
+        # backtests run in this process are held until the sweep completes so their instruments stay in the cache
+        outcomes = [None] * len(self.__runs)
+        first_of_each, rest = {}, []
+        for i, (_, run_kwargs) in enumerate(self.__runs):
+            key = repr(sorted(run_kwargs.items(), key=lambda kv: kv[0]))
+            if key in first_of_each:
+                rest.append(i)
+            else:
+                first_of_each[key] = i
+
+        try:
+            for batch in (list(first_of_each.values()), rest):
+                futures = {
+                    i: executor.submit(
+                        _run_point,
+                        self.__engine,
+                        *self.__runs[i],
+                        annualisation_factor,
+                        keep_backtests or in_process,
+                        session,
+                        span,
+                    )
+                    for i in batch
+                }
+                for i, future in futures.items():
+                    try:
+                        outcomes[i] = future.result()
+                    except Exception as e:
+                        logger.error(f'Backtest failed for point {i} of the sweep: {e}')
+                        outcomes[i] = e
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+        rows = []
+        for i, (point, outcome) in enumerate(zip(self.__points, outcomes)):
+            if isinstance(outcome, Exception):
+                rows.append({**point, 'Error': str(outcome)})
+                self.__backtests[i] = None
+            else:
+                stats, backtest = outcome
+                rows.append({**point, **stats.to_dict()})
+                self.__backtests[i] = backtest if keep_backtests else None
+        return pd.DataFrame(rows)
@@ -15,10 +15,12 @@ under the License.
 """
 
 import datetime as dt
+import warnings
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar, List, Optional, Iterable, Union
+from typing import ClassVar, List, Optional, Iterable, Tuple, Union
 
+import numpy as np
 from dataclasses_json import dataclass_json, config
 
 from gs_quant.backtests.actions import (
@@ -32,7 +34,7 @@ from gs_quant.backtests.actions import (
 )
 from gs_quant.backtests.backtest_objects import BackTest, PredefinedAssetBacktest
 from gs_quant.backtests.backtest_utils import make_list, CalcType
-from gs_quant.backtests.data_sources import DataSource, GsDataSource
+from gs_quant.backtests.data_sources import DataSource, GenericDataSource, GsDataSource
 from gs_quant.base import field_metadata, exclude_none, static_field
 from gs_quant.data import Dataset
 from gs_quant.datetime.relative_date import RelativeDateSchedule
@@ -69,6 +71,25 @@ class TriggerRequirements:
     def get_trigger_times(self):
         return []
 
+    def evaluate_many(
+        self, states: Iterable[Union[dt.date, dt.datetime]], backtest: BackTest = None
+    ) -> Tuple[np.ndarray, List[Optional[dict]]]:
+        """
+        Evaluate the requirements on each of a sequence of states, in order, as has_triggered would
+        :param states: the dates or times to evaluate
+        :param backtest: the backtest, for requirements which depend on its state
+        :return: a boolean array of whether each state triggered and, for each state, the info dict or None
+        """
+        infos = [self.has_triggered(state, backtest) for state in states]
+        return np.array([bool(i) for i in infos], dtype=bool), [i.info_dict if i else None for i in infos]
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        """
+        Whether evaluation reads the state of the backtest, in which case it cannot be scheduled ahead of the run
+        """
+        return True
+
     @property
     def calc_type(self):
         return CalcType.simple
@@ -100,6 +121,38 @@ def check_barrier(direction, test_value, trigger_level) -> TriggerInfo:
     return TriggerInfo(False)
 
 
+def _check_barriers(direction, test_values: np.ndarray, trigger_level) -> np.ndarray:
+    if direction == TriggerDirection.ABOVE:
+        return test_values > trigger_level
+    elif direction == TriggerDirection.BELOW:
+        return test_values < trigger_level
+    else:
+        return test_values == trigger_level
+
+
+def _schedule_info(next_state) -> dict:
+    return {
+        AddTradeAction: AddTradeActionInfo(scaling=None, next_schedule=next_state),
+        AddScaledTradeAction: AddScaledTradeActionInfo(next_schedule=next_state),
+        HedgeAction: HedgeActionInfo(next_schedule=next_state),
+    }
+
+
+def _check_schedule(schedule: list, states: list) -> Tuple[np.ndarray, List[Optional[dict]]]:
+    positions = {}
+    for position, d in enumerate(schedule):
+        positions.setdefault(d, position)
+
+    triggered = np.zeros(len(states), dtype=bool)
+    infos = [None] * len(states)
+    for i, state in enumerate(states):
+        position = positions.get(state)
+        if position is not None:
+            triggered[i] = True
+            infos[i] = _schedule_info(schedule[position + 1] if position < len(schedule) - 1 else None)
+    return triggered, infos
+
+
 @dataclass_json
 @dataclass
 class PeriodicTriggerRequirements(TriggerRequirements):
@@ -126,16 +179,16 @@ class PeriodicTriggerRequirements(TriggerRequirements):
             next_state = None
             if self.trigger_dates.index(state) != len(self.trigger_dates) - 1:
                 next_state = self.trigger_dates[self.trigger_dates.index(state) + 1]
-            return TriggerInfo(
-                True,
-                {
-                    AddTradeAction: AddTradeActionInfo(scaling=None, next_schedule=next_state),
-                    AddScaledTradeAction: AddScaledTradeActionInfo(next_schedule=next_state),
-                    HedgeAction: HedgeActionInfo(next_schedule=next_state),
-                },
-            )
+            return TriggerInfo(True, _schedule_info(next_state))
         return TriggerInfo(False)
 
+    def evaluate_many(self, states: Iterable[dt.date], backtest: BackTest = None):
+        return _check_schedule(self.get_trigger_times(), list(states))
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return False
+
 
 @dataclass_json
 @dataclass
@@ -159,6 +212,15 @@ class IntradayTriggerRequirements(TriggerRequirements):
     def has_triggered(self, state: Union[dt.date, dt.datetime], backtest: BackTest = None) -> TriggerInfo:
         return TriggerInfo(state.time() in self._trigger_times)
 
+    def evaluate_many(self, states: Iterable[dt.datetime], backtest: BackTest = None):
+        trigger_times = set(self._trigger_times)
+        states = list(states)
+        return np.array([state.time() in trigger_times for state in states], dtype=bool), [None] * len(states)
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return False
+
 
 @dataclass_json
 @dataclass
@@ -178,6 +240,23 @@ class MktTriggerRequirements(TriggerRequirements):
             raise RuntimeError(f'unable to determine trigger state on {str(state)}, data value was {data_value}')
         return triggered
 
+    def evaluate_many(self, states: Iterable[Union[dt.date, dt.datetime]], backtest: BackTest = None):
+        states = list(states)
+        if not isinstance(self.data_source, GenericDataSource):
+            return super().evaluate_many(states, backtest)
+        try:
+            triggered = _check_barriers(
+                self.direction, np.asarray(self.data_source.get_data(states), dtype=float), self.trigger_level
+            )
+        except (TypeError, ValueError):
+            # values which are not numeric are reported state by state
+            return super().evaluate_many(states, backtest)
+        return triggered, [None] * len(states)
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return False
+
 
 @dataclass_json
 @dataclass
@@ -242,6 +321,35 @@ class AggregateTriggerRequirements(TriggerRequirements):
         else:
             raise RuntimeError(f'Unrecognised aggregation type: {self.aggregate_type}')
 
+    def evaluate_many(self, states: Iterable[Union[dt.date, dt.datetime]], backtest: BackTest = None):
+        states = list(states)
+        info_dicts = [{} for _ in states]
+        if self.aggregate_type == AggType.ALL_OF:
+            triggered = np.ones(len(states), dtype=bool)
+            for trigger in self.triggers:
+                # as in has_triggered, each trigger is only evaluated where all of those before it triggered
+                positions = np.flatnonzero(triggered)
+                t_triggered, t_infos = trigger.evaluate_many([states[i] for i in positions], backtest)
+                triggered[positions] = t_triggered
+                for i, t_info in zip(positions, t_infos):
+                    if t_info:
+                        info_dicts[i].update(t_info)
+        elif self.aggregate_type == AggType.ANY_OF:
+            triggered = np.zeros(len(states), dtype=bool)
+            for trigger in self.triggers:
+                t_triggered, t_infos = trigger.evaluate_many(states, backtest)
+                triggered |= t_triggered
+                for info_dict, t_info in zip(info_dicts, t_infos):
+                    if t_info:
+                        info_dict.update(t_info)
+        else:
+            raise RuntimeError(f'Unrecognised aggregation type: {self.aggregate_type}')
+        return triggered, [i if t else None for i, t in zip(info_dicts, triggered)]
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return any(trigger.depends_on_backtest for trigger in self.triggers)
+
     @property
     def calc_type(self):
         seen_types = set()
@@ -275,6 +383,14 @@ class NotTriggerRequirements(TriggerRequirements):
         else:
             return TriggerInfo(True)
 
+    def evaluate_many(self, states: Iterable[Union[dt.date, dt.datetime]], backtest: BackTest = None):
+        triggered, _ = self.trigger.evaluate_many(states, backtest)
+        return ~triggered, [None] * len(triggered)
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return self.trigger.depends_on_backtest
+
 
 @dataclass_json
 @dataclass
@@ -302,16 +418,21 @@ class DateTriggerRequirements(TriggerRequirements):
             next_state = None
             if dates.index(state) < len(dates) - 1:
                 next_state = dates[dates.index(state) + 1]
-            return TriggerInfo(
-                True,
-                {
-                    AddTradeAction: AddTradeActionInfo(scaling=None, next_schedule=next_state),
-                    AddScaledTradeAction: AddScaledTradeActionInfo(next_schedule=next_state),
-                    HedgeAction: HedgeActionInfo(next_schedule=next_state),
-                },
-            )
+            return TriggerInfo(True, _schedule_info(next_state))
         return TriggerInfo(False)
 
+    def evaluate_many(self, states: Iterable[Union[dt.date, dt.datetime]], backtest: BackTest = None):
+        if self.entire_day:
+            return _check_schedule(
+                sorted(self.dates_from_datetimes),
+                [s.date() if isinstance(s, dt.datetime) else s for s in states],
+            )
+        return _check_schedule(sorted(self.dates), list(states))
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return False
+
     def get_trigger_times(self):
         return self.dates_from_datetimes or self.dates
 
@@ -355,22 +476,50 @@ class MeanReversionTriggerRequirements(TriggerRequirements):
         rolling_mean = self.data_source.get_data_range(state, self.rolling_mean_window).mean()
         rolling_std = self.data_source.get_data_range(state, self.rolling_std_window).std()
         current_price = self.data_source.get_data(state)
+        return self.__step(current_price, rolling_mean, rolling_std)
+
+    def evaluate_many(self, states: Iterable[dt.date], backtest: BackTest = None):
+        states = list(states)
+        windows = (self.rolling_mean_window, self.rolling_std_window)
+        if not isinstance(self.data_source, GenericDataSource) or not all(isinstance(w, int) for w in windows):
+            return super().evaluate_many(states, backtest)
+        try:
+            with np.errstate(all='ignore'), warnings.catch_warnings():
+                # windows with too few values give nan, as the pandas reductions do
+                warnings.simplefilter('ignore', RuntimeWarning)
+                rolling_means = np.nanmean(self.data_source.get_data_windows(states, self.rolling_mean_window), axis=1)
+                rolling_stds = np.nanstd(
+                    self.data_source.get_data_windows(states, self.rolling_std_window), axis=1, ddof=1
+                )
+        except TypeError:
+            return super().evaluate_many(states, backtest)
+        current_prices = self.data_source.get_data(states)
+
+        # the position carries from one state to the next, so the rule itself is applied in order
+        infos = [self.__step(p, m, s) for p, m, s in zip(current_prices, rolling_means, rolling_stds)]
+        return np.array([bool(i) for i in infos], dtype=bool), [i.info_dict if i else None for i in infos]
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return False
+
+    def __step(self, current_price, rolling_mean, rolling_std) -> TriggerInfo:
         if self.current_position == 0:
             if abs((current_price - rolling_mean) / rolling_std) > self.z_score_bound:
                 if current_price > rolling_mean:
                     self.current_position = -1
-                    return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=-1)})
+                    return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=-1, next_schedule=None)})
                 else:
                     self.current_position = 1
-                    return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=1)})
+                    return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=1, next_schedule=None)})
         elif self.current_position == 1:
             if current_price > rolling_mean:
                 self._current_position = 0
-                return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=-1)})
+                return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=-1, next_schedule=None)})
         elif self.current_position == -1:
             if current_price > rolling_mean:
                 self.current_position = 0
-                return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=1)})
+                return TriggerInfo(True, {AddTradeAction: AddTradeActionInfo(scaling=1, next_schedule=None)})
         else:
             raise RuntimeWarning(f'unexpected current position: {self.current_position}')
         return TriggerInfo(False)
@@ -430,16 +579,16 @@ class EventTriggerRequirements(TriggerRequirements):
             next_state = None
             if dates.index(state) < len(dates) - 1:
                 next_state = dates[dates.index(state) + 1]
-            return TriggerInfo(
-                True,
-                {
-                    AddTradeAction: AddTradeActionInfo(scaling=None, next_schedule=next_state),
-                    AddScaledTradeAction: AddScaledTradeActionInfo(next_schedule=next_state),
-                    HedgeAction: HedgeActionInfo(next_schedule=next_state),
-                },
-            )
+            return TriggerInfo(True, _schedule_info(next_state))
         return TriggerInfo(False)
 
+    def evaluate_many(self, states: Iterable[dt.date], backtest: BackTest = None):
+        return _check_schedule(sorted(self.trigger_dates), list(states))
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return False
+
     @staticmethod
     def list_events(currency: str, start=Optional[dt.datetime], end=Optional[dt.datetime], **kwargs):
         kwargs['currency'] = currency
@@ -478,6 +627,44 @@ class Trigger:
         """
         return self.trigger_requirements.has_triggered(state, backtest)
 
+    def evaluate_many(
+        self, states: Iterable[Union[dt.date, dt.datetime]], backtest: BackTest = None
+    ) -> Tuple[np.ndarray, List[Optional[dict]]]:
+        """
+        Evaluate the trigger on each of a sequence of states, in order
+        :param states: the dates or times to evaluate
+        :param backtest: the backtest, for triggers which depend on its state
+        :return: a boolean array of whether each state triggered and, for each state, the info dict or None
+        """
+        if self.trigger_requirements is None or self._overrides_has_triggered:
+            infos = [self.has_triggered(state, backtest) for state in states]
+            return np.array([bool(i) for i in infos], dtype=bool), [i.info_dict if i else None for i in infos]
+        return self.trigger_requirements.evaluate_many(states, backtest)
+
+    def schedule(self, states: Iterable[Union[dt.date, dt.datetime]], backtest: BackTest = None) -> dict:
+        """
+        The states on which the trigger fires
+        :param states: the dates or times to evaluate
+        :param backtest: the backtest, for triggers which depend on its state
+        :return: dictionary of triggered state to TriggerInfo
+        """
+        states = list(states)
+        triggered, infos = self.evaluate_many(states, backtest)
+        return {states[i]: TriggerInfo(True, infos[i]) for i in np.flatnonzero(triggered)}
+
+    @property
+    def depends_on_backtest(self) -> bool:
+        return (
+            self.trigger_requirements is None
+            or self._overrides_has_triggered
+            or self.trigger_requirements.depends_on_backtest
+        )
+
+    @property
+    def _overrides_has_triggered(self) -> bool:
+        # a subclass's own has_triggered may use more than its requirements, so it is evaluated state by state
+        return type(self).has_triggered is not Trigger.has_triggered
+
     def get_trigger_times(self):
         return self.trigger_requirements.get_trigger_times()
 
@@ -608,8 +795,17 @@ class OrdersGeneratorTrigger(Trigger):
         if state.time() not in self.get_trigger_times():
             return TriggerInfo(False)
         else:
-            orders = self.generate_orders(state, backtest)
-            return TriggerInfo(True, {type(a): orders for a in self.actions}) if len(orders) else TriggerInfo(False)
+            return self.orders_at_trigger_time(state, backtest)
+
+    def orders_at_trigger_time(self, state: dt.datetime, backtest: PredefinedAssetBacktest = None) -> TriggerInfo:
+        """
+        Calls generate_orders at a state known to be among the trigger times
+        :param state: the time of the trigger
+        :param backtest: the backtest, used to access the holdings and orders generated so far
+        :return: TriggerInfo, triggered if any orders are generated
+        """
+        orders = self.generate_orders(state, backtest)
+        return TriggerInfo(True, {type(a): orders for a in self.actions}) if len(orders) else TriggerInfo(False)
 
 
 # These special trigger requirements have a special dependency on other trigger types
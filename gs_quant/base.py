@@ -17,18 +17,21 @@ under the License.
 import builtins
 import copy
 import datetime as dt
+import hashlib
 import logging
 import sys
+import types
 import typing
 from abc import ABC, ABCMeta, abstractmethod
 from collections import namedtuple
-from dataclasses import Field, InitVar, MISSING, dataclass, field, fields, replace
+from dataclasses import Field, InitVar, MISSING, dataclass, field, fields, is_dataclass, replace
 from enum import EnumMeta, Enum
 from functools import update_wrapper
 from inspect import signature
 from typing import Iterable, Mapping, Optional, Union, Tuple
 
 import numpy as np
+import pandas as pd
 from dataclasses_json import config, global_config, LetterCase, dataclass_json
 from dataclasses_json.core import _decode_generic, _is_supported_generic
 from inflection import camelize, underscore
@@ -59,6 +62,7 @@ __setattr__ = object.__setattr__
 
 _rename_cache = {}
 _is_supported_generic_cache = {}
+_digest_fields_cache = {}
 
 
 def exclude_none(o):
@@ -191,6 +195,40 @@ class HashableDict(dict):
     def __hash__(self):
         return hash(HashableDict.hashables(self))
 
+    def __getstate__(self):
+        # copies are made to be modified, so they do not keep the memoised digest
+        state = self.__dict__.copy()
+        state.pop('_digest', None)
+        return state
+
+    def __setitem__(self, key, value):
+        _reset_digest(self)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        _reset_digest(self)
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        _reset_digest(self)
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        _reset_digest(self)
+        return super().pop(*args)
+
+    def popitem(self):
+        _reset_digest(self)
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        _reset_digest(self)
+        return super().setdefault(key, default)
+
+    def clear(self):
+        _reset_digest(self)
+        super().clear()
+
 
 class DictBase(HashableDict):
     _PROPERTIES = set()
@@ -234,6 +272,139 @@ class DictBase(HashableDict):
         return cls._PROPERTIES
 
 
+def _reset_digest(obj):
+    # the digests of objects holding this one are checked against its own when they are next used
+    obj.__dict__.pop('_digest', None)
+
+
+def _digest_fields(cls) -> Tuple[str, ...]:
+    if cls not in _digest_fields_cache:
+        _digest_fields_cache[cls] = tuple(
+            f.name for f in fields(cls) if f.metadata.get('dataclasses_json', {}).get('exclude') is not exclude_always
+        )
+    return _digest_fields_cache[cls]
+
+
+def _digest(obj) -> bytes:
+    memo = obj.__dict__.get('_digest')
+    if memo is not None:
+        digest, children = memo
+        if all(_digest(child) == child_digest for child, child_digest in children):
+            return digest
+
+    h = hashlib.blake2b(digest_size=16)
+    children = []
+    _update_digest(h, obj, memoise=False, children=children)
+    digest = h.digest()
+    # kept with the digests of the objects it holds, so that a change to any of them is seen
+    obj.__dict__['_digest'] = (digest, tuple(children))
+    return digest
+
+
+def _update_digest(h, obj, memoise: bool = True, children: Optional[list] = None):
+    if memoise and isinstance(obj, (Base, HashableDict)):
+        digest = _digest(obj)
+        if children is not None:
+            children.append((obj, digest))
+        h.update(b'H' + digest)
+    elif obj is None:
+        h.update(b'N')
+    elif isinstance(obj, bool):
+        h.update(b'T' if obj else b'F')
+    elif isinstance(obj, Enum):
+        h.update(b'E')
+        _update_digest(h, obj.value, children=children)
+    elif isinstance(obj, np.generic):
+        _update_digest(h, obj.item(), children=children)
+    elif isinstance(obj, str):
+        encoded = obj.encode()
+        h.update(b's%d:' % len(encoded) + encoded)
+    elif isinstance(obj, (int, float)):
+        h.update(b'i' if isinstance(obj, int) else b'f')
+        h.update(repr(obj).encode() + b';')
+    elif isinstance(obj, (dt.date, dt.time)):
+        h.update(b'D' + obj.isoformat().encode() + b';')
+    elif isinstance(obj, Base):
+        h.update(b'O' + type(obj).__qualname__.encode() + b';')
+        for name in _digest_fields(type(obj)):
+            value = __getattribute__(obj, name)
+            if value is not None:
+                h.update(name.encode() + b'=')
+                _update_digest(h, value, children=children)
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        h.update(b'C' + type(obj).__qualname__.encode() + b';')
+        for f in fields(obj):
+            h.update(f.name.encode() + b'=')
+            _update_digest(h, getattr(obj, f.name), children=children)
+    elif isinstance(obj, types.FunctionType):
+        # lambdas and nested functions share a qualified name, so hash what they compute as well
+        h.update(b'F' + f'{obj.__module__}.{obj.__qualname__}'.encode() + b';')
+        _update_digest(h, obj.__code__, children=children)
+        _update_digest(h, obj.__defaults__, children=children)
+        _update_digest(h, obj.__kwdefaults__, children=children)
+        for cell in obj.__closure__ or ():
+            try:
+                _update_digest(h, cell.cell_contents, children=children)
+            except ValueError:
+                # empty cell
+                h.update(b'N')
+    elif isinstance(obj, types.CodeType):
+        h.update(b'K' + obj.co_code)
+        _update_digest(h, obj.co_consts, children=children)
+        _update_digest(h, obj.co_names, children=children)
+    elif isinstance(obj, (types.BuiltinFunctionType, type)):
+        h.update(b'F' + f'{obj.__module__}.{obj.__qualname__}'.encode() + b';')
+    elif isinstance(obj, dict):
+        h.update(b'M%d:' % len(obj))
+        for key in sorted(obj, key=lambda k: (type(k).__name__, str(k))):
+            _update_digest(h, key, children=children)
+            _update_digest(h, obj[key], children=children)
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'L%d:' % len(obj))
+        for item in obj:
+            _update_digest(h, item, children=children)
+    elif isinstance(obj, (set, frozenset)):
+        h.update(b'S%d:' % len(obj))
+        for item in sorted(obj, key=lambda x: (type(x).__name__, str(x))):
+            _update_digest(h, item, children=children)
+    elif isinstance(obj, (pd.DataFrame, pd.Series)):
+        if isinstance(obj, pd.DataFrame):
+            h.update(b'P')
+            _update_digest(h, tuple(obj.columns), children=children)
+            h.update(str(obj.dtypes.tolist()).encode())
+        else:
+            h.update(b'Q')
+            _update_digest(h, obj.name, children=children)
+            h.update(str(obj.dtype).encode())
+        try:
+            h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+        except TypeError:
+            # unhashable cell values, such as lists
+            h.update(obj.to_json().encode())
+    elif isinstance(obj, np.ndarray):
+        h.update(b'A' + str(obj.dtype).encode() + str(obj.shape).encode() + np.ascontiguousarray(obj).tobytes())
+    else:
+        encoded = str(obj).encode()
+        h.update(b'R' + type(obj).__qualname__.encode() + b'%d:' % len(encoded) + encoded)
+
+
+def structural_digest(obj) -> str:
+    """
+    Stable digest of a value, for use in cache keys
+
+    Base objects, dataclasses, dicts, sequences, dataframes and scalars are hashed by content, so equal values give the
+    same digest in any process. Digests of Base and HashableDict objects are memoised until one of them is modified, so
+    repeated lookups with the same query cost the same whatever its size. Lists or dataframes held by such objects must
+    not be modified in place once they have been used in a key.
+
+    :param obj: value to digest
+    :return: hex digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _update_digest(h, obj)
+    return h.hexdigest()
+
+
 class Base(ABC):
     """The base class for all generated classes"""
 
@@ -268,9 +439,16 @@ class Base(ABC):
 
             key = snake_case_key
             value = self.__coerce_value(fld.type, value)
+            _reset_digest(self)
 
         __setattr__(self, key, value)
 
+    def __getstate__(self):
+        # copies are made to be modified, so they do not keep the memoised digest
+        state = self.__dict__.copy()
+        state.pop('_digest', None)
+        return state
+
     def __repr__(self):
         if self.name is not None:
             return f'{self.name} ({self.__class__.__name__})'
@@ -421,6 +599,7 @@ class Base(ABC):
         if not isinstance(instance, type(self)):
             raise ValueError('Can only use from_instance with an object of the same type')
 
+        _reset_digest(self)
         for fld in fields(self.__class__):
             if fld.init:
                 __setattr__(self, fld.name, __getattribute__(instance, fld.name))
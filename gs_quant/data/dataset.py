@@ -17,8 +17,10 @@ under the License.
 import datetime as dt
 import re
 import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Iterable, Optional, Union, List, Dict, Callable
+from typing import Iterable, Iterator, Optional, Union, List, Dict, Callable
 from urllib.parse import quote
 
 import inflection
@@ -28,6 +30,7 @@ from pydash import camel_case, snake_case
 
 from gs_quant.api.data import DataApi
 from gs_quant.api.gs.users import GsUsersApi
+from gs_quant.context_base import nullcontext
 from gs_quant.data.fields import Fields
 from gs_quant.errors import MqValueError
 from gs_quant.session import GsSession
@@ -248,6 +251,131 @@ class Dataset:
         data = await self.provider.query_data_async(query, self.id)
         return self._build_data_frame(data, schema_varies, standard_fields)
 
+    def _get_data_chunk(
+        self, session, span, start, end, kwargs, as_of, since, fields, asset_id_type, empty_intervals, standard_fields
+    ) -> pd.DataFrame:
+        with Tracer.activate_span(span), session or nullcontext():
+            query, schema_varies = self._build_data_query(start, end, as_of, since, fields, empty_intervals, **kwargs)
+            data = self.provider.query_data(query, self.id, asset_id_type=asset_id_type)
+            return self._build_data_frame(data, schema_varies, standard_fields)
+
+    def iter_data(
+        self,
+        start: Union[dt.date, dt.datetime],
+        end: Optional[Union[dt.date, dt.datetime]] = None,
+        as_of: Optional[dt.datetime] = None,
+        since: Optional[dt.datetime] = None,
+        fields: Optional[Iterable[Union[str, Fields]]] = None,
+        asset_id_type: Optional[str] = None,
+        empty_intervals: Optional[bool] = None,
+        standard_fields: Optional[bool] = False,
+        time_chunk: Optional[dt.timedelta] = None,
+        symbols_per_request: Optional[int] = None,
+        max_in_flight: int = 4,
+        max_memory: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Get data for the given range and parameters as a series of dataframes, each of part of the range and symbols
+
+        The range is split into intervals of time_chunk and the longest list of values in kwargs, e.g. of assetId, into
+        lists of symbols_per_request. A request is made for each interval and list of symbols, up to max_in_flight at
+        a time, and its dataframe is yielded as soon as it and those for the requests before it are complete. Empty
+        dataframes are skipped. Only the dataframes which are in flight or have not yet been yielded are held in memory.
+
+        :param start: Requested start date/datetime for data
+        :param end: Requested end date/datetime for data, defaults to today or now
+        :param as_of: Request data as_of
+        :param since: Request data since
+        :param fields: DataSet fields to include
+        :param asset_id_type: type of the asset ids in kwargs
+        :param empty_intervals: whether to request empty intervals
+        :param standard_fields: If set, will use fields api instead of catalog api to get fieldTypes
+        :param time_chunk: length of the interval of each request, defaults to a year for dates and a day for datetimes
+        :param symbols_per_request: maximum number of symbols in each request, defaults to all of them
+        :param max_in_flight: maximum number of requests made at once
+        :param max_memory: approximate limit in bytes of the dataframes held at once. Fewer requests are made at once
+                           when the largest dataframe so far, multiplied by the number in flight, would exceed it
+        :param kwargs: Extra query arguments, e.g. ticker='EDZ19'
+        :return: A generator of dataframes of the requested data, in order of interval then symbols
+
+        **Examples**
+
+        >>> from gs_quant.data import Dataset
+        >>> import datetime as dt
+        >>>
+        >>> trades = Dataset('TREOD')
+        >>> for frame in trades.iter_data(dt.datetime(2020, 1, 1), dt.datetime(2023, 1, 1), assetId=asset_ids,
+        >>>                               time_chunk=dt.timedelta(days=7), symbols_per_request=100):
+        >>>     process(frame)
+        """
+        if isinstance(start, dt.datetime):
+            end = end or dt.datetime.now(start.tzinfo)
+            time_chunk = time_chunk or dt.timedelta(days=1)
+            resolution = dt.timedelta(microseconds=1)
+        else:
+            end = end or dt.date.today()
+            time_chunk = time_chunk or dt.timedelta(days=365)
+            resolution = dt.timedelta(days=1)
+        if time_chunk < resolution:
+            raise MqValueError('time_chunk must be at least the resolution of start')
+        if max_in_flight < 1:
+            raise MqValueError('max_in_flight must be at least 1')
+
+        # start and end are inclusive, so each interval ends just before the next begins
+        intervals = []
+        interval_start = start
+        while interval_start <= end:
+            intervals.append((interval_start, min(interval_start + time_chunk - resolution, end)))
+            interval_start += time_chunk
+
+        symbols = [k for k, v in kwargs.items() if isinstance(v, (list, tuple))]
+        symbol_key = max(symbols, key=lambda k: len(kwargs[k])) if symbols else None
+        if symbol_key is not None and symbols_per_request:
+            values = kwargs[symbol_key]
+            symbol_kwargs = [
+                {**kwargs, symbol_key: tuple(values[i : i + symbols_per_request])}
+                for i in range(0, len(values), symbols_per_request)
+            ]
+        else:
+            symbol_kwargs = [kwargs]
+
+        requests = iter([(s, e, chunk_kwargs) for s, e in intervals for chunk_kwargs in symbol_kwargs])
+        session = GsSession.current if GsSession.current_is_set else None
+        get_chunk = partial(
+            self._get_data_chunk,
+            session,
+            Tracer.active_span(),
+            as_of=as_of,
+            since=since,
+            fields=fields,
+            asset_id_type=asset_id_type,
+            empty_intervals=empty_intervals,
+            standard_fields=standard_fields,
+        )
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        pending = deque()
+        largest = 0
+        try:
+            while True:
+                limit = max_in_flight
+                if max_memory and largest:
+                    limit = max(1, min(max_in_flight, max_memory // largest))
+                while len(pending) < limit:
+                    request = next(requests, None)
+                    if request is None:
+                        break
+                    pending.append(executor.submit(get_chunk, *request))
+                if not pending:
+                    return
+                df = pending.popleft().result()
+                if max_memory:
+                    largest = max(largest, int(df.memory_usage(deep=True).sum()))
+                if not df.empty:
+                    yield df
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _build_data_series_query(
         self,
         field: Union[str, Fields],
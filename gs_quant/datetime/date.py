@@ -21,6 +21,7 @@ from enum import Enum, IntEnum
 from typing import Iterable, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 
 from gs_quant.common import PricingLocation
 from gs_quant.datetime.gscalendar import GsCalendar
@@ -80,6 +81,23 @@ class DayCountConvention(Enum):
     ONE_ONE = "ONE_ONE"
 
 
+class DateRangeOutput(Enum):
+    """Date range output enumeration
+
+    Provides an enumeration of the result types date_range can produce
+
+    """
+
+    # Lazy generator of dt.date, computed one business day offset at a time
+    GENERATOR = "generator"
+
+    # NumPy array of datetime64[D], computed in a single vectorised pass
+    ARRAY = "array"
+
+    # pandas DatetimeIndex, computed in a single vectorised pass
+    INDEX = "index"
+
+
 def is_business_day(
     dates: DateOrDates, calendars: Union[str, Tuple[str, ...]] = (), week_mask: Optional[str] = None
 ) -> Union[bool, Tuple[bool, ...]]:
@@ -179,7 +197,8 @@ def date_range(
     end: Union[int, dt.date],
     calendars: Union[str, Tuple[str, ...]] = (),
     week_mask: Optional[str] = None,
-) -> Iterable[dt.date]:
+    output: Union[str, DateRangeOutput] = DateRangeOutput.GENERATOR,
+) -> Union[Iterable[dt.date], np.ndarray, pd.DatetimeIndex]:
     """
     Construct a range of dates
 
@@ -189,7 +208,9 @@ def date_range(
         (which must be a date)
     :param calendars: Calendars to use for holidays
     :param week_mask: Which days are considered weekends (defaults to Saturday and Sunday)
-    :return: A generator of dates
+    :param output: Type of result: a lazy generator of dates (default), or a datetime64[D] array or DatetimeIndex
+        computed in a single vectorised pass
+    :return: A generator of dates, a NumPy array or a DatetimeIndex, according to output
 
     >>> import datetime as dt
     >>> today = dt.date.today()
@@ -197,7 +218,14 @@ def date_range(
     >>>
     >>> for date in date_range(dt.date(2019, 1, 1), dt.date(2019, 2, 1)):
     >>>     print(date)
+    >>>
+    >>> index = date_range(dt.date(2000, 1, 3), today, output=DateRangeOutput.INDEX)
     """
+    output = DateRangeOutput(output)
+    if output != DateRangeOutput.GENERATOR:
+        dates = _date_range_array(begin, end, calendars, week_mask)
+        return dates if output == DateRangeOutput.ARRAY else pd.DatetimeIndex(dates)
+
     if isinstance(begin, dt.date):
         if isinstance(end, dt.date):
 
@@ -227,6 +255,35 @@ def date_range(
         raise ValueError('begin must be a date or int')
 
 
+def _date_range_array(
+    begin: Union[int, dt.date],
+    end: Union[int, dt.date],
+    calendars: Union[str, Tuple[str, ...]],
+    week_mask: Optional[str],
+) -> np.ndarray:
+    if isinstance(begin, dt.date):
+        if isinstance(end, dt.date):
+            if begin > end:
+                raise ValueError('begin must be <= end')
+            busdaycal = GsCalendar.get(calendars).business_day_calendar(week_mask)
+            first = np.datetime64(begin, 'D')
+            count = np.busday_count(first, np.datetime64(end, 'D') + 1, busdaycal=busdaycal)
+            return np.busday_offset(first, np.arange(count), roll='raise', busdaycal=busdaycal)
+        elif isinstance(end, int):
+            busdaycal = GsCalendar.get(calendars).business_day_calendar(week_mask)
+            return np.busday_offset(np.datetime64(begin, 'D'), np.arange(end), roll='raise', busdaycal=busdaycal)
+        else:
+            raise ValueError('end must be a date or int')
+    elif isinstance(begin, int):
+        if isinstance(end, dt.date):
+            busdaycal = GsCalendar.get(calendars).business_day_calendar(week_mask)
+            return np.busday_offset(np.datetime64(end, 'D'), -np.arange(begin), roll='preceding', busdaycal=busdaycal)
+        else:
+            raise ValueError('end must be a date if begin is an int')
+    else:
+        raise ValueError('begin must be a date or int')
+
+
 def today(location: Optional[PricingLocation] = None) -> dt.date:
     if not location:
         return dt.date.today()
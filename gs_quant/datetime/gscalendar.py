@@ -32,6 +32,14 @@ _logger = logging.getLogger(__name__)
 
 _calendar_cache = TTLCache(maxsize=128, ttl=600)
 _coverage_cache = TTLCache(maxsize=128, ttl=3600)
+# Built np.busdaycalendar objects with the holidays they were built from, interned process-wide by (calendars, week
+# mask) for as long as those holidays are cached
+_business_day_calendar_cache = TTLCache(maxsize=256, ttl=600)
+_business_day_calendar_lock = Lock()
+
+
+class _IncompleteHolidays(tuple):
+    """Holidays of calendars some of whose holidays could not be fetched"""
 
 
 def _split_list(items, predicate) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
@@ -57,8 +65,8 @@ class GsCalendar:
         if calendars is None:
             calendars = ()
         self.__calendars = calendars
-        self.__business_day_calendars = {}
         self._skip_valid_check = skip_valid_check
+        self.__holidays_unavailable = False
 
     @staticmethod
     def get(calendars: Union[str, Tuple], skip_valid_check=True):
@@ -67,6 +75,7 @@ class GsCalendar:
     @staticmethod
     def reset():
         _calendar_cache.clear()
+        _business_day_calendar_cache.clear()
 
     def calendars(self) -> Tuple:
         return self.__calendars
@@ -106,7 +115,7 @@ class GsCalendar:
             if not data.empty:
                 return [d.date() for d in data.index.to_pydatetime()]
         except MqRequestError:
-            pass
+            self.__holidays_unavailable = True
         return []
 
     @property
@@ -116,13 +125,18 @@ class GsCalendar:
         holidays = self.holidays_from_dataset(Dataset(Dataset.GS.HOLIDAY), 'exchange', exchanges)
         holidays = holidays + self.holidays_from_dataset(Dataset(Dataset.GS.HOLIDAY_CURRENCY), 'currency', currencies)
         holidays = tuple(set(holidays))
-        return holidays
+        return _IncompleteHolidays(holidays) if self.__holidays_unavailable else holidays
 
     def business_day_calendar(self, week_mask: str = None) -> np.busdaycalendar:
-        return self.__business_day_calendars.setdefault(
-            week_mask,
-            np.busdaycalendar(
-                weekmask=week_mask or self.DEFAULT_WEEK_MASK,
-                holidays=tuple([np.datetime64(d.isoformat()) for d in self.holidays]),
-            ),
-        )
+        week_mask = week_mask or self.DEFAULT_WEEK_MASK
+        holidays = self.holidays
+        key = hashkey(str(self.__calendars), week_mask)
+        with _business_day_calendar_lock:
+            built_from, calendar = _business_day_calendar_cache.get(key, (None, None))
+        # a calendar is only reused while its holidays are the ones cached
+        if built_from is not holidays:
+            calendar = np.busdaycalendar(weekmask=week_mask, holidays=np.array(holidays, dtype='datetime64[D]'))
+            if not isinstance(holidays, _IncompleteHolidays):
+                with _business_day_calendar_lock:
+                    _business_day_calendar_cache[key] = (holidays, calendar)
+        return calendar
@@ -18,7 +18,6 @@ import asyncio
 import datetime as dt
 import logging
 import sys
-import weakref
 from abc import ABCMeta
 from concurrent.futures import ThreadPoolExecutor
 from inspect import signature
@@ -31,50 +30,63 @@ from gs_quant.base import InstrumentBase, RiskKey, Scenario, get_enum_value
 from gs_quant.common import PricingLocation, RiskMeasure, PricingDateAndMarketDataAsOf
 from gs_quant.context_base import ContextBaseWithDefault
 from gs_quant.datetime.date import business_day_offset, today
-from gs_quant.risk import (
-    CompositeScenario,
-    DataFrameWithInfo,
-    ErrorValue,
-    FloatWithInfo,
-    MarketDataScenario,
-    StringWithInfo,
-)
+from gs_quant.risk import CompositeScenario, MarketDataScenario, StringWithInfo
 from gs_quant.risk.results import PricingFuture
 from gs_quant.session import GsSession
 from gs_quant.target.risk import RiskPosition, RiskRequest, RiskRequestParameters
 from gs_quant.tracing import Tracer
-from .markets import CloseMarket, LiveMarket, Market, close_market_date, OverlayMarket, RelativeMarket
+from .markets import CloseMarket, Market, close_market_date, OverlayMarket, RelativeMarket
+from .pricing_cache import CacheResult, InMemoryPricingCacheBackend, PricingCacheBackend, PricingCacheStats
 from ..api.risk import GenericRiskApi
 
 _logger = logging.getLogger(__name__)
 
-CacheResult = Union[DataFrameWithInfo, FloatWithInfo, StringWithInfo]
-
 
 class PricingCache(metaclass=ABCMeta):
     """
-    Weakref cache for instrument calcs
+    Cache for instrument calcs
+
+    Results are stored in a PricingCacheBackend, by default a bounded in-memory cache held against weak references to
+    instruments. Use set_backend to change its limits or storage.
+
+    **Examples**
+
+    >>> from gs_quant.markets.pricing_cache import InMemoryPricingCacheBackend
+    >>>
+    >>> PricingCache.set_backend(InMemoryPricingCacheBackend(max_size_bytes=256 * 1024 * 1024, ttl_in_seconds=600))
+    >>> PricingCache.stats().hit_rate
     """
 
-    __cache = weakref.WeakKeyDictionary()
+    __backend: PricingCacheBackend = InMemoryPricingCacheBackend()
+
+    @classmethod
+    def backend(cls) -> PricingCacheBackend:
+        return cls.__backend
+
+    @classmethod
+    def set_backend(cls, backend: PricingCacheBackend):
+        cls.__backend = backend
 
     @classmethod
     def clear(cls):
-        __cache = weakref.WeakKeyDictionary()
+        cls.__backend.clear()
 
     @classmethod
     def get(cls, risk_key: RiskKey, instrument: InstrumentBase) -> Optional[CacheResult]:
-        return cls.__cache.get(instrument, {}).get(risk_key)
+        return cls.__backend.get(risk_key, instrument)
 
     @classmethod
     def put(cls, risk_key: RiskKey, instrument: InstrumentBase, result: CacheResult):
-        if not isinstance(result, ErrorValue) and not isinstance(risk_key.market, LiveMarket):
-            cls.__cache.setdefault(instrument, {})[risk_key] = result
+        cls.__backend.put(risk_key, instrument, result)
 
     @classmethod
     def drop(cls, instrument: InstrumentBase):
-        if instrument in cls.__cache:
-            cls.__cache.pop(instrument)
+        cls.__backend.drop(instrument)
+
+    @classmethod
+    def stats(cls) -> PricingCacheStats:
+        """Hit, miss, put, eviction and expiration counts, and current size of the cache"""
+        return cls.__backend.stats
 
 
 class PricingContext(ContextBaseWithDefault):
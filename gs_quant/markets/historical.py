@@ -19,7 +19,7 @@ from typing import Iterable, Optional, Tuple, Union, Type
 
 from gs_quant.base import InstrumentBase, RiskKey
 from gs_quant.common import RiskMeasure
-from gs_quant.datetime.date import date_range
+from gs_quant.datetime.date import date_range, DateRangeOutput
 from gs_quant.risk import RollFwd, MarketDataScenario
 from gs_quant.risk.results import HistoricalPricingFuture, PricingFuture
 from .core import PricingContext
@@ -100,7 +100,9 @@ class HistoricalPricingContext(PricingContext):
             if end is None:
                 end = dt.date.today()
 
-            self.__date_range = tuple(date_range(start, end, calendars=calendars))
+            self.__date_range = tuple(
+                date_range(start, end, calendars=calendars, output=DateRangeOutput.ARRAY).tolist()
+            )
         elif dates is not None:
             self.__date_range = tuple(dates)
         else:
@@ -202,7 +204,9 @@ class BackToTheFuturePricingContext(HistoricalPricingContext):
             if end is None:
                 end = dt.date.today()
 
-            self.__date_range = tuple(date_range(start, end, calendars=calendars))
+            self.__date_range = tuple(
+                date_range(start, end, calendars=calendars, output=DateRangeOutput.ARRAY).tolist()
+            )
         elif dates is not None:
             self.__date_range = tuple(dates)
         else:
@@ -0,0 +1,320 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import os
+import sys
+import threading
+import time
+import weakref
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict, namedtuple
+from typing import Optional, Union
+
+import pandas as pd
+
+from gs_quant.api.api_cache import CacheEvent, DiskApiRequestCache
+from gs_quant.base import InstrumentBase, RiskKey, structural_digest
+from gs_quant.risk import DataFrameWithInfo, DictWithInfo, ErrorValue, FloatWithInfo, SeriesWithInfo, StringWithInfo
+from .markets import CloseMarket, LiveMarket
+
+CacheResult = Union[DataFrameWithInfo, FloatWithInfo, SeriesWithInfo, StringWithInfo]
+
+_STATS_FIELDS = ('hits', 'misses', 'puts', 'evictions', 'expirations', 'instruments', 'results', 'size_bytes')
+
+
+class PricingCacheStats(namedtuple('PricingCacheStats', _STATS_FIELDS)):
+    """Counters and current size of a pricing cache"""
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _result_size(result: CacheResult) -> int:
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return int(result.memory_usage(index=True, deep=True).sum()) + sys.getsizeof(result.risk_key)
+    return sys.getsizeof(result) + sys.getsizeof(getattr(result, 'risk_key', None))
+
+
+def is_cacheable(risk_key: RiskKey, result: CacheResult) -> bool:
+    """Errors and live market results are never cached"""
+    return not isinstance(result, ErrorValue) and not isinstance(risk_key.market, LiveMarket)
+
+
+class PricingCacheBackend(metaclass=ABCMeta):
+    """
+    Storage for PricingCache
+    """
+
+    @abstractmethod
+    def get(self, risk_key: RiskKey, instrument: InstrumentBase) -> Optional[CacheResult]: ...
+
+    @abstractmethod
+    def put(self, risk_key: RiskKey, instrument: InstrumentBase, result: CacheResult): ...
+
+    @abstractmethod
+    def drop(self, instrument: InstrumentBase): ...
+
+    @abstractmethod
+    def clear(self): ...
+
+    @property
+    @abstractmethod
+    def stats(self) -> PricingCacheStats: ...
+
+
+class _InstrumentResults:
+    __slots__ = ('results', 'size_bytes')
+
+    def __init__(self):
+        self.results = {}
+        self.size_bytes = 0
+
+
+class InMemoryPricingCacheBackend(PricingCacheBackend):
+    """
+    Bounded in-memory storage for PricingCache
+
+    Results are held against weak references to their instruments, so are dropped when the instrument is garbage
+    collected. Once the results held exceed max_size_bytes, all results for the least recently used instruments are
+    evicted. Results for markets other than close markets expire after ttl_in_seconds, as the market data they were
+    computed from may change.
+
+    :param max_size_bytes: memory budget for cached results, None for no limit
+    :param ttl_in_seconds: time to live of results for markets other than close markets, None for no expiry
+    """
+
+    def __init__(self, max_size_bytes: Optional[int] = 1 << 30, ttl_in_seconds: Optional[float] = None):
+        self.__max_size_bytes = max_size_bytes
+        self.__ttl_in_seconds = ttl_in_seconds
+        self.__lock = threading.RLock()
+        self.__instruments = OrderedDict()  # weakref to instrument -> _InstrumentResults, in least recently used order
+        self.__collected = []
+        self.__size_bytes = 0
+        self.__results = 0
+        self.__counters = dict.fromkeys(('hits', 'misses', 'puts', 'evictions', 'expirations'), 0)
+
+    def __on_collected(self, ref: weakref.ref):
+        # may be called by the garbage collector at any point, so removal is deferred to the next call
+        self.__collected.append(ref)
+
+    def __remove(self, ref: weakref.ref) -> int:
+        entry = self.__instruments.pop(ref, None)
+        if entry is None:
+            return 0
+        self.__size_bytes -= entry.size_bytes
+        self.__results -= len(entry.results)
+        return len(entry.results)
+
+    def __purge_collected(self):
+        while self.__collected:
+            self.__remove(self.__collected.pop())
+
+    def __expiry(self, risk_key: RiskKey) -> Optional[float]:
+        if self.__ttl_in_seconds is None or isinstance(risk_key.market, CloseMarket):
+            return None
+        return time.monotonic() + self.__ttl_in_seconds
+
+    def get(self, risk_key: RiskKey, instrument: InstrumentBase) -> Optional[CacheResult]:
+        with self.__lock:
+            self.__purge_collected()
+            ref = weakref.ref(instrument)
+            entry = self.__instruments.get(ref)
+            cached = entry.results.get(risk_key) if entry is not None else None
+            if cached is None:
+                self.__counters['misses'] += 1
+                return None
+
+            result, expiry, size_bytes = cached
+            if expiry is not None and expiry <= time.monotonic():
+                del entry.results[risk_key]
+                entry.size_bytes -= size_bytes
+                self.__size_bytes -= size_bytes
+                self.__results -= 1
+                self.__counters['expirations'] += 1
+                self.__counters['misses'] += 1
+                return None
+
+            self.__instruments.move_to_end(ref)
+            self.__counters['hits'] += 1
+            return result
+
+    def put(self, risk_key: RiskKey, instrument: InstrumentBase, result: CacheResult):
+        if not is_cacheable(risk_key, result):
+            return
+
+        size_bytes = _result_size(result)
+        with self.__lock:
+            self.__purge_collected()
+            ref = weakref.ref(instrument, self.__on_collected)
+            entry = self.__instruments.get(ref)
+            if entry is None:
+                entry = self.__instruments[ref] = _InstrumentResults()
+            self.__instruments.move_to_end(ref)
+
+            previous = entry.results.get(risk_key)
+            if previous is not None:
+                entry.size_bytes -= previous[2]
+                self.__size_bytes -= previous[2]
+                self.__results -= 1
+
+            entry.results[risk_key] = (result, self.__expiry(risk_key), size_bytes)
+            entry.size_bytes += size_bytes
+            self.__size_bytes += size_bytes
+            self.__results += 1
+            self.__counters['puts'] += 1
+
+            if self.__max_size_bytes is not None:
+                # the most recently used instrument is kept, even if its results alone exceed the budget
+                while self.__size_bytes > self.__max_size_bytes and len(self.__instruments) > 1:
+                    self.__counters['evictions'] += self.__remove(next(iter(self.__instruments)))
+
+    def drop(self, instrument: InstrumentBase):
+        with self.__lock:
+            self.__purge_collected()
+            self.__remove(weakref.ref(instrument))
+
+    def clear(self):
+        with self.__lock:
+            self.__instruments.clear()
+            self.__collected.clear()
+            self.__size_bytes = 0
+            self.__results = 0
+
+    @property
+    def stats(self) -> PricingCacheStats:
+        with self.__lock:
+            self.__purge_collected()
+            return PricingCacheStats(
+                instruments=len(self.__instruments),
+                results=self.__results,
+                size_bytes=self.__size_bytes,
+                **self.__counters,
+            )
+
+
+class DiskPricingCacheBackend(PricingCacheBackend):
+    """
+    PricingCache storage which persists close market results to disk
+
+    Results are held in memory as for InMemoryPricingCacheBackend. Results for close markets are deterministic, so
+    are also written to a SQLite file keyed on a digest of the instrument definition and risk key (provider, date,
+    market, parameters, scenario and measure), from which any process using the same file can read them. Lookups
+    missing from memory fall back to the file before a risk request is built.
+
+    :param path: location of the cache file (defaults to ~/.gs_quant/pricing_cache.db)
+    :param max_size_bytes: maximum total size of results stored on disk
+    :param version: label included in every key, changing it invalidates results stored under previous labels
+    :param memory: backend for results held in memory (defaults to an InMemoryPricingCacheBackend)
+
+    **Examples**
+
+    >>> from gs_quant.markets import PricingCache
+    >>>
+    >>> PricingCache.set_backend(DiskPricingCacheBackend('/shared/cache/pricing.db', version='2026-10'))
+    """
+
+    FORMAT_VERSION = 1
+
+    __TYPES = {'float': FloatWithInfo, 'string': StringWithInfo, 'dict': DictWithInfo}
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size_bytes: int = 1 << 32,
+        version: str = '',
+        memory: Optional[PricingCacheBackend] = None,
+    ):
+        path = path or os.path.join(os.path.expanduser('~'), '.gs_quant', 'pricing_cache.db')
+        self.__store = DiskApiRequestCache(path, max_size_bytes=max_size_bytes, ttl_in_seconds=None)
+        self.__version = version
+        self.__memory = memory or InMemoryPricingCacheBackend()
+
+    @property
+    def path(self) -> str:
+        return self.__store.path
+
+    def _persistent_key(self, risk_key: RiskKey, instrument: InstrumentBase) -> str:
+        provider = risk_key.provider
+        return structural_digest(
+            (
+                'PricingCache',
+                self.FORMAT_VERSION,
+                self.__version,
+                f'{provider.__module__}.{provider.__qualname__}' if provider is not None else None,
+                risk_key.date,
+                (risk_key.market.date, risk_key.market.location),
+                risk_key.params,
+                risk_key.scenario,
+                risk_key.risk_measure,
+                instrument,
+            )
+        )
+
+    @classmethod
+    def _encode(cls, result: CacheResult) -> Optional[tuple]:
+        # plain values and result info only: the risk key is restored from the lookup
+        if isinstance(result, DataFrameWithInfo):
+            kind, value = 'frame', pd.DataFrame(result)
+        elif isinstance(result, SeriesWithInfo):
+            kind, value = 'series', pd.Series(result)
+        else:
+            kind = next((k for k, t in cls.__TYPES.items() if isinstance(result, t)), None)
+            if kind is None:
+                return None
+            value = result.raw_value
+        return kind, value, result.unit, result.error, result.request_id
+
+    @classmethod
+    def _decode(cls, risk_key: RiskKey, encoded: tuple) -> CacheResult:
+        kind, value, unit, error, request_id = encoded
+        if kind == 'frame':
+            return DataFrameWithInfo(value, risk_key=risk_key, unit=unit, error=error, request_id=request_id)
+        if kind == 'series':
+            return SeriesWithInfo(value, risk_key=risk_key, unit=unit, error=error, request_id=request_id)
+        return cls.__TYPES[kind](risk_key, value, unit=unit, error=error, request_id=request_id)
+
+    def get(self, risk_key: RiskKey, instrument: InstrumentBase) -> Optional[CacheResult]:
+        result = self.__memory.get(risk_key, instrument)
+        if result is None and isinstance(risk_key.market, CloseMarket):
+            encoded = self.__store.get(None, self._persistent_key(risk_key, instrument))
+            if encoded is not None:
+                result = self._decode(risk_key, encoded)
+                self.__memory.put(risk_key, instrument, result)
+        return result
+
+    def put(self, risk_key: RiskKey, instrument: InstrumentBase, result: CacheResult):
+        self.__memory.put(risk_key, instrument, result)
+        if is_cacheable(risk_key, result) and isinstance(risk_key.market, CloseMarket):
+            encoded = self._encode(result)
+            if encoded is not None:
+                self.__store.put(None, self._persistent_key(risk_key, instrument), encoded)
+
+    def drop(self, instrument: InstrumentBase):
+        self.__memory.drop(instrument)
+
+    def clear(self):
+        self.__memory.clear()
+        self.__store.clear()
+
+    @property
+    def stats(self) -> PricingCacheStats:
+        """Statistics of the memory cache, with lookups served from disk counted as hits"""
+        stats = self.__memory.stats
+        disk_hits = self.__store.stats[CacheEvent.GET]
+        # results read from disk are put in memory, which is not counted as a put
+        return stats._replace(hits=stats.hits + disk_hits, misses=stats.misses - disk_hits, puts=stats.puts - disk_hits)
@@ -0,0 +1,215 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+_INSTRUMENT = '_instrument'
+
+Block = Tuple[Union[int, np.ndarray], int, Mapping[str, Any]]
+
+
+def _is_numeric(values: Any) -> bool:
+    return isinstance(values, np.ndarray) and values.dtype.kind in 'biuf'
+
+
+def column_values(column: Union[pd.Series, pd.Index]) -> np.ndarray:
+    """Values of a column as a numeric array, or an object array of python or pandas scalars"""
+    return column.to_numpy() if column.dtype.kind in 'biuf' else column.to_numpy(dtype=object)
+
+
+def _concat_column(pieces: List[Tuple[int, Any]], block_rows: Mapping[int, int], total_rows: int) -> np.ndarray:
+    """Concatenate the pieces of a column, given as (first row, values), with missing rows as NaN"""
+    if all(_is_numeric(v) for _, v in pieces) and sum(len(v) for _, v in pieces) == total_rows:
+        return np.concatenate([v for _, v in pieces]) if pieces else np.full(total_rows, np.nan)
+
+    numeric = all(_is_numeric(v) or (isinstance(v, (int, float)) and not isinstance(v, bool)) for _, v in pieces)
+    column = np.full(total_rows, np.nan, dtype=float if numeric else object)
+    for start, values in pieces:
+        length = block_rows[start]
+        if not isinstance(values, np.ndarray) and not numeric:
+            # fill rather than assign, so that tuples and other sequences are kept as single values
+            values, shared = np.empty(length, dtype=object), values
+            values.fill(shared)
+        column[start : start + length] = values
+    return column
+
+
+class ColumnarRiskResult:
+    """
+    Risk results for many instruments held as column arrays
+
+    Each row holds one value, with the instrument it belongs to and its coordinates (risk measure, scenario, date and
+    bucket columns such as mkt_type or mkt_point). Instruments and non-numeric coordinates are dictionary encoded, so
+    selecting, aggregating and pivoting are array operations rather than walks over result objects.
+
+    :param data: frame with an instrument code column and a column per coordinate and value, with non-numeric
+        coordinates as categoricals
+    :param labels: frame of instrument labels (portfolio and instrument names), indexed by instrument code
+    :param paths: portfolio path of each instrument code
+
+    **Examples**
+
+    >>> from gs_quant.markets.portfolio import Portfolio
+    >>> from gs_quant.risk import IRDelta
+    >>>
+    >>> delta = Portfolio(swaps).calc(IRDelta).to_columnar()
+    >>> delta.filter(dates=[dt.date(2023, 1, 2)]).aggregate(['mkt_type', 'mkt_asset'])
+    """
+
+    def __init__(self, data: pd.DataFrame, labels: pd.DataFrame, paths: Sequence = ()):
+        self.__data = data
+        self.__labels = labels
+        self.__paths = tuple(paths)
+
+    @classmethod
+    def from_blocks(
+        cls, blocks: Iterable[Block], labels: Sequence[Mapping[str, Any]], paths: Sequence = ()
+    ) -> 'ColumnarRiskResult':
+        """
+        Build from blocks of rows
+
+        :param blocks: (instrument code, number of rows, columns) for each block of rows, where the instrument code is
+            one for all the rows or an array of a code per row, and each column is an array of values for the rows or a
+            single value shared by all of them, in the order the columns first appear
+        :param labels: labels of each instrument code
+        :param paths: portfolio path of each instrument code
+        :return: columnar result
+        """
+        pieces: Dict[str, List[Tuple[int, Any]]] = {}
+        instruments, block_rows, total_rows = [], {}, 0
+        for instrument, length, columns in blocks:
+            if isinstance(instrument, np.ndarray):
+                instruments.append(instrument.astype(np.int32, copy=False))
+            else:
+                instruments.append(np.full(length, instrument, dtype=np.int32))
+            block_rows[total_rows] = length
+            for name, values in columns.items():
+                pieces.setdefault(name, []).append((total_rows, values))
+            total_rows += length
+
+        data = {_INSTRUMENT: np.concatenate(instruments) if instruments else np.empty(0, dtype=np.int32)}
+        for name, column_pieces in pieces.items():
+            column = _concat_column(column_pieces, block_rows, total_rows)
+            if column.dtype == object:
+                inferred = pd.Series(column, dtype=object).infer_objects()
+                if inferred.dtype != object and not isinstance(inferred.dtype, pd.StringDtype):
+                    column = inferred.values
+                elif name != 'value':
+                    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+                    column = pd.Categorical.from_codes(codes, categories=pd.Index(uniques, dtype=object))
+            data[name] = column
+
+        return cls(pd.DataFrame(data), pd.DataFrame.from_records(list(labels)), paths)
+
+    def __len__(self):
+        return len(self.__data)
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Encoded rows, with instrument codes and categorical coordinates"""
+        return self.__data
+
+    @property
+    def labels(self) -> pd.DataFrame:
+        """Instrument labels, indexed by instrument code"""
+        return self.__labels
+
+    @property
+    def paths(self) -> tuple:
+        """Portfolio path of each instrument code"""
+        return self.__paths
+
+    @property
+    def coordinates(self) -> Tuple[str, ...]:
+        """Names of the coordinate columns"""
+        return tuple(c for c in self.__data.columns if c not in (_INSTRUMENT, 'value'))
+
+    def __select(self, mask: np.ndarray) -> 'ColumnarRiskResult':
+        return ColumnarRiskResult(self.__data.loc[mask].reset_index(drop=True), self.__labels, self.__paths)
+
+    def __isin(self, column: str, values: Iterable) -> np.ndarray:
+        column = self.__data[column]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            indexer = column.cat.categories.get_indexer(list(values))
+            return np.isin(column.cat.codes.values, indexer[indexer >= 0])
+        return column.isin(list(values)).values
+
+    def filter(
+        self,
+        risk_measures: Optional[Iterable] = None,
+        dates: Optional[Iterable] = None,
+        paths: Optional[Iterable] = None,
+        **coordinates: Iterable,
+    ) -> 'ColumnarRiskResult':
+        """
+        Select rows by coordinate values
+
+        :param risk_measures: risk measures to keep
+        :param dates: dates to keep
+        :param paths: portfolio paths of the instruments to keep
+        :param coordinates: values to keep by coordinate name, e.g. mkt_type=['IR']
+        :return: columnar result with the selected rows
+        """
+        mask = np.ones(len(self.__data), dtype=bool)
+        if risk_measures is not None:
+            mask &= self.__isin('risk_measure', risk_measures)
+        if dates is not None:
+            mask &= self.__isin('dates', dates)
+        if paths is not None:
+            wanted = set(paths)
+            codes = [i for i, p in enumerate(self.__paths) if p in wanted]
+            mask &= np.isin(self.__data[_INSTRUMENT].values, codes)
+        for name, values in coordinates.items():
+            mask &= self.__isin(name, values)
+        return self.__select(mask)
+
+    def aggregate(
+        self, by: Union[str, Iterable[str]] = (), aggfunc: str = 'sum', skipna: bool = True
+    ) -> Union[float, pd.Series]:
+        """
+        Aggregate values over instruments
+
+        :param by: coordinates to group by, e.g. ('mkt_type', 'mkt_asset', 'mkt_class', 'mkt_point')
+        :param aggfunc: aggregation function (defaults to sum)
+        :param skipna: leave out missing values, rather than giving a missing aggregate
+        :return: aggregated value, or series of aggregated values indexed by the coordinates
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        values = pd.to_numeric(self.__data['value'], errors='coerce')
+        kwargs = {} if skipna else {'skipna': False}
+        if not by:
+            return values.agg(aggfunc, **kwargs)
+        grouped = values.groupby([self.__data[c] for c in by], observed=True, sort=False, dropna=False)
+        return grouped.agg(aggfunc, **kwargs)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Decoded rows with instrument labels, as PortfolioRiskResult.to_frame(None, None, None) before sorting columns
+        """
+        codes = self.__data[_INSTRUMENT].values
+        labels = self.__labels.take(codes).reset_index(drop=True) if len(self.__labels.columns) else pd.DataFrame()
+        columns = {}
+        for name in self.__data.columns:
+            if name == _INSTRUMENT:
+                continue
+            column = self.__data[name]
+            if isinstance(column.dtype, pd.CategoricalDtype) or column.dtype == object:
+                column = pd.Series(np.asarray(column, dtype=object)).infer_objects()
+            columns[name] = column
+        return pd.concat([labels, pd.DataFrame(columns)], axis=1)
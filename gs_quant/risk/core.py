@@ -20,8 +20,9 @@ from abc import ABCMeta, abstractmethod
 from concurrent.futures import Future
 from copy import copy
 from dataclasses import dataclass, fields
-from typing import Iterable, Optional, Union, Tuple, Dict, Callable, List
+from typing import Any, Iterable, Optional, Union, Tuple, Dict, Callable, List, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 from dataclasses_json import dataclass_json
 
@@ -513,6 +514,111 @@ class MQVSValidatorDefnsWithInfo(ResultInfo):
         return self.validators
 
 
+class RiskAggregator:
+    """
+    Incrementally combine the results of multiple InstrumentBase.calc() calls
+
+    Each result is folded into a running total, keyed by its coordinates (all columns other than value), as soon as it
+    is added. Only the distinct coordinates and their totals are held, rather than every result.
+
+    :param threshold: exclude values whose absolute value falls below this threshold
+    :param allow_heterogeneous_types: allow Series to be converted to DataFrames before aggregating
+
+    **Examples**
+
+    >>> from gs_quant.risk import IRDelta
+    >>>
+    >>> aggregator = RiskAggregator()
+    >>> for future in delta_futures:
+    >>>     aggregator.add(future)
+    >>>
+    >>> delta = aggregator.result()
+    """
+
+    def __init__(self, threshold: Optional[float] = None, allow_heterogeneous_types: bool = False):
+        self.__threshold = threshold
+        self.__allow_heterogeneous_types = allow_heterogeneous_types
+        self.__columns: List[str] = []
+        self.__index: Dict[tuple, int] = {}
+        self.__values = np.zeros(0)
+        self.__count = 0
+
+    def __rows_of(self, result_obj) -> Tuple[List[str], np.ndarray]:
+        if isinstance(result_obj, Future):
+            result_obj = result_obj.result()
+        if isinstance(result_obj, pd.Series) and self.__allow_heterogeneous_types:
+            df = pd.DataFrame(result_obj.raw_value).T
+        elif isinstance(result_obj, DataFrameWithInfo):
+            # read the values in place rather than copying the frame, as raw_value does
+            df = result_obj
+        else:
+            df = result_obj.raw_value
+
+        names, rows = list(df.columns), df.to_numpy(dtype=object)
+        if not df.empty and isinstance(df.index.values[0], dt.date):
+            names, rows = ['dates'] + names, np.column_stack((df.index.to_numpy(dtype=object), rows))
+
+        rows[pd.isna(rows)] = 0
+        return names, rows
+
+    def __add_columns(self, columns: List[str]):
+        # coordinates already held have no value for the new columns, which aggregate_risk has always treated as 0
+        padding = (0,) * len(columns)
+        self.__columns.extend(columns)
+        self.__index = {k + padding: i for k, i in self.__index.items()}
+
+    def add(self, result: Union[DataFrameWithInfo, SeriesWithInfo, Future]):
+        """
+        Fold a result into the running total
+
+        :param result: a Dataframe (or Series, if allowing heterogeneous types) or a Future returning one
+        """
+        names, rows = self.__rows_of(result)
+        self.__count += 1
+
+        new_columns = [c for c in names if c != 'value' and c not in self.__columns]
+        if new_columns:
+            self.__add_columns(new_columns)
+
+        positions = {c: i for i, c in enumerate(names)}
+        if names == self.__columns + ['value']:
+            coordinates = rows[:, :-1]
+        else:
+            coordinates = np.zeros((len(rows), len(self.__columns)), dtype=object)
+            for idx, column in enumerate(self.__columns):
+                if column in positions:
+                    coordinates[:, idx] = rows[:, positions[column]]
+
+        index = self.__index
+        codes = np.fromiter(
+            (index.setdefault(k, len(index)) for k in map(tuple, coordinates.tolist())), dtype=np.intp, count=len(rows)
+        )
+
+        if len(index) > len(self.__values):
+            self.__values = np.concatenate((self.__values, np.zeros(max(len(index), len(self.__values)))))
+        if 'value' in positions:
+            np.add.at(self.__values, codes, rows[:, positions['value']].astype(float))
+
+    def result(self) -> pd.DataFrame:
+        """
+        The aggregated results
+
+        :return: A Dataframe with the aggregated results
+        """
+        if not self.__count:
+            raise ValueError('No results to aggregate')
+
+        result = pd.DataFrame.from_records(list(self.__index), columns=self.__columns)
+        result['value'] = self.__values[: len(self.__index)]
+        # coordinates are distinct, so this orders them as grouping all of the results would
+        result = result.groupby(self.__columns, as_index=False).sum()
+
+        if self.__threshold is not None:
+            result = result[result.value.abs() > self.__threshold]
+
+        return sort_risk(result)
+
+
 def aggregate_risk(
     results: Iterable[Union[DataFrameWithInfo, Future]],
     threshold: Optional[float] = None,
@@ -546,25 +652,51 @@ def aggregate_risk(
     delta_f and vega_f are lists of futures, where the result will be a Dataframe
     delta and vega are Dataframes, representing the merged risk of the individual instruments
     """
+    aggregator = RiskAggregator(threshold=threshold, allow_heterogeneous_types=allow_heterogeneous_types)
+    for result in results:
+        aggregator.add(result)
 
-    def get_df(result_obj):
-        if isinstance(result_obj, Future):
-            result_obj = result_obj.result()
-        if isinstance(result_obj, pd.Series) and allow_heterogeneous_types:
-            return pd.DataFrame(result_obj.raw_value).T
-        return result_obj.raw_value
+    return aggregator.result()
 
-    dfs = [get_df(r) for r in results]
-    result = pd.concat(dfs).fillna(0)
-    result = result.groupby([c for c in result.columns if c != 'value'], as_index=False).sum()
 
-    if threshold is not None:
-        result = result[result.value.abs() > threshold]
+ResultType = Union[None, dict, tuple, DataFrameWithInfo, FloatWithInfo, SeriesWithInfo]
 
-    return sort_risk(result)
 
+def _check_aggregable(
+    result: ResultType,
+    first: ResultType,
+    risk_key: Optional[RiskKey],
+    unit,
+    allow_mismatch_risk_keys: bool,
+    allow_heterogeneous_types: bool,
+) -> Tuple[ResultType, Optional[RiskKey], Any]:
+    """Check that a result can be aggregated with those before it, returning the first result, risk key and unit"""
+    if isinstance(result, Exception):
+        raise Exception
+
+    if result.error:
+        raise ValueError('Cannot aggregate results in error')
+
+    first = result if first is None else first
+    if not allow_heterogeneous_types and not isinstance(result, type(first)):
+        raise ValueError(f'Cannot aggregate heterogeneous types: {type(result)} vs {type(first)}')
+
+    if result.unit:
+        if unit and unit != result.unit:
+            raise ValueError(f'Cannot aggregate results with different units for {result.risk_key.risk_measure}')
+
+        unit = unit or result.unit
+
+    # results of one request share their risk key, so only differing keys need comparing without historical diddles
+    if (
+        not allow_mismatch_risk_keys
+        and risk_key
+        and result.risk_key is not risk_key
+        and risk_key.ex_historical_diddle != result.risk_key.ex_historical_diddle
+    ):
+        raise ValueError('Cannot aggregate results with different pricing keys')
 
-ResultType = Union[None, dict, tuple, DataFrameWithInfo, FloatWithInfo, SeriesWithInfo]
+    return first, risk_key or result.risk_key, unit
 
 
 def aggregate_results(
@@ -572,50 +704,36 @@ def aggregate_results(
 ) -> ResultType:
     unit = None
     risk_key = None
-    results = tuple(results)
-
-    if not len(results):
-        return None
+    first = None
+    aggregator = None
+    others = []
 
     for result in results:
-        if isinstance(result, Exception):
-            raise Exception
-
-        if result.error:
-            raise ValueError('Cannot aggregate results in error')
-
-        if not allow_heterogeneous_types and not isinstance(result, type(results[0])):
-            raise ValueError(f'Cannot aggregate heterogeneous types: {type(result)} vs {type(results[0])}')
-
-        if result.unit:
-            if unit and unit != result.unit:
-                raise ValueError(f'Cannot aggregate results with different units for {result.risk_key.risk_measure}')
-
-            unit = unit or result.unit
-
-        if (
-            not allow_mismatch_risk_keys
-            and risk_key
-            and risk_key.ex_historical_diddle != result.risk_key.ex_historical_diddle
-        ):
-            raise ValueError('Cannot aggregate results with different pricing keys')
-
-        risk_key = risk_key or result.risk_key
-
-    inst = next(iter(results))
-    if isinstance(inst, dict):
-        return dict((k, aggregate_results([r[k] for r in results])) for k in inst.keys())
-    elif isinstance(inst, tuple):
-        return tuple(set(itertools.chain.from_iterable(results)))
-    elif isinstance(inst, FloatWithInfo):
-        return FloatWithInfo(risk_key, sum(results), unit=unit)
-    elif isinstance(inst, SeriesWithInfo):
-        return SeriesWithInfo(sum(results), risk_key=risk_key, unit=unit)
-    elif isinstance(inst, DataFrameWithInfo):
-        return DataFrameWithInfo(
-            aggregate_risk(results, allow_heterogeneous_types=allow_heterogeneous_types), risk_key=risk_key, unit=unit
+        first, risk_key, unit = _check_aggregable(
+            result, first, risk_key, unit, allow_mismatch_risk_keys, allow_heterogeneous_types
         )
 
+        # frames are folded in as they are visited, rather than held until all have been
+        if isinstance(first, DataFrameWithInfo):
+            aggregator = aggregator or RiskAggregator(allow_heterogeneous_types=allow_heterogeneous_types)
+            aggregator.add(result)
+        else:
+            others.append(result)
+
+    if first is None:
+        return None
+
+    if isinstance(first, dict):
+        return dict((k, aggregate_results([r[k] for r in others])) for k in first.keys())
+    elif isinstance(first, tuple):
+        return tuple(set(itertools.chain.from_iterable(others)))
+    elif isinstance(first, FloatWithInfo):
+        return FloatWithInfo(risk_key, sum(others), unit=unit)
+    elif isinstance(first, SeriesWithInfo):
+        return SeriesWithInfo(sum(others), risk_key=risk_key, unit=unit)
+    elif isinstance(first, DataFrameWithInfo):
+        return DataFrameWithInfo(aggregator.result(), risk_key=risk_key, unit=unit)
+
 
 def subtract_risk(left: DataFrameWithInfo, right: DataFrameWithInfo) -> pd.DataFrame:
     """Subtract bucketed risk. Dimensions must be identical
@@ -660,6 +778,52 @@ def sort_values(data: Iterable, columns: Tuple[str, ...], by: Tuple[str, ...]) -
     return sorted(data, key=cmp)
 
 
+def __column_ranks(values: Sequence, sort_fn: Optional[Callable[[any], Optional[float]]]) -> np.ndarray:
+    """Rank of each value in a column, with equal rank for values which compare equal"""
+    try:
+        distinct = list(dict.fromkeys(values))
+    except TypeError:
+        # unhashable values, such as lists, are ranked individually
+        distinct = None
+
+    items = distinct if distinct is not None else values
+    keys = [sort_fn(v) or 0 for v in items] if sort_fn else items
+    ranks = np.empty(len(keys), dtype=np.intp)
+    rank, previous = -1, None
+    for position, idx in enumerate(sorted(range(len(keys)), key=keys.__getitem__)):
+        if position == 0 or keys[idx] != previous:
+            rank, previous = rank + 1, keys[idx]
+        ranks[idx] = rank
+
+    if distinct is None:
+        return ranks
+
+    lookup = dict(zip(distinct, ranks.tolist()))
+    return np.fromiter(map(lookup.__getitem__, values), dtype=np.intp, count=len(values))
+
+
+def sort_order(columns: Mapping[str, Sequence], by: Tuple[str, ...]) -> np.ndarray:
+    """
+    Order of the rows of a set of columns, as sort_values would sort them
+
+    :param columns: columns of row values, by column name
+    :param by: columns to sort by
+    :return: indices of the rows in sorted order
+    """
+    names = tuple(columns)
+    num_rows = len(next(iter(columns.values()), ()))
+    keys = [c for c in by if c in columns]
+    if not keys:
+        return np.arange(num_rows)
+
+    try:
+        return np.lexsort([__column_ranks(columns[c], __column_sort_fns.get(c)) for c in reversed(keys)])
+    except TypeError:
+        # values of different types may only need comparing where all preceding columns are equal
+        rows = sort_values(zip(*columns.values(), range(num_rows)), names + (None,), by)
+        return np.fromiter((r[-1] for r in rows), dtype=np.intp, count=num_rows)
+
+
 def sort_risk(df: pd.DataFrame, by: Tuple[str, ...] = __risk_columns) -> pd.DataFrame:
     """
     Sort bucketed risk
@@ -16,7 +16,7 @@ under the License.
 
 import datetime as dt
 import logging
-from typing import Iterable, Optional, Union
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Union
 
 from gs_quant.base import InstrumentBase, RiskKey
 from gs_quant.common import RiskMeasure, AssetClass, RiskMeasureType
@@ -28,7 +28,7 @@ from .core import (
     FloatWithInfo,
     SeriesWithInfo,
     StringWithInfo,
-    sort_values,
+    sort_order,
     MQVSValidatorDefnsWithInfo,
     MQVSValidatorDefn,
     DictWithInfo,
@@ -37,30 +37,38 @@ from .core import (
 _logger = logging.getLogger(__name__)
 
 
-def __dataframe_handler(
-    result: Iterable, mappings: tuple, risk_key: RiskKey, request_id: Optional[str] = None
-) -> DataFrameWithInfo:
-    first_row = next(iter(result), None)
-    if first_row is None:
-        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
+def __columns(rows: Sequence[dict], overrides: Optional[Mapping[str, Sequence]] = None) -> Dict[str, Sequence]:
+    """
+    Transpose rows of a payload into columns of values by field, ordered by the fields of the first row
+
+    Columns in overrides replace (or follow) those of the rows, as if each row were updated with its override values
+    """
+    overrides = overrides or {}
+    fields = list(rows[0].keys()) + [f for f in overrides if f not in rows[0]]
+    return {f: overrides[f] if f in overrides else [r.get(f) for r in rows] for f in fields}
 
-    columns = ()
-    indices = [False] * len(first_row.keys())
-    mappings_lookup = {v: k for k, v in mappings}
 
-    for idx, src in enumerate(first_row.keys()):
-        if src in mappings_lookup:
-            indices[idx] = True
-            columns += ((mappings_lookup[src]),)
+def __columns_handler(
+    columns: Mapping[str, Sequence], mappings: tuple, risk_key: RiskKey, request_id: Optional[str] = None
+) -> DataFrameWithInfo:
+    mappings_lookup = {v: k for k, v in mappings}
+    data = {mappings_lookup[src]: values for src, values in columns.items() if src in mappings_lookup}
+    if not data:
+        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
 
-    records = tuple(
-        sort_values((tuple(v for i, v in enumerate(r.values()) if indices[i]) for r in result), columns, columns)
+    order = sort_order(data, tuple(data)).tolist()
+    return DataFrameWithInfo(
+        {name: [values[i] for i in order] for name, values in data.items()}, risk_key=risk_key, request_id=request_id
     )
 
-    df = DataFrameWithInfo(records, risk_key=risk_key, request_id=request_id)
-    df.columns = columns
 
-    return df
+def __dataframe_handler(
+    result: Sequence, mappings: tuple, risk_key: RiskKey, request_id: Optional[str] = None
+) -> DataFrameWithInfo:
+    if not result:
+        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
+
+    return __columns_handler(__columns(result), mappings, risk_key, request_id=request_id)
 
 
 def __dataframe_handler_unsorted(
@@ -79,6 +87,11 @@ def __dataframe_handler_unsorted(
     return df
 
 
+def __joined_points(rows: Iterable[dict], field: str = 'point') -> list:
+    points = (r.get(field, '') for r in rows)
+    return [';'.join(p) if isinstance(p, list) else p for p in points]
+
+
 def cashflows_handler(
     result: dict, risk_key: RiskKey, _instrument: InstrumentBase, request_id: Optional[str] = None
 ) -> DataFrameWithInfo:
@@ -177,30 +190,28 @@ def risk_by_class_handler(
             risk_key, sum(result.get('values', (float('nan'),))), unit=result.get('unit'), request_id=request_id
         )
     else:
-        classes = []
-        skip = []
+        values = list(result['values'])
+        kept = []
 
-        crosses_idx = next((i for i, c in enumerate(result['classes']) if c['type'] == 'CROSSES'), None)
-        for idx, (clazz, value) in enumerate(zip(result['classes'], result['values'])):
-            mkt_type = clazz['type']
+        crosses_idx = next((i for i, t in enumerate(types) if t == 'CROSSES'), None)
+        for idx, (mkt_type, value) in enumerate(zip(types, result['values'])):
             if 'SPIKE' in mkt_type or 'JUMP' in mkt_type:
-                skip.append(idx)
-
                 if crosses_idx is not None:
-                    result['classes'][crosses_idx]['value'] += value
-
-            clazz.update({'value': value})
-
-        for idx, clazz in enumerate(result['classes']):
-            if idx not in skip:
-                classes.append(clazz)
+                    values[crosses_idx] += value
+            else:
+                kept.append(idx)
 
         mappings = (('mkt_type', 'type'), ('mkt_asset', 'asset'), ('value', 'value'))
+        classes = [result['classes'][i] for i in kept]
 
         if isinstance(risk_key.risk_measure, PnlExplain):
+            classes = [{**c, 'value': values[i]} for i, c in zip(kept, classes)]
             return __dataframe_handler_unsorted(classes, mappings, (), risk_key, request_id=request_id)
+        elif not classes:
+            return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
         else:
-            return __dataframe_handler(classes, mappings, risk_key, request_id=request_id)
+            columns = __columns(classes, {'value': [values[i] for i in kept]})
+            return __columns_handler(columns, mappings, risk_key, request_id=request_id)
 
 
 def risk_vector_handler(
@@ -211,9 +222,6 @@ def risk_vector_handler(
     if len(assets) == 1 and risk_key.risk_measure.name.startswith('Eq'):
         return FloatWithInfo(risk_key, assets[0], request_id=request_id)
 
-    for points, value in zip(result['points'], assets):
-        points.update({'value': value})
-
     mappings = (
         ('mkt_type', 'type'),
         ('mkt_asset', 'asset'),
@@ -222,7 +230,10 @@ def risk_vector_handler(
         ('mkt_quoting_style', 'quoteStyle'),
         ('value', 'value'),
     )
-    return __dataframe_handler(result['points'], mappings, risk_key, request_id=request_id)
+    if not assets:
+        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
+
+    return __columns_handler(__columns(result['points'], {'value': assets}), mappings, risk_key, request_id=request_id)
 
 
 def fixing_table_handler(
@@ -354,14 +365,19 @@ def mdapi_second_order_table_handler(
 def mdapi_table_handler(
     result: dict, risk_key: RiskKey, _instrument: InstrumentBase, request_id: Optional[str] = None
 ) -> DataFrameWithInfo:
-    coordinates = []
-    for r in result['rows']:
-        raw_point = r['coordinate'].get('point', '')
-        point = ';'.join(raw_point) if isinstance(raw_point, list) else raw_point
-        r['coordinate'].update({'point': point})
-        r['coordinate'].update({'value': r.get('value', None)})
-        r['coordinate'].update({'permissions': r['permissions']})
-        coordinates.append(r['coordinate'])
+    rows = result['rows']
+    if not rows:
+        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
+
+    coordinates = [r['coordinate'] for r in rows]
+    columns = __columns(
+        coordinates,
+        {
+            'point': __joined_points(coordinates),
+            'value': [r.get('value', None) for r in rows],
+            'permissions': [r['permissions'] for r in rows],
+        },
+    )
 
     mappings = (
         ('mkt_type', 'type'),
@@ -373,26 +389,27 @@ def mdapi_table_handler(
         ('permissions', 'permissions'),
     )
 
-    return __dataframe_handler(coordinates, mappings, risk_key, request_id=request_id)
+    return __columns_handler(columns, mappings, risk_key, request_id=request_id)
 
 
 def mmapi_table_handler(
     result: dict, risk_key: RiskKey, _instrument: InstrumentBase, request_id: Optional[str] = None
 ) -> DataFrameWithInfo:
-    coordinates = []
-    for r in result['rows']:
-        raw_point = r['modelCoordinate'].get('point', '')
-        point = ';'.join(raw_point) if isinstance(raw_point, list) else raw_point
-        r['modelCoordinate'].update({'point': point})
-        raw_tags = r['modelCoordinate'].get('tags', '')
-        tags = ';'.join(raw_tags) if isinstance(raw_tags, list) else raw_tags
-        r['modelCoordinate'].update({'tags': tags})
-        rows = r['value'].get('value', '')
-        DataPoints = []
-        for row in rows:
-            DataPoints.append([dt.date.fromisoformat(row["date"]), row["value"]])
-        r['modelCoordinate'].update({'value': DataPoints})
-        coordinates.append(r['modelCoordinate'])
+    rows = result['rows']
+    if not rows:
+        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
+
+    coordinates = [r['modelCoordinate'] for r in rows]
+    columns = __columns(
+        coordinates,
+        {
+            'point': __joined_points(coordinates),
+            'tags': __joined_points(coordinates, 'tags'),
+            'value': [
+                [[dt.date.fromisoformat(p["date"]), p["value"]] for p in r['value'].get('value', '')] for r in rows
+            ],
+        },
+    )
 
     mappings = (
         ('mkt_type', 'type'),
@@ -403,27 +420,21 @@ def mmapi_table_handler(
         ('value', 'value'),
     )
 
-    return __dataframe_handler(coordinates, mappings, risk_key, request_id=request_id)
+    return __columns_handler(columns, mappings, risk_key, request_id=request_id)
 
 
 def mmapi_pca_table_handler(
     result: dict, risk_key: RiskKey, _instrument: InstrumentBase, request_id: Optional[str] = None
 ) -> DataFrameWithInfo:
-    coordinates = []
-    for r in result['rows']:
-        raw_point = r['coordinate'].get('point', '')
-        point = ';'.join(raw_point) if isinstance(raw_point, list) else raw_point
-        r['coordinate'].update({'point': point})
-        r['coordinate'].update({'value': r['value']})
-        r['coordinate'].update({'layer1': r['layer1']})
-        r['coordinate'].update({'layer2': r['layer2']})
-        r['coordinate'].update({'layer3': r['layer3']})
-        r['coordinate'].update({'layer4': r['layer4']})
-        r['coordinate'].update({'level': r['level']})
-        r['coordinate'].update({'sensitivity': r['sensitivity']})
-        r['coordinate'].update({'irDelta': r['irDelta']})
-        r['coordinate'].update({'endDate': r['endDate']})
-        coordinates.append(r['coordinate'])
+    rows = result['rows']
+    if not rows:
+        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
+
+    coordinates = [r['coordinate'] for r in rows]
+    fields = ('value', 'layer1', 'layer2', 'layer3', 'layer4', 'level', 'sensitivity', 'irDelta', 'endDate')
+    columns = __columns(
+        coordinates, {'point': __joined_points(coordinates), **{f: [r[f] for r in rows] for f in fields}}
+    )
 
     mappings = (
         ('mkt_type', 'type'),
@@ -442,21 +453,21 @@ def mmapi_pca_table_handler(
         ('endDate', 'endDate'),
     )
 
-    return __dataframe_handler(coordinates, mappings, risk_key, request_id=request_id)
+    return __columns_handler(columns, mappings, risk_key, request_id=request_id)
 
 
 def mmapi_pca_hedge_table_handler(
     result: dict, risk_key: RiskKey, _instrument: InstrumentBase, request_id: Optional[str] = None
 ) -> DataFrameWithInfo:
-    coordinates = []
-    for r in result['rows']:
-        raw_point = r['coordinate'].get('point', '')
-        point = ';'.join(raw_point) if isinstance(raw_point, list) else raw_point
-        r['coordinate'].update({'point': point})
-        r['coordinate'].update({'size': r.get('size')})
-        r['coordinate'].update({'fixedRate': r.get('fixedRate')})
-        r['coordinate'].update({'irDelta': r.get('irDelta')})
-        coordinates.append(r['coordinate'])
+    rows = result['rows']
+    if not rows:
+        return DataFrameWithInfo(risk_key=risk_key, request_id=request_id)
+
+    coordinates = [r['coordinate'] for r in rows]
+    fields = ('size', 'fixedRate', 'irDelta')
+    columns = __columns(
+        coordinates, {'point': __joined_points(coordinates), **{f: [r.get(f) for r in rows] for f in fields}}
+    )
     mappings = (
         ('mkt_type', 'type'),
         ('mkt_asset', 'asset'),
@@ -468,7 +479,7 @@ def mmapi_pca_hedge_table_handler(
         ('irDelta', 'irDelta'),
     )
 
-    return __dataframe_handler(coordinates, mappings, risk_key, request_id=request_id)
+    return __columns_handler(columns, mappings, risk_key, request_id=request_id)
 
 
 def mqvs_validators_handler(
@@ -18,14 +18,18 @@ import copy
 import datetime as dt
 import logging
 import operator as op
+import threading
 import weakref
 from concurrent.futures import Future
 from itertools import chain
-from typing import Any, Iterable, Mapping, Optional, Tuple, Union
+from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from more_itertools import unique_everseen
 
+import gs_quant
+
 from gs_quant.base import Priceable, RiskKey, Sentinel, InstrumentBase, is_instance_or_iterable, is_iterable, Scenario
 from gs_quant.common import RiskMeasure
 from gs_quant.config import DisplayOptions
@@ -37,8 +41,11 @@ from gs_quant.risk import (
     SeriesWithInfo,
     ResultInfo,
     ScalarWithInfo,
+    RiskAggregator,
     aggregate_results,
 )
+from gs_quant.risk.columnar import Block, ColumnarRiskResult, column_values
+from gs_quant.risk.core import _check_aggregable
 from gs_quant.risk.transform import Transformer
 
 _logger = logging.getLogger(__name__)
@@ -204,6 +211,99 @@ def _value_for_measure_or_scen(res: dict, item: Union[Iterable, RiskMeasure, Sce
     return result
 
 
+def _show_na(display_options: Optional[DisplayOptions]) -> bool:
+    if display_options is not None and not isinstance(display_options, DisplayOptions):
+        raise TypeError("display_options must be of type DisplayOptions")
+
+    options = display_options if display_options is not None else gs_quant.config.display_options
+    return options.show_na
+
+
+def _result_blocks(result, code: int, display_options: Optional[DisplayOptions], trailing: Optional[dict] = None):
+    """
+    Blocks of rows for ColumnarRiskResult, holding the values result._to_records() would produce records for
+
+    Frames which are not empty are yielded as (code, frame, trailing columns), to be read by _columnar_blocks
+    """
+    trailing = trailing or {}
+    if isinstance(result, MultipleRiskMeasureResult):
+        for rm in result:
+            yield from _result_blocks(result[rm], code, display_options, {'risk_measure': rm, **trailing})
+    elif isinstance(result, MultipleScenarioResult):
+        for scen in result:
+            yield from _result_blocks(result[scen], code, display_options, {'scenario': scen, **trailing})
+    elif isinstance(result, ErrorValue) or (isinstance(result, UnsupportedValue) and _show_na(display_options)):
+        yield code, 1, {'value': result, **trailing}
+    elif isinstance(result, FloatWithInfo):
+        yield code, 1, {'value': float(result), **trailing}
+    elif isinstance(result, ScalarWithInfo):
+        yield code, 1, {'value': result, **trailing}
+    elif isinstance(result, SeriesWithInfo):
+        yield code, len(result), {'dates': column_values(result.index), 'value': column_values(result), **trailing}
+    elif isinstance(result, DataFrameWithInfo):
+        if result.empty:
+            if _show_na(display_options):
+                yield code, 1, {'value': None, **trailing}
+        else:
+            yield code, result, trailing
+    elif not isinstance(result, UnsupportedValue):
+        for record in result._to_records({}, display_options):
+            yield code, 1, {**record, **trailing}
+
+
+def _has_dates(frame: pd.DataFrame) -> bool:
+    # as DataFrameWithInfo.raw_value, which moves a date index into a dates column
+    return isinstance(frame.index.values[0], dt.date)
+
+
+def _frame_block(frames: Sequence[Tuple[int, DataFrameWithInfo, dict]]) -> Block:
+    """One block of the rows of consecutive frames, read from a single concatenation rather than frame by frame"""
+    lengths = np.fromiter((len(frame) for _, frame, _ in frames), dtype=np.intp, count=len(frames))
+    data = pd.concat([frame for _, frame, _ in frames], sort=False) if len(frames) > 1 else frames[0][1]
+    columns = {'dates': column_values(data.index)} if _has_dates(data) else {}
+    columns.update((c, column_values(data[c])) for c in data.columns)
+    for name in unique_everseen(chain.from_iterable(trailing for _, _, trailing in frames)):
+        values = [trailing.get(name, np.nan) for _, _, trailing in frames]
+        if all(v is values[0] for v in values):
+            columns[name] = values[0]
+        else:
+            # filled one by one, so that tuples and other sequences are kept as single values
+            by_frame = np.empty(len(values), dtype=object)
+            for idx, value in enumerate(values):
+                by_frame[idx] = value
+            columns[name] = np.repeat(by_frame, lengths)
+    codes = np.repeat(np.fromiter((code for code, _, _ in frames), dtype=np.int32, count=len(frames)), lengths)
+    return codes, int(lengths.sum()), columns
+
+
+def _columnar_blocks(leaves: Iterable[Any], display_options: Optional[DisplayOptions]) -> Iterable[Block]:
+    """Blocks of rows for ColumnarRiskResult of the leaf result of each instrument code, in order"""
+    frames = []
+    for code, leaf in enumerate(leaves):
+        for block in _result_blocks(leaf, code, display_options):
+            if isinstance(block[1], DataFrameWithInfo):
+                if frames and _has_dates(frames[0][1]) != _has_dates(block[1]):
+                    yield _frame_block(frames)
+                    frames = []
+                frames.append(block)
+            else:
+                if frames:
+                    yield _frame_block(frames)
+                    frames = []
+                yield block
+    if frames:
+        yield _frame_block(frames)
+
+
+def _sums_by_column(results: Sequence) -> bool:
+    """Whether results are all values, or all bucketed frames, which can be aggregated over column arrays"""
+    if not results:
+        return False
+    return all(isinstance(r, FloatWithInfo) for r in results) or all(
+        isinstance(r, DataFrameWithInfo) and 'value' in r.columns and len(r.columns) > 1 for r in results
+    )
+
+
 class PricingFuture(Future):
     __RESULT_SENTINEL = Sentinel('PricingFuture')
 
@@ -256,6 +356,22 @@ class PricingFuture(Future):
 
         return super().result(timeout=timeout)
 
+    def __getstate__(self):
+        # only the outcome of a future is kept, so results can be pickled but requests in flight cannot
+        if not self.done():
+            raise TypeError(f'cannot pickle {self.__class__.__name__} which is not done')
+        state = self.__dict__.copy()
+        for name in ('_condition', '_waiters', '_done_callbacks'):
+            state.pop(name, None)
+        state['_PricingFuture__pricing_context'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._condition = threading.Condition()
+        self._waiters = []
+        self._done_callbacks = []
+
 
 class CompositeResultFuture(PricingFuture):
     def __init__(self, futures: Iterable[PricingFuture]):
@@ -841,13 +957,30 @@ class PortfolioRiskResult(CompositeResultFuture):
     ) -> Union[float, pd.DataFrame, pd.Series, MultipleRiskMeasureResult]:
         if len(self.__risk_measures) > 1:
             return MultipleRiskMeasureResult(self.portfolio, ((r, self[r].aggregate()) for r in self.__risk_measures))
-        else:
+        results = [self.__result(p) for p in self.__portfolio.all_paths]
+        if not _sums_by_column(results):
             return aggregate_results(
-                self.__results(),
+                results,
                 allow_mismatch_risk_keys=allow_mismatch_risk_keys,
                 allow_heterogeneous_types=allow_heterogeneous_types,
             )
 
+        # values and bucketed results are summed over column arrays rather than result by result
+        first, risk_key, unit = None, None, None
+        for result in results:
+            first, risk_key, unit = _check_aggregable(
+                result, first, risk_key, unit, allow_mismatch_risk_keys, allow_heterogeneous_types
+            )
+        columnar = ColumnarRiskResult.from_blocks(_columnar_blocks(results, None), ())
+        if isinstance(first, FloatWithInfo):
+            return FloatWithInfo(risk_key, columnar.aggregate(skipna=False), unit=unit)
+
+        totals = columnar.aggregate(columnar.coordinates).reset_index()
+        # the distinct coordinates are combined and ordered as aggregate_results does
+        aggregator = RiskAggregator()
+        aggregator.add(DataFrameWithInfo(totals[[*columnar.coordinates, 'value']]))
+        return DataFrameWithInfo(aggregator.result(), risk_key=risk_key, unit=unit)
+
     def _to_records(self, display_options: DisplayOptions = None):
         def get_records(rec):
             temp = []
@@ -870,6 +1003,31 @@ class PortfolioRiskResult(CompositeResultFuture):
                 records.extend(future_records[i]._to_records({**portfolio_records[i]}, display_options))
         return records
 
+    def to_columnar(self, display_options: DisplayOptions = None) -> Optional[ColumnarRiskResult]:
+        """
+        Results as column arrays, with instruments and coordinates dictionary encoded
+
+        :param display_options: options for results which are not available
+        :return: columnar results, or None if the results do not correspond to the instruments of the portfolio
+        """
+
+        def leaf_results(result, path):
+            for idx, future in enumerate(result.futures):
+                value = future.result()
+                child = path + PortfolioPath(idx) if path is not None else PortfolioPath(idx)
+                if isinstance(value, (ResultInfo, MultipleRiskMeasureResult, MultipleScenarioResult)):
+                    yield child, value
+                else:
+                    yield from leaf_results(value, child)
+
+        leaves = tuple(leaf_results(self, None))
+        labels = self.__portfolio._to_records()
+        if len(leaves) != len(labels):
+            return None
+
+        blocks = _columnar_blocks((value for _, value in leaves), display_options)
+        return ColumnarRiskResult.from_blocks(blocks, labels, [path for path, _ in leaves])
+
     def to_frame(
         self,
         values='default',
@@ -878,9 +1036,14 @@ class PortfolioRiskResult(CompositeResultFuture):
         aggfunc="sum",
         display_options: DisplayOptions = None,
     ):
-        final_records = self._to_records(display_options=display_options)
-        if len(final_records) > 0:
-            ori_df = pd.DataFrame.from_records(final_records)
+        columnar = self.to_columnar(display_options=display_options)
+        if columnar is not None:
+            ori_df = columnar.to_frame() if len(columnar) > 0 else None
+        else:
+            final_records = self._to_records(display_options=display_options)
+            ori_df = pd.DataFrame.from_records(final_records) if len(final_records) > 0 else None
+
+        if ori_df is not None:
             if 'risk_measure' not in ori_df.columns.values:
                 ori_df['risk_measure'] = self.risk_measures[0]
         else:
@@ -20,6 +20,7 @@ import itertools
 import json
 import logging
 import os
+import re
 import ssl
 import sys
 from abc import abstractmethod
@@ -298,6 +299,15 @@ class _AsyncSessionAPI:
 
 class GsSession(ContextBase):
     __config = None
+    # POSTs to these paths ask for MessagePack responses, falling back to JSON, unless the caller sets Accept
+    USE_MSGPACK = True
+    MSGPACK_RESPONSE_PATHS = re.compile(r'/data/[^/]+/query|/data/measures|/risk/calculate(/bulk)?')
+    MSGPACK_ACCEPT = 'application/x-msgpack, application/json;q=0.9'
+    # Connection pool shared by all async requests made through the session.  HTTP/2 multiplexes concurrent requests
+    # over one connection per host and needs the h2 package (pip install httpx[http2])
+    ASYNC_MAX_CONNECTIONS = 100
+    ASYNC_MAX_CONNECTIONS_PER_HOST = None
+    ASYNC_HTTP2 = False
 
     class Scopes(Enum):
         READ_CONTENT = 'read_content'
@@ -335,6 +345,7 @@ class GsSession(ContextBase):
         super().__init__()
         self._session = None
         self._session_async = None
+        self._async_host_limits = {}
         self._sync_api: Optional['_SyncSessionAPI'] = None
         self._async_api: Optional['_AsyncSessionAPI'] = None
         self.domain = domain
@@ -401,11 +412,27 @@ class GsSession(ContextBase):
                 verify=CustomHttpAdapter.ssl_context(),
                 mounts=self.mounts,
                 timeout=DEFAULT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.ASYNC_MAX_CONNECTIONS, max_keepalive_connections=self.ASYNC_MAX_CONNECTIONS
+                ),
+                http2=self.ASYNC_HTTP2,
             )
+            self._async_host_limits = {}
             self._session_async.headers.update({'X-Application': self.application})
             self._session_async.headers.update({'X-Version': self.application_version})
             self._authenticate_async()
 
+    def _async_host_limit(self, url: str):
+        """Bound the requests in flight to one host, as httpx only limits connections across the whole pool"""
+        if not self.ASYNC_MAX_CONNECTIONS_PER_HOST:
+            return nullcontext()
+        # semaphores are tied to the event loop of the client they were created with, so live as long as it does
+        host = httpx.URL(url).host
+        limit = self._async_host_limits.get(host)
+        if limit is None:
+            limit = self._async_host_limits[host] = asyncio.Semaphore(self.ASYNC_MAX_CONNECTIONS_PER_HOST)
+        return limit
+
     async def _on_aenter(self):
         self.__close_on_exit = self._session is None
         self.__close_on_exit_async = not self._has_async_session()
@@ -541,6 +568,12 @@ class GsSession(ContextBase):
             use_msgpack = headers.get('Content-Type') == 'application/x-msgpack'
             if use_msgpack:
                 headers['Accept'] = headers.get('Content-Type')
+            elif (
+                self.USE_MSGPACK
+                and not (request_headers and 'Accept' in request_headers)
+                and self.MSGPACK_RESPONSE_PATHS.fullmatch(path)
+            ):
+                headers['Accept'] = self.MSGPACK_ACCEPT
             kwargs['headers'] = headers
 
             if is_dataframe or payload:
@@ -563,7 +596,7 @@ class GsSession(ContextBase):
             err_msg = reason if response.headers.get('Content-Type') == 'text/html' else f'{reason}: {response.text}'
             raise error_builder(response.status_code, err_msg, context=f'{request_id}: {method} {url}')
         elif 'Content-Type' in response.headers:
-            if 'application/x-msgpack' in response.headers['Content-Type']:
+            if 'msgpack' in response.headers['Content-Type']:
                 ret = msgpack.unpackb(response.content, raw=False, strict_map_key=False)
             elif 'application/json' in response.headers['Content-Type']:
                 ret = json.loads(response.text)
@@ -656,7 +689,8 @@ class GsSession(ContextBase):
             kwargs = self._build_request_params(
                 method, path, url, payload, request_headers, timeout, use_body, "content", scope
             )
-            response = await self._session_async.request(method, url, **kwargs)
+            async with self._async_host_limit(url):
+                response = await self._session_async.request(method, url, **kwargs)
             request_id = response.headers.get('x-dash-requestid')
             if scope:
                 scope.span.set_tag(Tags.HTTP_STATUS_CODE, response.status_code)
@@ -18,11 +18,15 @@ import datetime as dt
 from unittest import mock
 
 import pandas as pd
+from pandas.testing import assert_frame_equal
 
 import gs_quant.risk as risk
+from gs_quant.base import RiskKey
 from gs_quant.api.gs.risk import GsRiskApi
 from gs_quant.instrument import IRSwap, IRSwaption
-from gs_quant.markets import HistoricalPricingContext, PricingCache, PricingContext
+from gs_quant.markets import CloseMarket, HistoricalPricingContext, PricingCache, PricingContext, TimestampedMarket
+from gs_quant.markets.pricing_cache import DiskPricingCacheBackend, InMemoryPricingCacheBackend, _result_size
+from gs_quant.risk import DataFrameWithInfo, ErrorValue, FloatWithInfo
 from gs_quant.session import Environment, GsSession
 
 
@@ -221,3 +225,99 @@ def test_multiple_measures(mocker):
         for risk_measure in (risk.Price, risk.IRDelta, risk.IRVega):
             val = PricingCache.get(pc._PricingContext__risk_key(risk_measure, ir_swaption.provider), ir_swaption)
             assert val is None
+
+
+def test_cache_backend_bounds():
+    close_key = RiskKey(None, dt.date(2023, 1, 2), CloseMarket(dt.date(2023, 1, 2), 'LDN', False), None, None, None)
+    intraday_key = close_key._replace(market=TimestampedMarket(dt.datetime(2023, 1, 2, 10), 'LDN'))
+    swaps = [IRSwap('Pay', f'{i + 1}y', 'USD') for i in range(4)]
+    result_size = _result_size(FloatWithInfo(close_key, 1.0))
+
+    backend = InMemoryPricingCacheBackend(max_size_bytes=3 * result_size, ttl_in_seconds=60)
+    PricingCache.set_backend(backend)
+    try:
+        with mock.patch('time.monotonic', return_value=0):
+            for swap in swaps[:3]:
+                PricingCache.put(close_key, swap, FloatWithInfo(close_key, 1.0))
+            PricingCache.put(intraday_key, swaps[0], FloatWithInfo(intraday_key, 2.0))
+            PricingCache.put(close_key, swaps[3], ErrorValue(close_key, 'failed'))
+
+        # adding a fourth result evicted the least recently used instrument
+        assert PricingCache.get(close_key, swaps[1]) is None
+        assert PricingCache.get(close_key, swaps[0]) == 1.0
+        assert PricingCache.get(close_key, swaps[3]) is None
+
+        # results for markets other than close markets expire
+        with mock.patch('time.monotonic', return_value=59):
+            assert PricingCache.get(intraday_key, swaps[0]) == 2.0
+        with mock.patch('time.monotonic', return_value=61):
+            assert PricingCache.get(intraday_key, swaps[0]) is None
+            assert PricingCache.get(close_key, swaps[0]) == 1.0
+
+        stats = PricingCache.stats()
+        assert (stats.hits, stats.misses, stats.puts, stats.evictions, stats.expirations) == (3, 3, 4, 1, 1)
+        assert (stats.instruments, stats.results) == (2, 2)
+
+        PricingCache.drop(swaps[0])
+        assert PricingCache.get(close_key, swaps[0]) is None
+        assert PricingCache.get(close_key, swaps[2]) == 1.0
+        PricingCache.clear()
+        assert PricingCache.get(close_key, swaps[2]) is None
+        assert PricingCache.stats().size_bytes == 0
+    finally:
+        PricingCache.set_backend(InMemoryPricingCacheBackend())
+
+
+def test_disk_cache_backend(tmp_path):
+    path = str(tmp_path / 'pricing_cache.db')
+    close_key = RiskKey(
+        GsRiskApi, dt.date(2023, 1, 2), CloseMarket(dt.date(2023, 1, 2), 'LDN', False), None, None, risk.IRDelta
+    )
+    intraday_key = close_key._replace(market=TimestampedMarket(dt.datetime(2023, 1, 2, 10), 'LDN'))
+    delta = DataFrameWithInfo(
+        pd.DataFrame({'mkt_point': ['1y', '2y'], 'value': [0.01, 0.015]}), risk_key=close_key, unit={'USD': 1}
+    )
+
+    backend = DiskPricingCacheBackend(path)
+    backend.put(close_key, IRSwap('Pay', '10y', 'USD'), delta)
+    backend.put(intraday_key, IRSwap('Pay', '10y', 'USD'), FloatWithInfo(intraday_key, 1.0))
+
+    # another process, with its own instruments, reads close market results from the file
+    PricingCache.set_backend(DiskPricingCacheBackend(path))
+    try:
+        swap = IRSwap('Pay', '10y', 'USD')
+        cached = PricingCache.get(close_key, swap)
+        assert isinstance(cached, DataFrameWithInfo)
+        assert_frame_equal(pd.DataFrame(cached), pd.DataFrame(delta))
+        assert cached.risk_key == close_key and cached.unit == {'USD': 1}
+        assert PricingCache.get(close_key, swap) is cached
+        assert PricingCache.get(intraday_key, swap) is None
+        assert PricingCache.get(close_key, IRSwap('Pay', '10y', 'EUR')) is None
+        assert PricingCache.get(close_key._replace(risk_measure=risk.IRVega), swap) is None
+
+        stats = PricingCache.stats()
+        assert (stats.hits, stats.misses, stats.puts) == (2, 3, 0)
+
+        # changing the version invalidates stored results
+        assert DiskPricingCacheBackend(path, version='v2').get(close_key, swap) is None
+        PricingCache.clear()
+        assert DiskPricingCacheBackend(path).get(close_key, swap) is None
+    finally:
+        PricingCache.set_backend(InMemoryPricingCacheBackend())
+
+
+def test_disk_cache_backend_resolved_in_place(tmp_path):
+    path = str(tmp_path / 'pricing_cache.db')
+    close_key = RiskKey(
+        GsRiskApi, dt.date(2023, 1, 2), CloseMarket(dt.date(2023, 1, 2), 'LDN', False), None, None, risk.IRDelta
+    )
+    unresolved = IRSwap('Pay', '10y', 'USD')
+    resolved = unresolved.resolved({'fixed_rate': 0.04}, None)
+    DiskPricingCacheBackend(path).put(close_key, IRSwap('Pay', '10y', 'USD'), FloatWithInfo(close_key, 1.0))
+    DiskPricingCacheBackend(path).put(close_key, resolved, FloatWithInfo(close_key, 2.0))
+
+    backend = DiskPricingCacheBackend(path)
+    swap = IRSwap('Pay', '10y', 'USD')
+    assert backend.get(close_key._replace(risk_measure=risk.IRVega), swap) is None
+    swap.from_instance(resolved)  # as resolve() does in place
+    assert backend.get(close_key, swap) == 2.0
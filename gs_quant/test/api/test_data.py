@@ -14,7 +14,9 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import asyncio
 import datetime as dt
+import time
 
 import pandas as pd
 import pytest
@@ -304,6 +306,86 @@ def test_coordinate_last(mocker):
     )
 
 
+@pytest.mark.asyncio
+async def test_coordinates_data_async(mocker):
+    start = dt.datetime(2019, 1, 2, 1, 0)
+    end = dt.datetime(2019, 1, 2, 1, 10)
+    # mock GsSession and data response
+    mocker.patch.object(
+        GsSession.__class__, 'default_value', return_value=GsSession.get(Environment.QA, 'client_id', 'secret')
+    )
+    mocker.patch.object(
+        GsSession.current.async_,
+        'post',
+        side_effect=[
+            {'responses': [{'data': bond_data}, {'data': swap_data}]},
+            {'responses': [{'data': swap_data}]},
+            {'responses': [{'data': bond_data[-1:]}, {'data': []}]},
+        ],
+    )
+
+    coords_data_result = await GsDataApi.coordinates_data_async(
+        coordinates=test_str_coordinates, start=start, end=end, as_multiple_dataframes=True
+    )
+    assert len(coords_data_result) == 2
+    assert_frame_equal(coords_data_result[0], bond_expected_frame)
+    assert_frame_equal(coords_data_result[1], swap_expected_frame)
+    GsSession.current.async_.post.assert_called_once_with(
+        '/data/coordinates/query',
+        domain=None,
+        payload=MDAPIDataQuery(
+            market_data_coordinates=test_coordinates,
+            start_time=start,
+            end_time=end,
+            vendor=MarketDataVendor.Goldman_Sachs,
+            format="MessagePack",
+        ),
+        request_headers={'Accept': 'application/msgpack'},
+    )
+
+    series = await GsDataApi.coordinates_data_series_async(coordinates=test_coordinates[1], start=start, end=end)
+    assert_series_equal(series, pd.Series(index=swap_expected_frame.index, data=swap_expected_frame.value.values))
+
+    last = await GsDataApi.coordinates_last_async(coordinates=test_coordinates, as_of=end)
+    assert last == {test_coordinates[0]: 1.0141, test_coordinates[1]: None}
+    GsSession.current.async_.post.assert_called_with(
+        '/data/coordinates/query/last',
+        domain=None,
+        payload=MDAPIDataQuery(
+            market_data_coordinates=test_coordinates,
+            end_time=end,
+            vendor=MarketDataVendor.Goldman_Sachs,
+            format="MessagePack",
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_market_data_async(mocker):
+    standard = [{'date': '2019-01-02', 'impliedVolatility': 0.2}, {'date': '2019-01-03', 'impliedVolatility': 0.3}]
+    premium = [{'date': '2019-01-02', 'impliedVolatility': 0.4}]
+    body = {
+        'requestId': 'abc',
+        'responses': [
+            {'queryResponse': [{'dataSetIds': ['EDRVOL_PERCENT_STANDARD'], 'response': {'data': standard}}]},
+            {'queryResponse': [{'dataSetIds': ['EDRVOL_PERCENT_PREMIUM'], 'response': {'data': premium}}]},
+        ],
+    }
+    mocker.patch.object(
+        GsSession.__class__, 'default_value', return_value=GsSession.get(Environment.QA, 'client_id', 'secret')
+    )
+    mocker.patch.object(GsSession.current.async_, 'post', return_value=body)
+
+    df = await GsDataApi.get_market_data_async({'queries': []})
+    assert df.dataset_ids == ('EDRVOL_PERCENT_STANDARD', 'EDRVOL_PERCENT_PREMIUM')
+    assert list(df['impliedVolatility']) == [0.2, 0.3, 0.4]
+    assert list(df.index) == [pd.Timestamp('2019-01-02'), pd.Timestamp('2019-01-03'), pd.Timestamp('2019-01-02')]
+
+    body['responses'][1]['queryResponse'][0]['errorMessages'] = ['bad query']
+    with pytest.raises(MqValueError, match='bad query'):
+        await GsDataApi.get_market_data_async({'queries': []})
+
+
 def test_get_coverage_api(mocker):
     test_coverage_data_1 = {'results': [{'gsid': 'gsid1'}], 'scrollId': 'fake-scroll-id-1', 'totalResults': 1}
     test_coverage_data_2 = {'results': [], 'scrollId': 'fake-scroll-id-2', 'totalResults': 1}
@@ -378,6 +460,43 @@ def test_auto_scroll_on_pages(mocker):
     assert len(response) == 5
 
 
+def test_get_results_page_order(mocker):
+    def page_response(page):
+        time.sleep(0.01 * (5 - page))  # later pages arrive first
+        return {"totalPages": 5, "data": [{"date": "2012-01-25", "assetId": "MADXKSGX6921CFNF", "value": page}]}
+
+    mocker.patch.object(ContextMeta, 'current', return_value=GsSession(Environment.QA))
+    mocker.patch.object(
+        ContextMeta.current.sync, 'post', side_effect=lambda url, payload, **kwargs: page_response(payload.page)
+    )
+
+    query = DataQuery(start_date=dt.date(2017, 1, 15), end_date=dt.date(2017, 1, 18))
+    streamed = []
+    results = GsDataApi.get_results(
+        "test", page_response(0), query, max_workers=4, on_page=lambda rows: streamed.append(rows[0]['value'])
+    )
+    assert [row['value'] for row in results] == [0, 1, 2, 3, 4]
+    assert streamed == [0, 1, 2, 3, 4]
+    assert query.page is None
+
+
+@pytest.mark.asyncio
+async def test_get_results_async_page_order(mocker):
+    async def page_response(url, payload, **kwargs):
+        await asyncio.sleep(0.01 * (5 - payload.page))  # later pages arrive first
+        return {"totalPages": 5, "data": [{"date": "2012-01-25", "value": payload.page}]}
+
+    mocker.patch.object(ContextMeta, 'current', return_value=GsSession(Environment.QA))
+    mocker.patch.object(ContextMeta.current.async_, 'post', new=mocker.AsyncMock(side_effect=page_response))
+    mocker.patch.object(ContextMeta.current, 'redirect_to_mds', False)
+
+    query = DataQuery(start_date=dt.date(2017, 1, 15), end_date=dt.date(2017, 1, 18))
+    first = {"totalPages": 5, "data": [{"date": "2012-01-25", "value": 0}]}
+    results = await GsDataApi.get_results_async("test", first, query)
+    assert [row['value'] for row in results] == [0, 1, 2, 3, 4]
+    assert query.page is None
+
+
 def mock_fields_response():
     return {
         "totalResults": 2,
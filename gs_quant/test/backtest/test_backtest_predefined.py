@@ -210,3 +210,46 @@ def test_backtest_predefined():
     assert underlying not in holdings[end]
     assert weights[end][cash_asset] == 1
     assert underlying not in weights[end]
+
+
+def test_backtest_predefined_skips_idle_states():
+    tz = dt.timezone.utc
+    days = pd.bdate_range('2021-01-04', periods=10)
+    states = [dt.datetime.combine(d.date(), dt.time(h, m), tz) for d in days for h in range(9, 17) for m in (0, 30)]
+    data = pd.Series(100 + np.arange(len(states), dtype=float), index=states)
+    s_eod = pd.Series(data.values[15::16], index=days.date)
+
+    bond = IRBondFuture(currency='EUR', name='Bond')
+    data_manager = DataManager()
+    data_manager.add_data_source(data, DataFrequency.REAL_TIME, bond, ValuationFixingType.PRICE)
+    data_manager.add_data_source(s_eod, DataFrequency.DAILY, bond, ValuationFixingType.PRICE)
+
+    # trades entered at 11:00 every other day are closed two and a half hours later, between trigger times
+    trigger_times = [dt.datetime.combine(d.date(), dt.time(11), tz) for d in days[::2]]
+    action = AddTradeAction(bond, trade_duration=dt.timedelta(hours=2, minutes=30))
+    strategy = Strategy(None, triggers=DateTrigger(DateTriggerRequirements(dates=trigger_times), actions=[action]))
+
+    def run():
+        engine = PredefinedAssetEngine(data_mgr=data_manager)
+        return engine.run_backtest(strategy=strategy, start=states[0], end=states[-1], states=states)
+
+    evaluated = []
+    has_triggered = DateTrigger.has_triggered
+
+    def record(trigger, state, backtest=None):
+        evaluated.append(state)
+        return has_triggered(trigger, state, backtest)
+
+    backtest = run()
+    # evaluating the trigger at every state, as for triggers which depend on the backtest, gives the same backtest
+    with (
+        mock.patch.object(DateTrigger, 'depends_on_backtest', True),
+        mock.patch.object(DateTrigger, 'has_triggered', record),
+    ):
+        every_state = run()
+
+    assert len(evaluated) == len(set(states)) + len(days)
+    pd.testing.assert_series_equal(backtest.performance, every_state.performance)
+    assert [o.execution_end_time() for o in backtest.orders] == [o.execution_end_time() for o in every_state.orders]
+    assert [o.executed_price for o in backtest.orders] == [o.executed_price for o in every_state.orders]
+    assert len(backtest.trade_ledger()) == len(trigger_times)
@@ -0,0 +1,62 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the 'License');
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gs_quant.backtests.data_sources import GenericDataSource, MissingDataStrategy
+
+dates = [dt.date(2021, 1, 4), dt.date(2021, 1, 5), dt.date(2021, 1, 7), dt.date(2021, 1, 8)]
+series = pd.Series([1.0, 2.0, 4.0, np.nan], index=pd.DatetimeIndex(dates))
+
+
+def test_get_data():
+    source = GenericDataSource(series)
+    assert source.get_data(dt.date(2021, 1, 5)) == 2.0
+    assert source.get_data(dt.datetime(2021, 1, 7)) == 4.0
+    np.testing.assert_array_equal(source.get_data(dates[:3]), [1.0, 2.0, 4.0])
+    with pytest.raises(KeyError):
+        source.get_data(dt.date(2021, 1, 6))
+
+    ffill = GenericDataSource(series, MissingDataStrategy.fill_forward)
+    assert ffill.get_data(dt.date(2021, 1, 6)) == 2.0
+    assert ffill.get_data(dt.date(2021, 1, 11)) == 4.0
+    assert np.isnan(ffill.get_data(dt.date(2021, 1, 1)))
+    np.testing.assert_array_equal(ffill.get_data([dt.date(2021, 1, 6), dt.date(2021, 1, 7)]), [2.0, 4.0])
+
+    interpolate = GenericDataSource(series, MissingDataStrategy.interpolate)
+    assert interpolate.get_data(dt.date(2021, 1, 6)) == 3.0
+    assert interpolate.get_data(dt.date(2021, 1, 11)) == 4.0
+    # lookups do not modify the data set
+    assert len(interpolate.data_set) == len(series)
+
+
+def test_get_data_tz_aware():
+    times = pd.DatetimeIndex([dt.datetime(2021, 1, 4, 15), dt.datetime(2021, 1, 4, 16)]).tz_localize('UTC')
+    source = GenericDataSource(pd.Series([1.0, 2.0], index=times))
+    assert source.get_data(dt.datetime(2021, 1, 4, 16)) == 2.0
+    assert source.get_data(dt.datetime(2021, 1, 4, 11, tzinfo=dt.timezone(dt.timedelta(hours=-5)))) == 2.0
+
+
+def test_get_data_range():
+    source = GenericDataSource(series)
+    pd.testing.assert_series_equal(source.get_data_range(dt.date(2021, 1, 4), dt.date(2021, 1, 7)), series.iloc[1:3])
+    pd.testing.assert_series_equal(source.get_data_range(dt.date(2021, 1, 7), 2), series.iloc[:2])
+    pd.testing.assert_series_equal(source.get_data_range(dt.date(2021, 1, 7), 5), series.iloc[:2])
+    assert source.get_data_range(dt.date(2021, 1, 8), dt.date(2021, 1, 4)).empty
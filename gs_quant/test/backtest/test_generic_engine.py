@@ -14,6 +14,7 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import copy
 import datetime as dt
 import json
 import pathlib
@@ -21,6 +22,7 @@ from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pytest
 from gs_quant.backtests.actions import (
     AddTradeAction,
     HedgeAction,
@@ -37,9 +39,11 @@ from gs_quant.backtests.backtest_objects import (
     TransactionAggType,
     ConstantTransactionModel,
     BackTest,
+    Hedge,
+    ScalingPortfolio,
 )
 from gs_quant.backtests.data_sources import GenericDataSource, MissingDataStrategy, GsDataSource
-from gs_quant.backtests.generic_engine import GenericEngine
+from gs_quant.backtests.generic_engine import GenericEngine, _RiskPlan
 from gs_quant.backtests.generic_engine_action_impls import EarlyExitPositionLimitScaledActionImpl
 from gs_quant.backtests.strategy import Strategy
 from gs_quant.backtests.triggers import (
@@ -63,12 +67,14 @@ from gs_quant.backtests.triggers import (
     MeanReversionTriggerRequirements,
     NotTriggerRequirements,
 )
-from gs_quant.common import Currency, PayReceive, OptionType, OptionStyle
+from gs_quant.base import RiskKey
+from gs_quant.common import Currency, PayReceive, OptionType, OptionStyle, RiskRequestParameters
 from gs_quant.instrument import FXOption, FXForward, IRSwaption, IRSwap, EqOption
 from gs_quant.json_encoder import JSONEncoder
-from gs_quant.markets import PricingContext
+from gs_quant.markets import CloseMarket, PricingContext
 from gs_quant.markets.portfolio import Portfolio
-from gs_quant.risk import Price, FXDelta, DollarPrice, IRDelta
+from gs_quant.risk import Price, FXDelta, DollarPrice, IRDelta, FloatWithInfo
+from gs_quant.risk.results import PricingFuture, PortfolioRiskResult
 from gs_quant.target.measures import EqDelta, EqVega
 from gs_quant.test.utils.mock_calc import MockCalc
 
@@ -82,6 +88,24 @@ def instrument_name(test_name: str, leg_name: str):
     return f'{test_name}_{leg_name}'
 
 
+def price_results(portfolio: Portfolio, values=None) -> PortfolioRiskResult:
+    """Price results of the instruments of a portfolio, by default their positions in it"""
+    risk_key = RiskKey('GS', dt.date(2024, 1, 2), CloseMarket(location='NYC'), RiskRequestParameters(), None, Price)
+    values = range(len(portfolio.all_instruments)) if values is None else values
+    futures = [PricingFuture(FloatWithInfo(risk_key, float(value))) for value in values]
+    return PortfolioRiskResult(portfolio, [Price], futures)
+
+
+def recording_calc(requested: list):
+    """A Portfolio.calc which records the names of the instruments it is asked to price"""
+
+    def calc(portfolio, risks):
+        requested.append(tuple(i.name for i in portfolio.all_instruments))
+        return price_results(portfolio)
+
+    return calc
+
+
 @patch.object(GenericEngine, 'new_pricing_context', mock_pricing_context)
 def test_generic_engine_simple(mocker):
     with MockCalc(mocker):
@@ -172,6 +196,70 @@ def test_hedge_action_risk_trigger(mocker):
         assert Price in summary.columns
 
 
+@patch.object(GenericEngine, 'new_pricing_context', mock_pricing_context)
+def test_checkpoint_resume(mocker, tmp_path):
+    with MockCalc(mocker):
+        start_date = dt.date(2021, 12, 1)
+        call = FXOption(
+            buy_sell='Buy',
+            option_type='Call',
+            pair='USDJPY',
+            strike_price='ATMF',
+            notional_amount=1e5,
+            expiration_date='2y',
+            name=instrument_name('test_hedge_action_risk_trigger', '2y_call'),
+        )
+        hedge_risk = FXDelta(aggregation_level='Type')
+        fwd_hedge = FXForward(
+            pair='USDJPY',
+            settlement_date='2y',
+            notional_amount=1e5,
+            name=instrument_name('test_hedge_action_risk_trigger', '2y_forward'),
+        )
+        trig_req = RiskTriggerRequirements(risk=hedge_risk, trigger_level=0, direction=TriggerDirection.ABOVE)
+        triggers = StrategyRiskTrigger(trig_req, HedgeAction(hedge_risk, fwd_hedge, '2b', name='HedgeAction1'))
+
+        with PricingContext(pricing_date=start_date, use_historical_diddles_only=True):
+            fut = call.resolve(in_place=False)
+
+        strategy = Strategy(fut.result(), triggers)
+        states = [dt.date(2021, 12, 1), dt.date(2021, 12, 2), dt.date(2021, 12, 3)]
+        expected = GenericEngine().run_backtest(copy.deepcopy(strategy), states=states).result_summary
+
+        # a run which stops on the last date resumes from the dates before it
+        path = str(tmp_path / 'backtest.checkpoint')
+        process = GenericEngine._process_triggers_and_actions_for_date
+
+        def process_until_last(engine, d, *args):
+            if d == states[-1]:
+                raise RuntimeError('stopped')
+            return process(engine, d, *args)
+
+        with patch.object(GenericEngine, '_process_triggers_and_actions_for_date', process_until_last):
+            with pytest.raises(RuntimeError):
+                GenericEngine().run_backtest(
+                    copy.deepcopy(strategy), states=states, checkpoint_path=path, checkpoint_frequency=1
+                )
+
+        processed = []
+
+        def record(engine, d, *args):
+            processed.append(d)
+            return process(engine, d, *args)
+
+        with patch.object(GenericEngine, '_process_triggers_and_actions_for_date', record):
+            backtest = GenericEngine().run_backtest(copy.deepcopy(strategy), states=states, checkpoint_path=path)
+        assert processed == states[-1:]
+        pd.testing.assert_frame_equal(backtest.result_summary, expected)
+
+        with pytest.raises(ValueError):
+            GenericEngine().run_backtest(copy.deepcopy(strategy), states=states[:2], checkpoint_path=path)
+        with pytest.raises(ValueError):
+            GenericEngine().run_backtest(
+                copy.deepcopy(strategy), states=states, checkpoint_path=path, checkpoint_frequency=0
+            )
+
+
 @patch.object(GenericEngine, 'new_pricing_context', mock_pricing_context)
 def test_hedge_without_risk(mocker):
     with MockCalc(mocker):
@@ -1129,3 +1217,60 @@ def test_early_exit_pos_limit_scaled_action(mocker):
     for d in trigger_dates:
         assert d in orders
         assert len(orders[d]) == 2
+
+
+def test_risk_summary_follows_replaced_results():
+    dates = [dt.date(2024, 1, 2), dt.date(2024, 1, 3)]
+    swaps = [IRSwap('Pay', '5y', 'USD', name=f'swap_{i}') for i in range(2)]
+    backtest = BackTest(Strategy(None, []), dates, [Price], Price)
+    backtest.add_results(dates[0], price_results(Portfolio(swaps), [1.0, 2.0]))
+    backtest.add_results(dates[1], price_results(Portfolio(swaps[:1]), [3.0]))
+    assert list(backtest.risk_summary[Price]) == [3.0, 3.0]
+
+    backtest.add_results(dates[1], price_results(Portfolio(swaps), [5.0, 6.0]), replace=True)
+    assert list(backtest.risk_summary[Price]) == [3.0, 11.0]
+
+
+def test_price_semi_det_triggers_plan():
+    requested = []
+    dates = [dt.date(2024, 1, 2), dt.date(2024, 1, 3)]
+    swaps = [IRSwap('Pay', '5y', 'USD', name=f'swap_{i}') for i in range(2)]
+    backtest = BackTest(Strategy(None, []), dates, [Price], Price)
+    backtest.add_results(dates[0], price_results(Portfolio(swaps[:1])))
+    backtest.portfolio_dict[dates[0]] = Portfolio(swaps)
+    backtest.portfolio_dict[dates[1]] = Portfolio(swaps[:1])
+
+    # two hedges of the same trade over the same dates share one calculation
+    hedge_trade = Portfolio([IRSwap('Receive', '10y', 'USD', name='hedge')])
+    for _ in range(2):
+        scaling_portfolio = ScalingPortfolio(hedge_trade, dates, Price)
+        backtest.hedges[dates[0]].append(Hedge(scaling_portfolio, None, None))
+
+    with patch.object(Portfolio, 'calc', recording_calc(requested)):
+        GenericEngine._price_semi_det_triggers(backtest, [Price])
+
+    assert requested == [('swap_1',), ('swap_0',), ('hedge',)]
+    assert backtest.calculations == 4
+    assert backtest.calculations_saved == 3
+    assert backtest.calc_calls == 1
+    assert all(h.scaling_portfolio.results is not None for h in backtest.hedges[dates[0]])
+    assert len(backtest.results[dates[0]]) == 2
+
+
+def test_risk_plan_adds_on_one_date():
+    requested = []
+    date = dt.date(2024, 1, 2)
+    swaps = [IRSwap('Pay', f'{i + 1}y', 'USD', name=f'swap_{i}') for i in range(3)]
+    backtest = BackTest(Strategy(None, []), [date], [Price], Price)
+    backtest.add_results(date, price_results(Portfolio(swaps[:1])))
+
+    # as many instruments are planned as the first portfolio holds, but they are not its instruments
+    plan = _RiskPlan(backtest, [Price])
+    plan.add(date, Portfolio(swaps[:2]))
+    plan.add(date, Portfolio(swaps[2:]))
+    with patch.object(Portfolio, 'calc', recording_calc(requested)):
+        plan.calculate()
+
+    assert requested == [('swap_1', 'swap_2')]
+    assert backtest.calculations == 2
+    assert backtest.calculations_saved == 1
@@ -0,0 +1,130 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the 'License');
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import datetime as dt
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gs_quant.backtests.actions import AddTradeAction
+from gs_quant.backtests.core import ValuationFixingType
+from gs_quant.backtests.data_sources import DataManager, GenericDataSource
+from gs_quant.backtests.generic_engine import GenericEngine
+from gs_quant.backtests.predefined_asset_engine import PredefinedAssetEngine
+from gs_quant.backtests.strategy import Strategy
+from gs_quant.backtests.sweep import BacktestSweep
+from gs_quant.backtests.triggers import (
+    DateTrigger,
+    DateTriggerRequirements,
+    MktTrigger,
+    MktTriggerRequirements,
+    TriggerDirection,
+)
+from gs_quant.data.core import DataFrequency
+from gs_quant.instrument import FXOption, IRBondFuture
+from gs_quant.markets import PricingCache
+from gs_quant.test.backtest.test_generic_engine import mock_pricing_context
+from gs_quant.test.utils.mock_calc import MockCalc
+
+
+def predefined_sweep_inputs():
+    dates = [d.date() for d in pd.bdate_range('2021-01-04', '2021-03-31')]
+    states = [dt.datetime.combine(d, dt.time(23)) for d in dates]
+    prices = 100 + np.cumsum(np.sin(np.arange(len(dates))))
+
+    future = IRBondFuture(currency='EUR', name='TestBond')
+    data_manager = DataManager()
+    data_manager.add_data_source(pd.Series(prices, index=dates), DataFrequency.DAILY, future, ValuationFixingType.PRICE)
+    data_manager.add_data_source(
+        pd.Series(prices, index=states), DataFrequency.REAL_TIME, future, ValuationFixingType.PRICE
+    )
+
+    requirements = MktTriggerRequirements(
+        GenericDataSource(pd.Series(prices, index=states)), 101, TriggerDirection.ABOVE
+    )
+    strategy = Strategy(None, MktTrigger(requirements, AddTradeAction(future)))
+    return PredefinedAssetEngine(data_mgr=data_manager), strategy, states
+
+
+def test_predefined_sweep():
+    engine, strategy, states = predefined_sweep_inputs()
+    level = 'triggers.0.trigger_requirements.trigger_level'
+    sweep = BacktestSweep(
+        engine, strategy, {level: (100, 101, 102), 'states': (states, states[:20])}, start=states[0], end=states[-1]
+    )
+    assert len(sweep.points) == 6
+    levels = [s.triggers[0].trigger_requirements.trigger_level for s in sweep.strategies]
+    assert levels == [100, 100, 101, 101, 102, 102]
+    # the template is not modified
+    assert strategy.triggers[0].trigger_requirements.trigger_level == 101
+
+    stats = sweep.run(max_workers=3)
+    assert list(stats[level]) == [100, 100, 101, 101, 102, 102]
+    assert 'Error' not in stats
+
+    for point, (_, row), backtest in zip(sweep.points, stats.iterrows(), sweep.backtests):
+        _, template, _ = predefined_sweep_inputs()
+        template.triggers[0].trigger_requirements.trigger_level = point[level]
+        expected = engine.run_backtest(template, start=states[0], end=states[-1], states=point['states'])
+        assert backtest.performance.equals(expected.performance)
+        assert row['Final Level'] == expected.performance.iloc[-1]
+        assert row['Total Orders'] == len(expected.orders)
+
+
+def test_sweep_errors():
+    engine, strategy, states = predefined_sweep_inputs()
+    with pytest.raises(ValueError):
+        BacktestSweep(engine, strategy, {'triggers.0.trigger_requirements.no_such_field': (1,)})
+
+    # a failed run is reported without stopping the others
+    points = [{'states': states}, {'states': [dt.datetime(2020, 1, 1, 23)]}]
+    sweep = BacktestSweep(engine, strategy, points, start=states[0], end=states[-1])
+    stats = sweep.run(keep_backtests=False)
+    assert pd.isna(stats['Error'][0])
+    assert isinstance(stats['Error'][1], str)
+    assert stats['Total Orders'][0] > 0
+    assert sweep.backtests == [None, None]
+
+
+@patch.object(GenericEngine, 'new_pricing_context', mock_pricing_context)
+def test_generic_sweep_shares_pricing_cache(mocker):
+    with MockCalc(mocker):
+        call = FXOption(
+            buy_sell='Buy',
+            option_type='Call',
+            pair='USDJPY',
+            strike_price='ATMF',
+            notional_amount=1e5,
+            expiration_date='2y',
+            name='test_generic_engine_simple_2y_call',
+        )
+        trigger = DateTrigger(
+            DateTriggerRequirements(dates=[dt.date(2021, 12, 1)]), AddTradeAction(call, '1m', name='Action1')
+        )
+        states = [dt.date(2021, 12, 1), dt.date(2021, 12, 2), dt.date(2021, 12, 3)]
+
+        PricingCache.clear()
+        before = PricingCache.stats()
+        stats = BacktestSweep(GenericEngine(), Strategy(None, trigger), [{}, {}, {}], states=states).run(max_workers=2)
+        after = PricingCache.stats()
+
+        # the first run populates the cache, from which the others are priced
+        assert after.misses - before.misses == after.puts - before.puts
+        assert after.hits - before.hits == 2 * (after.misses - before.misses)
+        assert len(set(stats['Total PnL'])) == 1
+        assert round(stats['Total PnL'][0], 2) == 537.63
@@ -14,16 +14,28 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import copy
 import datetime as dt
+
+import numpy as np
+import pandas as pd
+
 from gs_quant.backtests.actions import AddTradeAction
+from gs_quant.backtests.data_sources import GenericDataSource, MissingDataStrategy
 from gs_quant.backtests.triggers import (
     DateTriggerRequirements,
     DateTrigger,
     AggregateTriggerRequirements,
     AggregateTrigger,
     AggType,
+    MeanReversionTriggerRequirements,
+    MktTriggerRequirements,
     NotTrigger,
     NotTriggerRequirements,
+    PeriodicTriggerRequirements,
+    PortfolioTriggerRequirements,
+    TriggerDirection,
+    TriggerInfo,
 )
 from gs_quant.instrument import IRSwap, IRSwaption
 
@@ -101,3 +113,48 @@ def test_not_triggger():
     assert not_trigger.has_triggered(dt.date(2021, 11, 8))
     assert isinstance(not_trigger.actions[0].priceables[0], IRSwaption)
     assert not not_trigger.has_triggered(dt.date(2021, 11, 10))
+
+
+def test_evaluate_many():
+    dates = [d.date() for d in pd.bdate_range('2021-01-01', '2021-06-30')]
+    values = 100 + np.cumsum(np.sin(np.arange(len(dates))))
+    values[::11] = np.nan
+    data_source = GenericDataSource(pd.Series(values, index=dates), MissingDataStrategy.fill_forward)
+    mean_reversion = MeanReversionTriggerRequirements(data_source, 1.0, 5, 5)
+    requirements = (
+        MktTriggerRequirements(data_source, 101, TriggerDirection.ABOVE),
+        mean_reversion,
+        PeriodicTriggerRequirements(dates[0], dates[-1], '1m'),
+        DateTriggerRequirements(dates[::7]),
+        AggregateTriggerRequirements([DateTriggerRequirements(dates[::2]), mean_reversion], AggType.ALL_OF),
+        AggregateTriggerRequirements([DateTriggerRequirements(dates[::2]), mean_reversion], AggType.ANY_OF),
+        NotTriggerRequirements(DateTriggerRequirements(dates[::3])),
+    )
+
+    for requirement in requirements:
+        batch, one_by_one = copy.deepcopy(requirement), copy.deepcopy(requirement)
+        triggered, infos = batch.evaluate_many(dates)
+        expected = [one_by_one.has_triggered(d) for d in dates]
+        assert triggered.tolist() == [bool(i) for i in expected]
+        assert [i or None for i in infos] == [i.info_dict or None if i else None for i in expected]
+        assert not requirement.depends_on_backtest
+
+    # the mean reversion position carries across states
+    triggered, infos = copy.deepcopy(mean_reversion).evaluate_many(dates)
+    assert triggered.any()
+    assert {i[AddTradeAction].scaling for i in np.array(infos)[triggered]} <= {-1, 1}
+
+    assert PortfolioTriggerRequirements('len', 2).depends_on_backtest
+    date_trigger = DateTrigger(DateTriggerRequirements(dates[::7]), AddTradeAction(IRSwap()))
+    assert list(date_trigger.schedule(dates)) == dates[::7]
+    assert date_trigger.schedule(dates)[dates[7]].info_dict[AddTradeAction].next_schedule == dates[14]
+
+    # a trigger with its own has_triggered is evaluated state by state, and may depend on the backtest
+    class OddDayTrigger(DateTrigger):
+        def has_triggered(self, state, backtest=None):
+            return super().has_triggered(state, backtest) if state.day % 2 else TriggerInfo(False)
+
+    odd_day_trigger = OddDayTrigger(DateTriggerRequirements(dates[::7]), AddTradeAction(IRSwap()))
+    assert list(odd_day_trigger.schedule(dates)) == [d for d in dates[::7] if d.day % 2]
+    assert odd_day_trigger.depends_on_backtest
+    assert not date_trigger.depends_on_backtest
@@ -15,11 +15,14 @@ under the License.
 """
 
 import datetime as dt
+import sqlite3
+from contextlib import closing
 from unittest.mock import patch
 
+import pytest
 from pandas.testing import assert_frame_equal
 
-from gs_quant.api.api_cache import InMemoryApiRequestCache, CacheEvent
+from gs_quant.api.api_cache import DiskApiRequestCache, InMemoryApiRequestCache, CacheEvent
 from gs_quant.api.gs.data import GsDataApi, QueryType
 from gs_quant.data import Dataset, DataContext
 
@@ -182,11 +185,14 @@ class TestDataApiCache:
         assert not df.empty
         assert_frame_equal(df, df2)
         cache_events = self.cache.get_events()
-        assert len(cache_events) == 4
-        assert cache_events[0][0] == CacheEvent.PUT
-        assert cache_events[1][0] == CacheEvent.PUT
-        assert cache_events[2][0] == CacheEvent.GET
-        assert cache_events[3][0] == CacheEvent.GET
+        assert [event[0] for event in cache_events] == [
+            CacheEvent.MISS,
+            CacheEvent.PUT,
+            CacheEvent.MISS,
+            CacheEvent.PUT,
+            CacheEvent.GET,
+            CacheEvent.GET,
+        ]
 
     def test_query_data(self):
         ds = Dataset("FXSPOT_STANDARD")
@@ -197,11 +203,14 @@ class TestDataApiCache:
 
         assert_frame_equal(df, df2)
         cache_events = self.cache.get_events()
-        assert len(cache_events) == 4
-        assert cache_events[0][0] == CacheEvent.PUT
-        assert cache_events[1][0] == CacheEvent.PUT
-        assert cache_events[2][0] == CacheEvent.GET
-        assert cache_events[3][0] == CacheEvent.GET
+        assert [event[0] for event in cache_events] == [
+            CacheEvent.MISS,
+            CacheEvent.PUT,
+            CacheEvent.MISS,
+            CacheEvent.PUT,
+            CacheEvent.GET,
+            CacheEvent.GET,
+        ]
 
     def test_market_data(self):
         asset_id = "MATGYV0J9MPX534Z"
@@ -214,7 +223,7 @@ class TestDataApiCache:
             except Exception:
                 pass
         cache_events = self.cache.get_events()
-        assert len(cache_events) == 0
+        assert [event[0] for event in cache_events] == [CacheEvent.MISS]
         with patch.object(GsDataApi, "get_session", return_value=FakeSession()):
             df = GsDataApi.get_market_data(q)
         with patch.object(GsDataApi, "get_session", return_value=NotExpectedToBeCalledSession()):
@@ -222,6 +231,110 @@ class TestDataApiCache:
 
         assert_frame_equal(df, df2)
         cache_events = self.cache.get_events()
-        assert len(cache_events) == 2
-        assert cache_events[0][0] == CacheEvent.PUT
-        assert cache_events[1][0] == CacheEvent.GET
+        assert [event[0] for event in cache_events] == [
+            CacheEvent.MISS,
+            CacheEvent.MISS,
+            CacheEvent.PUT,
+            CacheEvent.GET,
+        ]
+
+
+class TestDiskDataApiCache:
+    @pytest.fixture(autouse=True)
+    def cache_path(self, tmp_path):
+        self.path = str(tmp_path / 'cache' / 'api_cache.db')
+        yield
+        GsDataApi.set_api_request_cache(None)
+
+    def test_query_data_across_caches(self):
+        ds = Dataset("FXSPOT_STANDARD")
+        GsDataApi.set_api_request_cache(DiskApiRequestCache(self.path))
+        with patch.object(GsDataApi, "get_session", return_value=FakeSession()):
+            df = ds.get_data(dt.date(2023, 10, 26), dt.date(2023, 10, 26), bbid="USDJPY")
+
+        # a new cache on the same file, as in a later process, serves the request without a session call
+        cache = DiskApiRequestCache(self.path)
+        GsDataApi.set_api_request_cache(cache)
+        with patch.object(GsDataApi, "get_session", return_value=NotExpectedToBeCalledSession()):
+            df2 = ds.get_data(dt.date(2023, 10, 26), dt.date(2023, 10, 26), bbid="USDJPY")
+
+        assert_frame_equal(df, df2)
+        assert cache.stats == {CacheEvent.GET: 2, CacheEvent.MISS: 0, CacheEvent.PUT: 0}
+
+    def test_ttl_and_eviction(self):
+        cache = DiskApiRequestCache(self.path, max_size_bytes=2000, dataset_ttls={'EXPIRED': 0, 'CLOSED': None})
+        payload = {'where': {'bbid': ['USDJPY']}, 'startDate': '2023-10-26'}
+        key = ('/data/CLOSED/query', 'POST', {'payload': payload})
+        reordered_key = ('/data/CLOSED/query', 'POST', {'payload': dict(reversed(payload.items()))})
+
+        cache.put(None, key, {'data': [1, 2, 3]})
+        cache.put(None, ('/data/EXPIRED/query', 'POST', {}), {'data': []})
+        assert cache.get(None, reordered_key) == {'data': [1, 2, 3]}
+        assert cache.get(None, ('/data/EXPIRED/query', 'POST', {})) is None
+        assert cache.stats == {CacheEvent.GET: 1, CacheEvent.MISS: 1, CacheEvent.PUT: 2}
+
+        # filling the cache evicts the least recently used entries
+        for i in range(10):
+            cache.put(None, ('/data/OTHER/query', 'POST', {'i': i}), 'x' * 400)
+        assert cache.get(None, key) is None
+        assert cache.get(None, ('/data/OTHER/query', 'POST', {'i': 9})) == 'x' * 400
+        assert cache.get(None, ('/data/OTHER/query', 'POST', {'i': 0})) is None
+
+        cache.clear('OTHER')
+        assert cache.get(None, ('/data/OTHER/query', 'POST', {'i': 9})) is None
+
+    def test_running_size_total(self):
+        def totals():
+            with closing(sqlite3.connect(self.path)) as connection:
+                return (
+                    connection.execute("SELECT value FROM totals WHERE name = 'size'").fetchone()[0],
+                    connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0],
+                )
+
+        cache = DiskApiRequestCache(self.path, max_size_bytes=2000, dataset_ttls={'EXPIRED': 0})
+        for i in range(3):
+            cache.put(None, ('/data/KEPT/query', 'POST', {'i': i}), 'x' * 100)
+        cache.put(None, ('/data/KEPT/query', 'POST', {'i': 0}), 'x' * 300)
+        cache.put(None, ('/data/EXPIRED/query', 'POST', {}), 'x' * 100)
+        assert cache.get(None, ('/data/EXPIRED/query', 'POST', {})) is None
+        total, size = totals()
+        assert total == size > 0
+
+        # the total of an existing file is picked up by a new cache, and kept through eviction and clearing
+        cache = DiskApiRequestCache(self.path, max_size_bytes=2000)
+        for i in range(10):
+            cache.put(None, ('/data/OTHER/query', 'POST', {'i': i}), 'x' * 400)
+        total, size = totals()
+        assert total == size <= 2000
+        cache.clear('OTHER')
+        assert totals()[0] == totals()[1]
+        cache.clear()
+        assert totals() == (0, 0)
+
+    def test_session_and_domain_scope(self):
+        from gs_quant.session import Environment, GsSession
+
+        cache = DiskApiRequestCache(self.path)
+        prod = GsSession.get(Environment.PROD, 'client', 'secret')
+        qa = GsSession.get(Environment.QA, 'client', 'secret')
+        other_client = GsSession.get(Environment.PROD, 'other_client', 'secret')
+        key = ('/data/CLOSED/query', 'POST', {'payload': {'where': {'bbid': ['USDJPY']}}})
+
+        cache.put(prod, key, {'data': [1]})
+        same_client = GsSession.get(Environment.PROD, 'client', 'secret')
+        assert DiskApiRequestCache(self.path).get(same_client, key) == {'data': [1]}
+        assert cache.get(qa, key) is None
+        assert cache.get(other_client, key) is None
+        assert cache.get(None, key) is None
+
+        # responses from another domain, such as MDS, are keyed apart from the session's domain
+        GsDataApi.set_api_request_cache(cache)
+        responses = iter(({'data': 'app'}, {'data': 'mds'}))
+        with (
+            patch.object(GsDataApi, "get_session", return_value=prod),
+            patch.object(prod.sync, 'post', side_effect=lambda url, **kwargs: next(responses)),
+        ):
+            assert GsDataApi._post_with_cache_check('/data/CLOSED/query', payload={'a': 1}) == {'data': 'app'}
+            mds = GsDataApi._post_with_cache_check('/data/CLOSED/query', domain='https://mds', payload={'a': 1})
+            assert mds == {'data': 'mds'}
+            assert GsDataApi._post_with_cache_check('/data/CLOSED/query', payload={'a': 1}) == {'data': 'app'}
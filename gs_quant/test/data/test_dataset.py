@@ -22,6 +22,7 @@ import pandas as pd
 import pytest
 
 from gs_quant.api.gs.data import GsDataApi
+from gs_quant.context_base import ContextMeta
 from gs_quant.data import Dataset
 from gs_quant.session import GsSession, Environment
 from gs_quant.target.data import Format, DataQuery
@@ -309,6 +310,24 @@ def test_construct_dataframe_with_types(mocker):
     assert np.issubdtype(df['updateTime'].dtype, np.datetime64)
 
 
+def test_construct_dataframe_typed_columns(mocker):
+    mocker.patch("gs_quant.api.gs.data.GsDataApi.get_types", return_value=test_types)
+    rows = [
+        {'date': '2019-01-02', 'assetId': 'B', 'tradePrice': 1, 'updateTime': '2019-01-03T00:53:00Z'},
+        {'date': '2019-01-02', 'assetId': 'A', 'tradePrice': 2.5, 'updateTime': None},
+        {'date': '2019-01-03', 'assetId': 'B', 'tradePrice': None, 'updateTime': '2019-01-04T00:14:00.5Z'},
+    ]
+    df = GsDataApi.construct_dataframe_with_types(str(Dataset.TR.TREOD), rows, categorical_fields=('assetId',))
+    assert list(df.index) == [pd.Timestamp(2019, 1, 2), pd.Timestamp(2019, 1, 2), pd.Timestamp(2019, 1, 3)]
+    assert isinstance(df['assetId'].dtype, pd.CategoricalDtype)
+    assert list(df['assetId'].cat.categories) == ['A', 'B'] and list(df['assetId']) == ['B', 'A', 'B']
+    assert df['tradePrice'].dtype == np.float64 and np.isnan(df['tradePrice'].iloc[2])
+    assert df['updateTime'].isna().tolist() == [False, True, False]
+    assert df['updateTime'].iloc[2] == pd.Timestamp('2019-01-04T00:14:00.5Z')
+    # catalog fields absent from the data are empty
+    assert df['askPrice'].isna().all()
+
+
 def test_construct_dataframe_var_schema(mocker):
     mocker.patch("gs_quant.api.gs.data.GsDataApi.get_types", return_value=test_types)
     var_schema = copy.deepcopy(test_data)
@@ -429,5 +448,41 @@ def test_get_data_bulk(mocker):
     assert df.equals(df2)
 
 
+def test_iter_data(mocker):
+    def query_data(query, dataset_id, asset_id_type=None):
+        assets = query.where['assetId']
+        return [
+            row for row in test_data if query.start_date <= row['date'] <= query.end_date and row['assetId'] in assets
+        ]
+
+    mocker.patch.object(ContextMeta, 'current', return_value=GsSession(Environment.QA))
+    mock = mocker.patch("gs_quant.api.gs.data.GsDataApi.query_data", side_effect=query_data)
+    mocker.patch("gs_quant.api.gs.data.GsDataApi.get_types", return_value=test_types)
+    dataset = Dataset(Dataset.TR.TREOD)
+    frames = list(
+        dataset.iter_data(
+            dt.date(2019, 1, 2),
+            dt.date(2019, 1, 9),
+            assetId=('MA4B66MW5E27U8P32SB', 'MA_OTHER_1', 'MA_OTHER_2'),
+            time_chunk=dt.timedelta(days=3),
+            symbols_per_request=2,
+            max_in_flight=2,
+            max_memory=1,
+        )
+    )
+
+    # 3 intervals of 2 lists of symbols, of which those without the asset are empty and skipped
+    assert mock.call_count == 6
+    queries = [c.args[0] for c in mock.call_args_list[::2]]
+    assert [(q.start_date, q.end_date) for q in queries] == [
+        (dt.date(2019, 1, 2), dt.date(2019, 1, 4)),
+        (dt.date(2019, 1, 5), dt.date(2019, 1, 7)),
+        (dt.date(2019, 1, 8), dt.date(2019, 1, 9)),
+    ]
+    assert len(frames) == 3
+    expected = GsDataApi.construct_dataframe_with_types(str(Dataset.TR.TREOD), test_data)
+    pd.testing.assert_frame_equal(pd.concat(frames), expected.loc[expected.index <= pd.Timestamp(2019, 1, 9)])
+
+
 if __name__ == "__main__":
     pytest.main(args=["test_dataset.py"])
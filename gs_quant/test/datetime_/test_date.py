@@ -16,8 +16,19 @@ under the License.
 
 import datetime as dt
 
+import numpy as np
+import pandas as pd
+import pytest
 from pytest import approx
-from gs_quant.datetime import DayCountConvention, day_count_fraction, has_feb_29, today, PaymentFrequency
+from gs_quant.datetime import (
+    DateRangeOutput,
+    DayCountConvention,
+    date_range,
+    day_count_fraction,
+    has_feb_29,
+    today,
+    PaymentFrequency,
+)
 from gs_quant.common import PricingLocation
 
 
@@ -63,3 +74,30 @@ def test_day_count_fraction():
     assert day_count_fraction(start, end, DayCountConvention.ACTUAL_365L, PaymentFrequency.ANNUALLY) == approx(
         2.087431693989
     )
+
+
+def test_date_range_vectorised():
+    begin = dt.date(2019, 12, 2)
+    end = dt.date(2020, 3, 13)
+
+    expected = tuple(date_range(begin, end))
+    dates = date_range(begin, end, output=DateRangeOutput.ARRAY)
+    assert dates.dtype == np.dtype('datetime64[D]')
+    assert tuple(dates.tolist()) == expected
+
+    index = date_range(begin, end, output='index')
+    assert isinstance(index, pd.DatetimeIndex)
+    assert tuple(index.date) == expected
+
+    assert tuple(date_range(begin, 7, output='array').tolist()) == tuple(date_range(begin, 7))
+    assert tuple(date_range(7, dt.date(2020, 3, 15), output='array').tolist()) == tuple(
+        date_range(7, dt.date(2020, 3, 15))
+    )
+    assert tuple(date_range(end, end, output='array').tolist()) == (end,)
+
+    with pytest.raises(ValueError):
+        date_range(end, begin, output='array')
+    with pytest.raises(ValueError):
+        date_range(dt.date(2020, 3, 14), end, output='array')
+    with pytest.raises(ValueError):
+        date_range('2020-01-01', end, output='array')
@@ -22,6 +22,8 @@ import pandas as pd
 from gs_quant.common import PricingLocation
 from gs_quant.data import Dataset
 from gs_quant.datetime import GsCalendar
+from gs_quant.datetime.gscalendar import _calendar_cache
+from gs_quant.errors import MqRequestError
 from gs_quant.test.api.test_risk import set_session
 
 MOCK_HOLIDAY = pd.DataFrame(index=[dt.datetime(1999, 9, 12)], data={'holiday': 'Labor Day'})
@@ -46,3 +48,41 @@ def test_gs_calendar_tuple(mocker, _mocker_cov):
     locs = (PricingLocation.NYC, PricingLocation.LDN)
     days = GsCalendar(locs).holidays
     assert days
+
+
+# Test business day calendars are interned across GsCalendar instances until reset
+@mock.patch.object(Dataset, 'get_coverage', return_value=pd.DataFrame())
+@mock.patch.object(Dataset, 'get_data', return_value=MOCK_HOLIDAY)
+def test_gs_calendar_business_day_calendar_cache(mocker, _mocker_cov):
+    set_session()
+    GsCalendar.reset()
+    first = GsCalendar.get(PricingLocation.NYC).business_day_calendar()
+    assert GsCalendar.get(PricingLocation.NYC).business_day_calendar() is first
+    assert GsCalendar.get(PricingLocation.NYC).business_day_calendar(GsCalendar.DEFAULT_WEEK_MASK) is first
+    assert mocker.call_count == 1
+
+    weekend = GsCalendar.get(PricingLocation.NYC).business_day_calendar('1111111')
+    assert weekend is not first
+    assert mocker.call_count == 1
+
+    GsCalendar.reset()
+    assert GsCalendar.get(PricingLocation.NYC).business_day_calendar() is not first
+    assert mocker.call_count == 2
+
+    # calendars are rebuilt once the holidays they were built from are no longer cached
+    first = GsCalendar.get(PricingLocation.NYC).business_day_calendar()
+    _calendar_cache.clear()
+    assert GsCalendar.get(PricingLocation.NYC).business_day_calendar() is not first
+    assert mocker.call_count == 3
+
+
+# Test business day calendars are not interned when holidays cannot be fetched
+@mock.patch.object(Dataset, 'get_coverage', return_value=pd.DataFrame())
+@mock.patch.object(Dataset, 'get_data', side_effect=MqRequestError(500, 'unavailable'))
+def test_gs_calendar_business_day_calendar_unavailable(mocker, _mocker_cov):
+    set_session()
+    GsCalendar.reset()
+    first = GsCalendar.get(PricingLocation.NYC).business_day_calendar()
+    assert len(first.holidays) == 0
+    assert GsCalendar.get(PricingLocation.NYC).business_day_calendar() is not first
+    assert mocker.call_count == 1
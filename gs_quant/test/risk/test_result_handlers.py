@@ -0,0 +1,108 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the 'License');
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+'AS IS' BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import copy
+
+import numpy as np
+
+from gs_quant.base import RiskKey
+from gs_quant.risk import IRDelta, sort_order, sort_values
+from gs_quant.risk.result_handlers import result_handlers
+
+risk_key = RiskKey(None, None, None, None, None, IRDelta)
+
+
+def test_sort_order():
+    columns = {
+        'mkt_type': ['IR', 'IR', 'FX', 'IR', 'IR'],
+        'mkt_point': ['10y', '1y', '3m', '12m', '1y'],
+        'value': [1.0, 3.0, 2.0, 4.0, 2.0],
+    }
+    names = tuple(columns)
+    expected = list(sort_values(zip(*columns.values()), names, names))
+    order = sort_order(columns, names)
+    assert [tuple(v[i] for v in columns.values()) for i in order] == expected
+
+    # values which cannot be compared only need ordering where preceding columns are equal
+    mixed = {'mkt_asset': ['USD', 'EUR'], 'value': [None, 1.0]}
+    np.testing.assert_array_equal(sort_order(mixed, tuple(mixed)), [1, 0])
+
+    assert len(sort_order({'value': []}, ('value',))) == 0
+
+
+def test_risk_vector_handler():
+    result = {
+        '$type': 'RiskVector',
+        'asset': [1.0, 2.0, 3.0],
+        'points': [
+            {'type': 'IR', 'asset': 'USD', 'class_': 'Swap', 'point': '10y', 'quoteStyle': 'ATMRate'},
+            {'type': 'IR', 'asset': 'USD', 'class_': 'Swap', 'point': '2y', 'quoteStyle': 'ATMRate'},
+            {'type': 'IR', 'asset': 'EUR', 'class_': 'Swap', 'point': '5y', 'quoteStyle': 'ATMRate'},
+        ],
+    }
+    original = copy.deepcopy(result)
+
+    df = result_handlers['RiskVector'](result, risk_key, None)
+    assert result == original
+    assert tuple(df.columns) == ('mkt_type', 'mkt_asset', 'mkt_class', 'mkt_point', 'mkt_quoting_style', 'value')
+    assert list(df['mkt_point']) == ['5y', '2y', '10y']
+    assert list(df['value']) == [3.0, 2.0, 1.0]
+    assert df.risk_key == risk_key
+
+
+def test_risk_by_class_handler():
+    result = {
+        '$type': 'RiskByClass',
+        'classes': [
+            {'type': 'IR', 'asset': 'USD'},
+            {'type': 'CROSSES', 'asset': 'USD'},
+            {'type': 'IR SPIKE', 'asset': 'USD'},
+        ],
+        'values': [1.0, 2.0, 0.5],
+    }
+    original = copy.deepcopy(result)
+
+    df = result_handlers['RiskByClass'](result, risk_key, None)
+    assert result == original
+    assert list(df['mkt_type']) == ['CROSSES', 'IR']
+    assert list(df['value']) == [2.5, 1.0]
+
+    # handling the same payload again gives the same result
+    again = result_handlers['RiskByClass'](result, risk_key, None)
+    assert list(again['value']) == [2.5, 1.0]
+
+
+def test_mdapi_table_handler():
+    result = {
+        'rows': [
+            {
+                'coordinate': {'type': 'IR', 'asset': 'USD', 'assetClass': 'Swap', 'point': ['5y', '10y']},
+                'value': 2.0,
+                'permissions': ['Granted'],
+            },
+            {
+                'coordinate': {'type': 'IR', 'asset': 'USD', 'assetClass': 'Swap', 'point': ['1y', '10y']},
+                'value': 1.0,
+                'permissions': ['Granted'],
+            },
+        ]
+    }
+    original = copy.deepcopy(result)
+
+    df = result_handlers['MDAPITable'](result, risk_key, None)
+    assert result == original
+    assert list(df['mkt_point']) == ['1y;10y', '5y;10y']
+    assert list(df['permissions']) == [['Granted'], ['Granted']]
@@ -18,6 +18,7 @@ import datetime as dt
 
 import gs_quant.risk as risk
 import numpy as np
+import pandas as pd
 import pytest
 from gs_quant.base import RiskKey
 from gs_quant.common import MarketDataPattern, RiskRequestParameters
@@ -26,8 +27,9 @@ from gs_quant.markets import HistoricalPricingContext, PricingContext, CloseMark
 from gs_quant.markets.portfolio import Portfolio
 from gs_quant.risk import MultiScenario, ResolvedInstrumentValues
 from gs_quant.risk import Price, RollFwd, CurveScenario, ErrorValue, DataFrameWithInfo, AggregationLevel, PnlExplain
-from gs_quant.risk.core import aggregate_risk, SeriesWithInfo, FloatWithInfo, StringWithInfo
-from gs_quant.risk.results import MultipleScenarioFuture
+from gs_quant.risk.core import aggregate_risk, RiskAggregator, SeriesWithInfo, FloatWithInfo, StringWithInfo
+from gs_quant.risk.core import aggregate_results
+from gs_quant.risk.results import MultipleScenarioFuture, PortfolioRiskResult, PricingFuture
 from gs_quant.risk.results import MultipleScenarioResult
 from gs_quant.risk.transform import ResultWithInfoAggregator
 from gs_quant.test.utils.mock_calc import MockCalc
@@ -382,6 +384,53 @@ def test_bucketed_risks(mocker):
     assert res7[dt.date(2020, 1, 14)].to_frame()["mkt_type"].iloc[0] == "CMD NRG"
 
 
+def test_columnar_risks(mocker):
+    with MockCalc(mocker):
+        _, res1, frame1 = get_attributes(eur_port, risk.IRDelta)
+        _, res4, frame4 = get_attributes(port1, risk.IRDelta, 'Multiple')
+
+    columnar1 = res1.to_columnar()
+    assert len(columnar1) == len(frame1)
+    assert 'mkt_point' in columnar1.coordinates
+    np.testing.assert_almost_equal(columnar1.aggregate(), frame1['value'].sum(), 8)
+
+    by_point = columnar1.aggregate('mkt_point')
+    manual_agg_f1 = frame1.loc[frame1['mkt_point'] == '5Y']['value'].sum()
+    np.testing.assert_almost_equal(by_point['5Y'], manual_agg_f1, 8)
+
+    columnar4 = res4.to_columnar()
+    one_date = columnar4.filter(dates=[dt.date(2020, 1, 14)])
+    manual_agg_f4 = frame4.loc[frame4['dates'] == dt.date(2020, 1, 14)]['value'].sum()
+    np.testing.assert_almost_equal(one_date.aggregate(), manual_agg_f4, 8)
+
+    path = columnar4.paths[0]
+    one_path = columnar4.filter(paths=[path])
+    assert set(one_path.data['_instrument']) == {0}
+    assert len(columnar4.filter(mkt_type=['NOT A TYPE'])) == 0
+
+    # bucketed results are aggregated over the column arrays, as aggregate_results aggregates them result by result
+    for res in (res1, res4):
+        expected = aggregate_results(p(res.futures).result() for p in res.portfolio.all_paths)
+        pd.testing.assert_frame_equal(res.aggregate(), expected)
+        assert res.aggregate().risk_key == expected.risk_key
+
+
+def test_columnar_aggregate_values():
+    risk_key = RiskKey('GS', dt.date(2020, 1, 14), CloseMarket(location='LDN'), RiskRequestParameters(), None, Price)
+    swaps = [IRSwap('Pay', '5y', 'EUR', name=f'swap_{i}') for i in range(3)]
+
+    def result_of(values):
+        futures = [PricingFuture(FloatWithInfo(risk_key, value, unit={'EUR': 1})) for value in values]
+        return PortfolioRiskResult(Portfolio(swaps), [Price], futures)
+
+    total = result_of([1.0, 2.0, 3.5]).aggregate()
+    assert isinstance(total, FloatWithInfo)
+    assert total == 6.5
+    assert total.risk_key == risk_key
+    assert total.unit == {'EUR': 1}
+    assert np.isnan(result_of([1.0, np.nan, 3.5]).aggregate())
+
+
 def test_cashflows_risk(mocker):
     with MockCalc(mocker):
         _, _, frame1 = get_attributes(eur_port, risk.Cashflows)
@@ -768,6 +817,39 @@ def test_aggregation_with_identical_trades(mocker):
         np.testing.assert_almost_equal(transformed_res.aggregate(), delta.to_frame()['value'].sum())
 
 
+def test_risk_aggregator():
+    first = DataFrameWithInfo(
+        {'mkt_type': ['IR', 'IR'], 'mkt_asset': ['USD', 'USD'], 'mkt_point': ['5y', '1y'], 'value': [1.0, 2.0]}
+    )
+    second = DataFrameWithInfo(
+        {
+            'mkt_type': ['IR', 'IR'],
+            'mkt_asset': ['USD', 'USD'],
+            'mkt_point': ['1y', '2y'],
+            'mkt_quoting_style': ['ATMRate', 'ATMRate'],
+            'value': [3.0, 0.05],
+        }
+    )
+    future = PricingFuture()
+    future.set_result(first)
+
+    aggregator = RiskAggregator()
+    aggregator.add(future)
+    aggregator.add(second)
+    aggregated = aggregator.result()
+
+    assert list(aggregated.columns) == ['mkt_type', 'mkt_asset', 'mkt_point', 'mkt_quoting_style', 'value']
+    assert list(aggregated['mkt_point']) == ['1y', '1y', '2y', '5y']
+    assert list(aggregated['value']) == [2.0, 3.0, 0.05, 1.0]
+
+    thresholded = aggregate_risk((first, second, first), threshold=0.1)
+    assert list(thresholded['mkt_point']) == ['1y', '1y', '5y']
+    assert list(thresholded['value']) == [4.0, 3.0, 2.0]
+
+    with pytest.raises(ValueError):
+        RiskAggregator().result()
+
+
 def test_scalar_with_info_on_instrument():
     # Historically there was a problem with setting risk results that were a scalar with info on an instrument
     # This was because of how copy.deepcopy would try and pickle/unpickle the class. This test checks that we can set
@@ -14,12 +14,17 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import copy
+import datetime as dt
 from dataclasses import field, dataclass
 from enum import Enum
 from typing import Union, Tuple, Optional
+from unittest import mock
+
+import pandas as pd
 
 import gs_quant.base as base
-from gs_quant.base import handle_camel_case_args, Base, EnumBase
+from gs_quant.base import handle_camel_case_args, Base, EnumBase, structural_digest
 from gs_quant.instrument.core import Security
 
 
@@ -109,3 +114,72 @@ def test_security_from_dict():
 
     # Assertions
     assert security.bbid == 'TYU5 Comdty'
+
+
+def test_structural_digest():
+    from gs_quant.target.data import DataQuery
+
+    def query(ids):
+        return DataQuery(where={'bbid': ids, 'pricingLocation': 'NYC'}, start_date=dt.date(2023, 1, 2))
+
+    key = structural_digest(('/data/query', 'POST', {'payload': query(['USDJPY', 'EURUSD']), 'scroll': '30s'}))
+    assert key == structural_digest(('/data/query', 'POST', {'scroll': '30s', 'payload': query(['USDJPY', 'EURUSD'])}))
+    assert key != structural_digest(('/data/query', 'POST', {'payload': query(['USDJPY']), 'scroll': '30s'}))
+    assert structural_digest(1) != structural_digest(1.0) != structural_digest('1')
+    assert structural_digest(TestEnum.Enum_1) != structural_digest(TestEnum.Enum_2)
+
+    frame = pd.DataFrame({'a': [1.0, 2.0]}, index=pd.date_range('2023-01-02', periods=2))
+    assert structural_digest(frame) == structural_digest(frame.copy())
+    assert structural_digest(frame) != structural_digest(frame * 2)
+
+    # digests of Base objects are memoised until an object in the key is modified
+    q = query(['USDJPY', 'EURUSD'])
+    digest = structural_digest(q)
+    with mock.patch.object(base, '_digest_fields', side_effect=AssertionError):
+        assert structural_digest(q) == digest
+    q.where['bbid'] = ['USDJPY']
+    assert structural_digest(q) == structural_digest(query(['USDJPY']))
+    q.start_date = dt.date(2023, 1, 3)
+    assert structural_digest(q) != structural_digest(query(['USDJPY']))
+
+    # copies do not keep the memoised digest, and changing one leaves the digests of other objects memoised
+    digest = structural_digest(q)
+    paged = copy.deepcopy(q)
+    assert '_digest' not in paged.__dict__
+    paged.start_date = dt.date(2023, 1, 4)
+    assert structural_digest(paged) != digest
+    with mock.patch.object(base, '_digest_fields', side_effect=AssertionError):
+        assert structural_digest(q) == digest
+
+    # dataclasses are digested by their fields, and functions by name rather than identity
+    @dataclass
+    class Plain:
+        series: pd.Series
+        fn: object = len
+
+    series = pd.Series([1.0, 2.0])
+    assert structural_digest(Plain(series)) == structural_digest(Plain(series.copy()))
+    assert structural_digest(Plain(series)) != structural_digest(Plain(series * 2))
+    assert structural_digest(Plain(series)) != structural_digest(Plain(series, abs))
+
+    # lambdas share a qualified name, so their code, defaults and closures are digested too
+    def scaled(factor):
+        return lambda x: x * factor
+
+    assert structural_digest(lambda x: x + 1) == structural_digest(lambda x: x + 1)
+    assert structural_digest(lambda x: x + 1) != structural_digest(lambda x: x + 2)
+    assert structural_digest(lambda x: x.price) != structural_digest(lambda x: x.notional)
+    assert structural_digest(lambda x, y=1: x) != structural_digest(lambda x, y=2: x)
+    assert structural_digest(scaled(2)) == structural_digest(scaled(2))
+    assert structural_digest(scaled(2)) != structural_digest(scaled(3))
+
+
+def test_structural_digest_from_instance():
+    from gs_quant.instrument import IRSwap
+
+    swap = IRSwap('Pay', '10y', 'USD')
+    digest = structural_digest(swap)
+    resolved = swap.resolved({'fixed_rate': 0.04}, None)
+    swap.from_instance(resolved)
+    assert structural_digest(swap) != digest
+    assert structural_digest(swap) == structural_digest(resolved)
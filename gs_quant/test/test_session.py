@@ -14,8 +14,14 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import asyncio
 import pickle
 
+import httpx
+import msgpack
+import pytest
+import requests
+
 from gs_quant.session import GsSession, Environment
 
 
@@ -24,3 +30,56 @@ def test_session_pickle():
     pk = pickle.dumps(session)
     unpk = pickle.loads(pk)
     assert unpk is not None
+
+
+def test_msgpack_response_negotiation(mocker):
+    session = GsSession.get(Environment.PROD, 'fake_client_id', 'fake_secret')
+    session._session = requests.Session()
+
+    def accept(path, request_headers=None):
+        params = session._build_request_params(
+            'POST', path, session._build_url(None, path, True), {'a': 1}, request_headers, 65, False, 'data', None
+        )
+        return params['headers']['Accept']
+
+    assert accept('/data/TREOD/query') == GsSession.MSGPACK_ACCEPT
+    assert accept('/data/measures') == GsSession.MSGPACK_ACCEPT
+    assert accept('/risk/calculate/bulk') == GsSession.MSGPACK_ACCEPT
+    assert accept('/data/TREOD/last/query') == '*/*'
+    assert accept('/data/TREOD/query', {'Accept': 'application/json'}) == 'application/json'
+    mocker.patch.object(GsSession, 'USE_MSGPACK', False)
+    assert accept('/data/TREOD/query') == '*/*'
+
+    body = {'data': [{'date': '2019-01-02', 'value': 1.5}]}
+    for content_type in ('application/x-msgpack', 'application/msgpack'):
+        response = httpx.Response(200, content=msgpack.dumps(body), headers={'Content-Type': content_type})
+        assert session._parse_response('id', response, 'POST', 'url', None, False) == body
+
+
+@pytest.mark.asyncio
+async def test_async_host_limit(mocker):
+    session = GsSession.get(Environment.PROD, 'fake_client_id', 'fake_secret')
+    session._session = requests.Session()
+    mocker.patch.object(GsSession, 'ASYNC_MAX_CONNECTIONS_PER_HOST', 2)
+    in_flight, most_in_flight = {}, {}
+
+    async def request(method, url, **kwargs):
+        host = httpx.URL(url).host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        most_in_flight[host] = max(most_in_flight.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, json={'host': host}, headers={'Content-Type': 'application/json'})
+
+    session._init_async()
+    mocker.patch.object(session._session_async, 'request', side_effect=request)
+    results = await asyncio.gather(
+        *(
+            session.async_.get('/data/datasets', domain=domain)
+            for domain in ('https://a.gs.com', 'https://b.gs.com') * 5
+        )
+    )
+
+    assert [result['host'] for result in results] == ['a.gs.com', 'b.gs.com'] * 5
+    assert most_in_flight == {'a.gs.com': 2, 'b.gs.com': 2}
+    await session._close_async()
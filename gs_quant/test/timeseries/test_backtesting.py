@@ -24,7 +24,16 @@ from testfixtures import Replacer
 from testfixtures.mock import Mock
 
 from gs_quant.timeseries import VolReference
-from gs_quant.timeseries.backtesting import Basket, basket_series, MqValueError, MqTypeError, RebalFreq, DataContext
+from gs_quant.timeseries.backtesting import (
+    Basket,
+    basket_series,
+    backtest_basket,
+    backtest_basket_batch,
+    MqValueError,
+    MqTypeError,
+    RebalFreq,
+    DataContext,
+)
 
 
 def test_basket_series():
@@ -92,6 +101,63 @@ def test_basket_series():
     assert_series_equal(ret_wreb, basket_series([wreb, wreb_2], [1, 1], rebal_freq=RebalFreq.WEEKLY))
 
 
+def _loop_backtest_basket(series, weights, costs, rebal_dates):
+    # date by date reference implementation
+    prices = pd.concat(series, axis=1).values
+    output = [100.0]
+    units = output[0] * np.array(weights) / prices[0]
+    prev = 0
+    for i in range(1, len(prices)):
+        output.append(output[-1] + np.dot(units, prices[i] - prices[i - 1]))
+        if i in rebal_dates:
+            actual = np.array(weights) * (prices[i] / prices[prev]) * (output[prev] / output[i])
+            output[i] -= np.dot(costs, np.abs(np.array(weights) - actual)) * output[i]
+            units = output[i] * np.array(weights) / prices[i]
+            prev = i
+    return np.array(output)
+
+
+@pytest.mark.parametrize("rebal_freq", [RebalFreq.DAILY, RebalFreq.WEEKLY, RebalFreq.MONTHLY])
+def test_backtest_basket_rebalances(rebal_freq):
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range('2020-01-01', periods=120)
+    series = [pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 120))), index=dates) for _ in range(3)]
+    weights, costs = [0.5, 0.3, 0.2], [0.001, 0.002, 0.0005]
+
+    if rebal_freq == RebalFreq.DAILY:
+        rebal_dates = set(range(120))
+    elif rebal_freq == RebalFreq.WEEKLY:
+        rebal_dates = {i for i, d in enumerate(dates) if d.weekday() == 2}  # first date is a Wednesday
+    else:
+        rebal_dates = {dates.searchsorted(pd.Timestamp(2020, m, 1)) for m in range(2, 7)}
+
+    output, actual_weights = backtest_basket(series, weights, costs, rebal_freq)
+    np.testing.assert_allclose(output.values, _loop_backtest_basket(series, weights, costs, rebal_dates))
+    np.testing.assert_allclose(actual_weights.iloc[sorted(rebal_dates)[1:]].values, [weights] * (len(rebal_dates) - 1))
+
+    candidates = np.array([weights, [1 / 3] * 3, [1.0, 0.0, 0.0]])
+    levels, batch_weights = backtest_basket_batch(series, candidates, costs, rebal_freq)
+    assert levels.shape == (120, 3)
+    assert batch_weights.shape == (3, 120, 3)
+    for k, candidate in enumerate(candidates):
+        expected_output, expected_weights = backtest_basket(series, list(candidate), costs, rebal_freq)
+        np.testing.assert_allclose(levels[k].values, expected_output.values)
+        np.testing.assert_allclose(batch_weights[k], expected_weights.values)
+
+    with pytest.raises(MqValueError):
+        backtest_basket_batch(series, candidates[:, :2], costs, rebal_freq)
+
+
+def test_backtest_basket_missing_prices():
+    dates = pd.bdate_range('2020-01-01', periods=6)
+    x = pd.Series([100.0, 101, np.nan, 102, 103, 104], index=dates)
+    y = pd.Series([100.0, 100, 100, 100, 100, 100], index=dates)
+    output, actual_weights = backtest_basket([x, y], [0.5, 0.5], None, RebalFreq.MONTHLY)
+    assert output.iloc[:2].notna().all()
+    assert output.iloc[2:].isna().all()
+    assert actual_weights.iloc[2:].isna().all().all()
+
+
 def _mock_spot_data():
     dates = pd.DatetimeIndex(
         [
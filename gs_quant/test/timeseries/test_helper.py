@@ -17,7 +17,7 @@ under the License.
 import datetime as dt
 from enum import IntEnum
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from unittest.mock import Mock
 
 import pandas as pd
@@ -45,6 +45,8 @@ from gs_quant.timeseries.helper import (
     get_dataset_data_with_retries,
     _split_where_conditions,
     get_dataset_with_many_assets,
+    get_dataset_data_with_retries_async,
+    get_dataset_with_many_assets_async,
 )
 
 # TODO test the instance of IntEnum when we have any.
@@ -111,6 +113,24 @@ def test_get_dataset_with_many_assets():
     assert result['assetId'].tolist() == assets
 
 
+@pytest.mark.asyncio
+async def test_get_dataset_with_many_assets_async():
+    mock_dataset = Mock(spec=Dataset)
+
+    async def foo(**kwargs) -> pd.DataFrame:
+        return pd.DataFrame({"assetId": list(kwargs["assetId"]), "column2": [0] * len(kwargs["assetId"])})
+
+    mock_dataset.get_data_async = foo
+
+    assets = [f'Asset{i}' for i in range(150)]
+    result = await get_dataset_with_many_assets_async(
+        ds=mock_dataset, assets=assets, start=dt.date(2023, 1, 1), end=dt.date(2023, 1, 31), batch_limit=100
+    )
+
+    assert len(result) == 150
+    assert result['assetId'].tolist() == assets
+
+
 @plot_function
 def pf():
     pass
@@ -315,6 +335,17 @@ def test_get_dataset_data_with_retries():
     replace.restore()
 
 
+@pytest.mark.asyncio
+async def test_get_dataset_data_with_retries_async():
+    dataset = Mock()
+    dataset.get_data_async = AsyncMock(side_effect=MqRequestError(400, message='Some other error'))
+    with pytest.raises(MqRequestError):
+        await get_dataset_data_with_retries_async(
+            dataset, start=dt.date(2000, 1, 2), end=dt.date(2019, 1, 9), assetId='MA4B66MW5E27U8P32SB', max_retries=0
+        )
+    dataset.get_data_async.assert_awaited_once()
+
+
 def test_split_where_conditions():
     where = dict(tenor=['1m', '2m'], strikeReference='delta_call', relativeStrike=25)
     expected = [
@@ -368,3 +399,32 @@ def test_get_dataset_data_with_retries_recursive_split():
     assert not result.empty
     assert len(result) == 4
     dataset.get_data.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_get_dataset_data_with_retries_async_recursive_split():
+    start = dt.date(2023, 1, 1)
+    end = dt.date(2023, 1, 10)
+
+    async def get_data_async(start, end, **kwargs):
+        if end - start > dt.timedelta(days=5):
+            raise MqRequestError(400, message="Some error occurred")
+        return pd.DataFrame({"data": [start.day, end.day]}, index=[start, end])
+
+    dataset = Mock()
+    dataset.get_data_async = AsyncMock(side_effect=get_data_async)
+
+    result = await get_dataset_data_with_retries_async(dataset, start=start, end=end, max_retries=2, assetId='A')
+
+    # the failed range is split in two, the second half starting the day after the first ends
+    assert result['data'].tolist() == [1, 5, 6, 10]
+    assert [(c.kwargs['start'], c.kwargs['end']) for c in dataset.get_data_async.await_args_list] == [
+        (start, end),
+        (start, dt.date(2023, 1, 5)),
+        (dt.date(2023, 1, 6), end),
+    ]
+    assert all(c.kwargs['assetId'] == 'A' for c in dataset.get_data_async.await_args_list)
+
+    # once the retries are used up, the error is raised
+    with pytest.raises(MqRequestError):
+        await get_dataset_data_with_retries_async(dataset, start=start, end=end, max_retries=0)
@@ -0,0 +1,122 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from gs_quant.data.stream import DataEvent
+from gs_quant.errors import MqValueError
+from gs_quant.timeseries import Window, Returns
+from gs_quant.timeseries.econometrics import volatility
+from gs_quant.timeseries.incremental import (
+    IncrementalBollingerBands,
+    IncrementalExponentialMovingAverage,
+    IncrementalMovingAverage,
+    IncrementalRelativeStrengthIndex,
+    IncrementalVolatility,
+    IncrementalZScores,
+)
+from gs_quant.timeseries.statistics import zscores
+from gs_quant.timeseries.technicals import (
+    bollinger_bands,
+    exponential_moving_average,
+    moving_average,
+    relative_strength_index,
+)
+
+WINDOWS = [22, Window(22, 5), Window(22, 0), '1m', Window('3m', '1m'), '10d']
+
+
+def _prices(dates: bool = False) -> pd.Series:
+    rng = np.random.default_rng(11)
+    index = pd.bdate_range(start='2021-01-01', periods=250)
+    prices = pd.Series(100 + np.cumsum(rng.normal(size=250)), index=index)
+    prices.iloc[[10, 50, 51]] = np.nan
+    return pd.Series(prices.values, index=index.date) if dates else prices
+
+
+def _assert_tail_equal(actual: pd.Series, expected: pd.Series):
+    # batch functions drop the ramp up, which incremental functions report as NaN
+    tail = actual.iloc[len(actual) - len(expected) :]
+    assert actual.iloc[: len(actual) - len(expected)].isna().all()
+    assert_series_equal(tail, expected.astype(float), check_names=False, check_freq=False, check_index_type=False)
+
+
+@pytest.mark.parametrize("dates", [False, True])
+@pytest.mark.parametrize("w", WINDOWS + [Window(None, 0)])
+def test_incremental_moving_average(w, dates):
+    x = _prices(dates)
+    _assert_tail_equal(IncrementalMovingAverage(w).update_series(x), moving_average(x, w))
+
+    bands = IncrementalBollingerBands(w, 1.5).update_series(x)
+    expected = bollinger_bands(x, w, 1.5)
+    _assert_tail_equal(bands['lower'], expected.iloc[:, 0])
+    _assert_tail_equal(bands['upper'], expected.iloc[:, 1])
+
+
+@pytest.mark.parametrize("dates", [False, True])
+@pytest.mark.parametrize("w", WINDOWS)
+def test_incremental_volatility_and_zscores(w, dates):
+    x = _prices(dates)
+    _assert_tail_equal(
+        IncrementalVolatility(w, annualization_factor=252).update_series(x), volatility(x, w, annualization_factor=252)
+    )
+    _assert_tail_equal(
+        IncrementalVolatility(w, Returns.LOGARITHMIC, 252, True).update_series(x),
+        volatility(x, w, Returns.LOGARITHMIC, 252, True),
+    )
+    _assert_tail_equal(IncrementalZScores(w).update_series(x), zscores(x, w))
+
+
+@pytest.mark.parametrize("w", [14, Window(14, 0), Window(10, 3), '1m', Window('1m', 0)])
+def test_incremental_relative_strength_index(w):
+    x = _prices(dates=True)
+    _assert_tail_equal(IncrementalRelativeStrengthIndex(w).update_series(x).iloc[1:], relative_strength_index(x, w))
+
+
+@pytest.mark.parametrize("beta", [0.5, 0.75, 0.9])
+def test_incremental_exponential_moving_average(beta):
+    x = _prices()
+    x.iloc[0] = np.nan
+    _assert_tail_equal(IncrementalExponentialMovingAverage(beta).update_series(x), exponential_moving_average(x, beta))
+
+
+def test_incremental_seed_and_update():
+    x = _prices()
+    expected = zscores(x, Window(22, 0))
+    scores = IncrementalZScores(Window(22, 0), x.iloc[:200])
+    assert scores.value == pytest.approx(expected.iloc[199])
+
+    for time, value in x.iloc[200:-1].items():
+        assert scores.update(time, value) == pytest.approx(expected.loc[time], nan_ok=True)
+    event = DataEvent(x.index[-1].to_pydatetime(), str(x.iloc[-1]))
+    assert scores.update_event(event) == pytest.approx(expected.iloc[-1])
+
+    vol = IncrementalVolatility(22, history=x)
+    assert vol.value == pytest.approx(volatility(x, 22).iloc[-1])
+
+    with pytest.raises(MqValueError):
+        scores.update(dt.date(2021, 1, 1), 1.0)
+    with pytest.raises(MqValueError):
+        IncrementalZScores(Window(None, 0))
+    with pytest.raises(MqValueError):
+        IncrementalVolatility(22)
+    with pytest.raises(MqValueError):
+        IncrementalMovingAverage(0)
@@ -19,7 +19,7 @@ import json
 import os
 from typing import Union, Dict
 from unittest import mock
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import numpy as np
 import pandas as pd
@@ -6192,5 +6192,17 @@ def test_s3_long_short_concentration():
     replace.restore()
 
 
+@pytest.mark.asyncio
+async def test_market_data_timed_async():
+    df = MarketDataResponseFrame({'impliedVolatility': [0.2]}, index=[pd.Timestamp('2019-01-02')])
+    with patch.object(GsDataApi, 'get_market_data_async', AsyncMock(return_value=df)) as market_data:
+        assert await tm._market_data_timed_async({'queries': []}) is df
+        market_data.assert_awaited_once_with({'queries': []}, ignore_errors=False)
+
+        market_data.reset_mock()
+        assert await tm._market_data_timed_async({'queries': []}, 'request', ignore_errors=True) is df
+        market_data.assert_awaited_once_with({'queries': []}, 'request', ignore_errors=True)
+
+
 if __name__ == '__main__':
     pytest.main(args=["test_measures.py"])
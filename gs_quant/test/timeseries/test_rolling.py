@@ -20,7 +20,7 @@ import time
 import numpy as np
 import pandas as pd
 
-from gs_quant.timeseries.helper import rolling_offset
+from gs_quant.timeseries.helper import rolling_offset, rolling_window_bounds, rolling_apply
 
 
 class Timer:
@@ -60,5 +60,59 @@ def test_rolling_date_offset(frequency, count, unit):
     pd.testing.assert_series_equal(expected, a2, obj="generic mean")
 
 
+@pytest.mark.parametrize(
+    "method_name,function",
+    [
+        ('min', np.nanmin),
+        ('max', np.nanmax),
+        ('sum', np.nansum),
+        ('mean', np.nanmean),
+        ('var', lambda a: np.nanvar(a, ddof=1)),
+        ('std', lambda a: np.nanstd(a, ddof=1)),
+    ],
+)
+@pytest.mark.parametrize("unit,count", [('months', 3), ('years', 1)])
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_rolling_offset_window_reducers(method_name, function, unit, count):
+    length = 1000
+    rng = np.random.default_rng(42)
+    values = [rng.normal(100, 5) if rng.random() > 0.1 else np.nan for _ in range(length)]
+    values[:5] = [np.nan] * 5
+    s = pd.Series(values, index=pd.bdate_range(start=dt.date(2015, 1, 1), periods=length))
+    offset = pd.DateOffset(**{unit: count})
+
+    expected = pd.Series(
+        [function(s.loc[(s.index > idx - offset) & (s.index <= idx)].values) for idx in s.index], index=s.index
+    )
+
+    with Timer(f'rolling {method_name} over {count}{unit}'):
+        actual = rolling_offset(s, offset, function, method_name)
+    pd.testing.assert_series_equal(expected, actual, rtol=1e-10)
+
+    dates = pd.Series(values, index=s.index.date)
+    pd.testing.assert_series_equal(
+        pd.Series(expected.values, index=dates.index), rolling_offset(dates, offset, function, method_name)
+    )
+
+
+def test_rolling_window_bounds():
+    index = pd.DatetimeIndex(['2020-01-31', '2020-02-28', '2020-02-29', '2020-03-30', '2020-03-31'])
+    starts, ends = rolling_window_bounds(index, pd.DateOffset(months=1))
+    np.testing.assert_array_equal(starts, [0, 0, 0, 3, 3])
+    np.testing.assert_array_equal(ends, [1, 2, 3, 4, 5])
+
+    starts, ends = rolling_window_bounds(pd.Index(index.date), pd.DateOffset(months=1))
+    np.testing.assert_array_equal(starts, [0, 0, 0, 3, 3])
+
+    s = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0], index=index)
+    pd.testing.assert_series_equal(
+        rolling_apply(s, pd.DateOffset(months=1), np.sum), pd.Series([1.0, 3.0, 6.0, 4.0, 9.0], index=index)
+    )
+    # unsorted indices fall back to label based windows
+    pd.testing.assert_series_equal(
+        rolling_apply(s[::-1], pd.DateOffset(months=1), np.sum), pd.Series([9.0, 4.0, 6.0, 3.0, 1.0], index=index[::-1])
+    )
+
+
 if __name__ == "__main__":
     pytest.main(args=["test_rolling.py", "-s"])
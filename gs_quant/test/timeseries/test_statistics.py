@@ -52,6 +52,14 @@ from gs_quant.timeseries.statistics import (
     SIRModel,
     SEIRModel,
     MeanType,
+    min_frame,
+    max_frame,
+    sum_frame,
+    mean_frame,
+    std_frame,
+    var_frame,
+    zscores_frame,
+    percentiles_frame,
 )
 
 
@@ -793,6 +801,54 @@ def test_percentile_str():
     assert_series_equal(actual, expected)
 
 
+@pytest.mark.parametrize(
+    "frame_fn,series_fn",
+    [
+        (min_frame, min_),
+        (max_frame, max_),
+        (sum_frame, sum_),
+        (mean_frame, mean),
+        (std_frame, std),
+        (var_frame, var),
+        (zscores_frame, zscores),
+        (percentiles_frame, lambda x, w: percentiles(x, w=w)),
+    ],
+)
+@pytest.mark.parametrize("window", [Window(None, 0), 22, Window(22, 10), '1m', '10d', Window('3m', '1m')])
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_rolling_frame_statistics(frame_fn, series_fn, window):
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range(start=dt.date(2020, 1, 1), periods=150)
+    frame = pd.DataFrame(rng.normal(size=(150, 3)), index=index, columns=['a', 'b', 'c'])
+    frame.iloc[rng.random((150, 3)) < 0.05] = np.nan
+    frame['d'] = 1.0
+
+    actual = frame_fn(frame, window)
+    assert list(actual.columns) == list(frame.columns)
+    for column in frame.columns:
+        expected = series_fn(frame[column], window).astype(float)
+        assert_series_equal(actual[column], expected, check_names=False, check_freq=False, atol=1e-9)
+
+    dates = frame.set_axis(index.date)
+    pd.testing.assert_frame_equal(frame_fn(dates, window).set_axis(actual.index), actual, check_freq=False)
+
+
+def test_rolling_frame_statistics_edge_cases():
+    frame = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [3.0, 2.0, 1.0]}, index=pd.bdate_range('2021-01-01', periods=3))
+
+    assert min_frame(frame, Window(5, 0)).empty
+    assert list(min_frame(frame, Window(5, 0)).columns) == ['a', 'b']
+    assert percentiles_frame(frame, Window(5, 0)).empty
+    assert zscores_frame(frame.iloc[:0]).empty
+    pd.testing.assert_frame_equal(
+        zscores_frame(frame.iloc[:1]), pd.DataFrame(0.0, index=frame.index[:1], columns=['a', 'b'])
+    )
+    pd.testing.assert_frame_equal(mean_frame(frame, 2, MeanType.QUADRATIC), np.sqrt(mean_frame(frame**2, 2)))
+
+    with pytest.raises(MqValueError):
+        zscores_frame(frame.reset_index(drop=True), '1m')
+
+
 def test_regression():
     x1 = pd.Series([0.0, 1.0, 4.0, 9.0, 16.0, 25.0, np.nan], index=pd.date_range('2019-1-1', periods=7), name='x1')
     x2 = pd.Series([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0], index=pd.date_range('2019-1-1', periods=8))
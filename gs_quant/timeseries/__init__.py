@@ -21,6 +21,7 @@ from .datetime import *
 from .econometrics import *
 from .event_study import *
 from .helper import *
+from .incremental import *
 from .measures import *
 from .measures_countries import *
 from .measures_fx_vol import *
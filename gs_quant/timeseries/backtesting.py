@@ -54,6 +54,83 @@ RebalFreq = _create_enum('RebalFreq', ['Daily', 'Weekly', 'Monthly'])
 ReturnType = _create_enum('ReturnType', ['excess_return'])
 
 
+def _align_basket_inputs(series: list, weights: list, costs: list) -> tuple:
+    # For all inputs which are Pandas series, get the intersection of their calendars
+    cal = pd.DatetimeIndex(
+        reduce(
+            np.intersect1d,
+            (curve.index for curve in series + weights + costs if isinstance(curve, pd.Series)),
+        )
+    )
+
+    # Reindex inputs and convert to pandas dataframes
+    series = pd.concat([curve.reindex(cal) for curve in series], axis=1)
+    weights = pd.concat([pd.Series(w, index=cal) for w in weights], axis=1)
+    costs = pd.concat([pd.Series(c, index=cal) for c in costs], axis=1)
+    return cal, series, weights, costs
+
+
+def _rebalance_mask(cal: pd.DatetimeIndex, rebal_freq: RebalFreq) -> np.ndarray:
+    if rebal_freq == RebalFreq.DAILY:
+        return np.ones(len(cal), dtype=bool)
+
+    if rebal_freq == RebalFreq.WEEKLY:
+        # Get hypothetical weekly rebalances
+        num_rebals = ((cal[-1] - cal[0]).days) // 7
+        rebal_dates = [cal[0] + i * rdelta(weeks=1) for i in range(num_rebals + 1)]
+    else:
+        # Get hypothetical monthly rebalances
+        num_rebals = (cal[-1].year - cal[0].year) * 12 + cal[-1].month - cal[0].month
+        rebal_dates = [cal[0] + i * rdelta(months=1) for i in range(num_rebals + 1)]
+
+    # Convert the hypothetical weekly/monthly rebalance dates to actual calendar days
+    rebal_dates = pd.DatetimeIndex([date for date in rebal_dates if date < cal[-1]])
+    mask = np.zeros(len(cal), dtype=bool)
+    mask[cal.searchsorted(rebal_dates, side='left')] = True
+    return mask
+
+
+def _backtest_basket_paths(prices: np.ndarray, weights: np.ndarray, costs: np.ndarray, rebalance: np.ndarray) -> tuple:
+    """
+    Evolve a batch of baskets between rebalances with vector operations
+
+    :param prices: prices of shape (dates, assets)
+    :param weights: target weights of shape (baskets, dates, assets)
+    :param costs: execution costs of shape (baskets, dates, assets)
+    :param rebalance: boolean mask of rebalance dates
+    :return: basket levels of shape (baskets, dates) and actual weights of shape (baskets, dates, assets)
+    """
+    rebalance = rebalance.copy()
+    rebalance[0] = True  # the basket is struck on the first date
+    positions = np.arange(len(rebalance))
+    latest = np.maximum.accumulate(np.where(rebalance, positions, 0))
+    previous = np.concatenate(([0], latest[:-1]))  # last rebalance strictly before each date
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # units held since the previous rebalance are fixed, so performance over a segment only depends on the prices
+        # relative to the rebalance date and the weights set on it
+        relative = prices / prices[previous]
+        held_weights = weights[:, previous, :]
+        growth = 1 + np.sum(held_weights * (relative - 1), axis=-1)
+        drifted = held_weights * relative / growth[..., np.newaxis]
+
+        traded = rebalance.copy()
+        traded[0] = False
+        step = growth
+        step[:, traded] *= 1 - np.sum(costs[:, traded] * np.abs(weights[:, traded] - drifted[:, traded]), axis=-1)
+
+    struck = 100 * np.cumprod(np.where(rebalance, step, 1), axis=1)
+    levels = struck[:, previous] * step
+    levels[:, 0] = 100
+
+    # a missing level makes every later level missing
+    missing = np.logical_or.accumulate(np.isnan(levels), axis=1)
+    levels[missing] = np.nan
+    drifted[missing] = np.nan
+    actual_weights = np.where(rebalance[np.newaxis, :, np.newaxis], weights, drifted)
+    return levels, actual_weights
+
+
 def backtest_basket(
     series: list,
     weights: list,
@@ -70,75 +147,67 @@ def backtest_basket(
     if len(weights) != num_assets or len(weights) != len(costs):
         raise MqValueError("series, weights, and cost lists must have the same length")
 
-    # For all inputs which are Pandas series, get the intersection of their calendars
-    cal = pd.DatetimeIndex(
-        reduce(
-            np.intersect1d,
-            (curve.index for curve in series + weights + costs if isinstance(curve, pd.Series)),
-        )
+    cal, series, weights, costs = _align_basket_inputs(series, weights, costs)
+    levels, actual_weights = _backtest_basket_paths(
+        series.values.astype(float),
+        weights.values.astype(float)[np.newaxis],
+        costs.values.astype(float)[np.newaxis],
+        _rebalance_mask(cal, rebal_freq),
     )
 
-    # Reindex inputs and convert to pandas dataframes
-    series = pd.concat([curve.reindex(cal) for curve in series], axis=1)
-    weights = pd.concat([pd.Series(w, index=cal) for w in weights], axis=1)
-    costs = pd.concat([pd.Series(c, index=cal) for c in costs], axis=1)
+    # Copy results back to pandas objects
+    output = pd.Series(levels[0], index=cal)
+    actual_weights = pd.DataFrame(actual_weights[0], index=cal, columns=series.columns)
+    return output, actual_weights
 
-    if rebal_freq == RebalFreq.DAILY:
-        rebal_dates = cal
-    else:
-        if rebal_freq == RebalFreq.WEEKLY:
-            # Get hypothetical weekly rebalances
-            num_rebals = ((cal[-1] - cal[0]).days) // 7
-            rebal_dates = [cal[0] + i * rdelta(weeks=1) for i in range(num_rebals + 1)]
-        else:
-            # Get hypothetical monthly rebalances
-            num_rebals = (cal[-1].year - cal[0].year) * 12 + cal[-1].month - cal[0].month
-            rebal_dates = [cal[0] + i * rdelta(months=1) for i in range(num_rebals + 1)]
-
-        # Convert the hypothetical weekly/monthly rebalance dates to actual calendar days
-        rebal_dates = [min(cal[cal >= date]) for date in rebal_dates if date < max(cal)]
-
-    n = len(cal)
-    output_arr = np.zeros(n)
-    units_arr = np.zeros((n, num_assets))
-    actual_weights_arr = np.zeros((n, num_assets))
-
-    # Initialize backtest
-    output_arr[0] = 100
-    units_arr[0,] = output_arr[0] * weights.values[0,] / series.values[0,]
-    actual_weights_arr[0,] = weights.values[0,]
-
-    # Run backtest
-    prev_rebal = 0
-    for i, date in enumerate(cal[1:], 1):
-        # Update performance
-        output_arr[i] = output_arr[i - 1] + np.dot(units_arr[i - 1,], series.values[i,] - series.values[i - 1,])
-
-        actual_weights_arr[i,] = (
-            weights.values[prev_rebal,]
-            * (series.values[i,] / series.values[prev_rebal,])
-            * (output_arr[prev_rebal] / output_arr[i])
-        )
 
-        # Rebalance on rebal_dates
-        if date in rebal_dates:
-            # Compute costs
-            output_arr[i] -= (
-                np.dot(costs.values[i,], np.abs(weights.values[i,] - actual_weights_arr[i,])) * output_arr[i]
-            )
+def backtest_basket_batch(
+    series: list,
+    weights: np.ndarray,
+    costs: list = None,
+    rebal_freq: RebalFreq = RebalFreq.DAILY,
+) -> tuple:
+    """
+    Backtest many candidate weightings of the same basket in one pass
 
-            # Rebalance
-            units_arr[i,] = output_arr[i] * weights.values[i,] / series.values[i,]
-            prev_rebal = i
+    :param series: list of time series of instrument prices
+    :param weights: array of shape (baskets, assets), with one row of constant weights per candidate basket
+    :param costs: list of execution costs in decimal (defaults to costs of 0)
+    :param rebal_freq: rebalancing frequency - Daily, Weekly or Monthly (defaults to Daily)
+    :return: frame of basket levels with one column per candidate, and array of actual weights of shape
+        (baskets, dates, assets)
 
-            actual_weights_arr[i,] = weights.values[i,]
-        else:
-            units_arr[i,] = units_arr[i - 1,]
+    **Usage**
 
-    # Copy results back to pandas objects
-    output = pd.Series(output_arr, index=cal)
-    actual_weights = pd.DataFrame(actual_weights_arr, index=cal, columns=series.columns)
-    return output, actual_weights
+    Equivalent to calling :func:`backtest_basket` with each row of weights, but evaluates all candidates together
+    with array operations over the rebalance segments.
+
+    **Examples**
+
+    Compare monthly rebalanced 70%/30% and 50%/50% baskets
+
+    >>> prices1 = generate_series(100)
+    >>> prices2 = generate_series(100)
+    >>> levels, actual_weights = backtest_basket_batch([prices1, prices2], [[0.7, 0.3], [0.5, 0.5]], None, monthly)
+    """
+    num_assets = len(series)
+    costs = costs or [0] * num_assets
+    weights = np.asarray(weights, dtype=float)
+
+    if not all(isinstance(x, pd.Series) for x in series):
+        raise MqTypeError("expected a list of series")
+
+    if weights.ndim != 2 or weights.shape[1] != num_assets or len(costs) != num_assets:
+        raise MqValueError("weights must have one column per series, and costs one entry per series")
+
+    cal, series, _, costs = _align_basket_inputs(series, [0] * num_assets, costs)
+    levels, actual_weights = _backtest_basket_paths(
+        series.values.astype(float),
+        np.broadcast_to(weights[:, np.newaxis, :], (len(weights), len(cal), num_assets)),
+        costs.values.astype(float)[np.newaxis],
+        _rebalance_mask(cal, rebal_freq),
+    )
+    return pd.DataFrame(levels.T, index=cal), actual_weights
 
 
 @plot_function
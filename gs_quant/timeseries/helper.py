@@ -14,17 +14,20 @@ specific language governing permissions and limitations
 under the License.
 """
 
+import asyncio
 import datetime as dt
 import inspect
 import logging
 import os
 import re
+from collections import deque
 from enum import Enum, IntEnum
 from functools import wraps, partial
-from typing import Optional, Union, List, Iterable, Callable
+from typing import Optional, Union, List, Iterable, Callable, Tuple
 
 import numpy as np
 import pandas as pd
+from pandas.api.indexers import BaseIndexer
 
 from gs_quant.api.gs.data import QueryType
 from gs_quant.api.utils import ThreadPoolManager
@@ -83,6 +86,11 @@ except ImportError as e:
     _logger.debug('unable to import rolling_apply extension: %s', e)
 
     def rolling_apply(s: pd.Series, offset: pd.DateOffset, function: Callable[[np.ndarray], float]) -> pd.Series:
+        if s.index.is_monotonic_increasing:
+            values = np.asarray(s.values)
+            starts, ends = rolling_window_bounds(s.index, offset)
+            results = [function(values[start:end]) for start, end in zip(starts, ends)]
+            return pd.Series(results, index=s.index, dtype=np.double)
         if isinstance(s.index, pd.DatetimeIndex):
             values = [function(s.loc[(s.index > (idx - offset)) & (s.index <= idx)]) for idx in s.index]
         else:
@@ -90,6 +98,101 @@ except ImportError as e:
         return pd.Series(values, index=s.index, dtype=np.double)
 
 
+def rolling_window_bounds(index: pd.Index, offset: pd.DateOffset) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions of the rolling windows (idx - offset, idx] for each label of a monotonic increasing index
+
+    :param index: monotonic increasing index of dates or datetimes
+    :param offset: window size as a date offset
+    :return: start (inclusive) and end (exclusive) positions of each window
+    """
+    times = index if isinstance(index, pd.DatetimeIndex) else pd.DatetimeIndex(pd.to_datetime(index))
+    starts = times.searchsorted(times - offset, side='right')
+    ends = np.arange(1, len(times) + 1)
+    return np.asarray(starts, dtype=np.int64), ends
+
+
+def _rolling_extreme(values: np.ndarray, starts: np.ndarray, ends: np.ndarray, maximum: bool) -> np.ndarray:
+    # monotone deque of candidate positions, ignoring NaNs as np.nanmin/np.nanmax do
+    points = values.tolist()
+    results = np.full(len(ends), np.nan)
+    window = deque()
+    pushed = 0
+    for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        while pushed < end:
+            value = points[pushed]
+            if value == value:
+                if maximum:
+                    while window and points[window[-1]] <= value:
+                        window.pop()
+                else:
+                    while window and points[window[-1]] >= value:
+                        window.pop()
+                window.append(pushed)
+            pushed += 1
+        while window and window[0] < start:
+            window.popleft()
+        if window:
+            results[i] = points[window[0]]
+    return results
+
+
+def _rolling_moments(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, ...]:
+    # window counts, sums and sums of squares from running totals; values are shifted by their mean to limit
+    # cancellation in the sum of squares
+    valid = ~np.isnan(values)
+    shift = values[valid].mean() if valid.any() else 0.0
+    shifted = np.where(valid, values - shift, 0.0)
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    sums = np.concatenate(([0.0], np.cumsum(shifted)))
+    squares = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+    return counts[ends] - counts[starts], sums[ends] - sums[starts], squares[ends] - squares[starts], shift
+
+
+def _rolling_sum(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    counts, sums, _, shift = _rolling_moments(values, starts, ends)
+    return sums + counts * shift
+
+
+def _rolling_mean(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    counts, sums, _, shift = _rolling_moments(values, starts, ends)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts + shift, np.nan)
+
+
+def _rolling_var(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    counts, sums, squares, _ = _rolling_moments(values, starts, ends)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = (squares - sums * sums / counts) / (counts - 1)
+    return np.where(counts > 1, np.maximum(variance, 0.0), np.nan)
+
+
+def _rolling_std(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    return np.sqrt(_rolling_var(values, starts, ends))
+
+
+class _WindowBoundsIndexer(BaseIndexer):
+    # pandas indexer over precomputed window positions, so DataFrame.rolling can evaluate calendar-offset windows
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        super().__init__()
+        self.starts = starts
+        self.ends = ends
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None, closed=None, step=None):
+        return self.starts, self.ends
+
+
+# reducers over window bounds, keyed by the name of the equivalent method on pandas Rolling objects
+_ROLLING_REDUCERS = {
+    'min': partial(_rolling_extreme, maximum=False),
+    'max': partial(_rolling_extreme, maximum=True),
+    'sum': _rolling_sum,
+    'mean': _rolling_mean,
+    'var': _rolling_var,
+    'std': _rolling_std,
+}
+
+
 def _create_enum(name, members):
     return Enum(name, {n.upper(): n.lower() for n in members}, module=__name__)
 
@@ -181,10 +284,10 @@ def _check_window(series_length: int, window: Window):
             raise MqValueError('Ramp value must be less than the length of the series and greater than zero.')
 
 
-def apply_ramp(x: pd.Series, window: Window) -> pd.Series:
+def apply_ramp(x: Union[pd.Series, pd.DataFrame], window: Window) -> Union[pd.Series, pd.DataFrame]:
     _check_window(len(x), window)
     if isinstance(window.w, int) and window.w > len(x):  # does not restrict window size when it is a DataOffset
-        return pd.Series(dtype=float)
+        return pd.DataFrame(columns=x.columns, dtype=float) if isinstance(x, pd.DataFrame) else pd.Series(dtype=float)
     if isinstance(window.r, pd.DateOffset):
         if np.issubdtype(x.index, dt.date):
             return x.loc[(x.index[0] + window.r).date() :]
@@ -386,6 +489,39 @@ def get_dataset_with_many_assets(
     return pd.concat(results)
 
 
+async def get_dataset_data_with_retries_async(
+    dataset: Dataset, *, start: dt.date, end: dt.date, count: int = 0, max_retries: int = 5, **kwargs
+) -> pd.DataFrame:
+    try:
+        data = await dataset.get_data_async(start=start, end=end, **kwargs)
+    except MqRequestError as e:
+        if count < max_retries:
+            mid = start + (end - start) / 2
+            count += 1
+            first_half_results, second_half_results = await asyncio.gather(
+                get_dataset_data_with_retries_async(dataset, start=start, end=mid, count=count, **kwargs),
+                get_dataset_data_with_retries_async(
+                    dataset, start=mid + dt.timedelta(days=1), end=end, count=count, **kwargs
+                ),
+            )
+            data = pd.concat([first_half_results, second_half_results]).sort_index()
+        else:
+            raise e
+    return data
+
+
+async def get_dataset_with_many_assets_async(
+    ds: Dataset, *, assets: List[str], start: dt.date, end: dt.date, batch_limit: int = 100, **kwargs
+) -> pd.DataFrame:
+    results = await asyncio.gather(
+        *(
+            ds.get_data_async(assetId=assets[i : i + batch_limit], start=start, end=end, return_type=None, **kwargs)
+            for i in range(0, len(assets), batch_limit)
+        )
+    )
+    return pd.concat(results)
+
+
 def _month_to_tenor(months: int) -> str:
     return f'{months // 12}y' if months % 12 == 0 else f'{months}m'
 
@@ -411,12 +547,50 @@ def _pandas_roll(s: pd.Series, window_str: str, method_name: str):
     return getattr(s.rolling(window_str), method_name)()
 
 
+def _fixed_window_str(offset: pd.DateOffset) -> Optional[str]:
+    # frequencies that can be passed to Series.rolling
+    fixed = {'hour': 'h', 'hours': 'h', 'day': 'D', 'days': 'D'}
+
+    if len(offset.kwds) == 1:
+        freq, count = offset.kwds.popitem()
+        if freq in fixed:
+            return f'{count}{fixed[freq]}'
+    return None
+
+
+def rolling_offset_frame(x: pd.DataFrame, offset: pd.DateOffset, method_name: str, **kwargs) -> pd.DataFrame:
+    """
+    Perform rolling window calculations on every column of a frame in one pass, using the same windows as
+    rolling_offset.
+
+    :param x: frame of time series with a monotonic increasing index
+    :param offset: window size as a date offset
+    :param method_name: name of method to call on each window (must be a method on Rolling object)
+    :param kwargs: keyword arguments for the method
+    :return: result frame
+    """
+    window_str = _fixed_window_str(offset)
+    if window_str:
+        if isinstance(x.index, pd.DatetimeIndex):
+            return getattr(x.rolling(window_str), method_name)(**kwargs)
+        t = x.copy(deep=False)
+        t.index = pd.to_datetime(t.index)  # needed for DataFrame.rolling
+        result = getattr(t.rolling(window_str), method_name)(**kwargs)
+        result.index = x.index
+        return result
+
+    starts, ends = rolling_window_bounds(x.index, offset)
+    return getattr(x.rolling(_WindowBoundsIndexer(starts, ends), min_periods=0), method_name)(**kwargs)
+
+
 def rolling_offset(
     s: pd.Series, offset: pd.DateOffset, function: Callable[[np.ndarray], float], method_name: str = None
 ) -> pd.Series:
     """
     Perform rolling window calculations. If offset has a fixed frequency and method name is provided, will use
     `Series.rolling< https://pandas.pydata.org/docs/reference/api/pandas.Series.rolling.html>`_ for best performance.
+    Otherwise min, max, sum, mean, var and std are computed in linear time from the window bounds, and other
+    functions are applied to each window.
 
     :param s: time series
     :param offset: window size as a date offset
@@ -424,18 +598,20 @@ def rolling_offset(
     :param method_name: name of method to call on each window (must be a method on Rolling object)
     :return: result time series
     """
-    # frequencies that can be passed to Series.rolling
-    fixed = {'hour': 'h', 'hours': 'h', 'day': 'D', 'days': 'D'}
-
-    if method_name and len(offset.kwds) == 1:
-        freq, count = offset.kwds.popitem()
-        if freq in fixed:
-            window_str = f'{count}{fixed[freq]}'
-            if np.issubdtype(s.index, np.datetime64):
-                return _pandas_roll(s, window_str, method_name)
-            else:
-                t = s.copy(deep=False)
-                t.index = pd.to_datetime(t.index)  # needed for Series.rolling
-                return pd.Series(_pandas_roll(t, window_str, method_name), index=s.index)
+    window_str = _fixed_window_str(offset)
+    if method_name and window_str:
+        if np.issubdtype(s.index, np.datetime64):
+            return _pandas_roll(s, window_str, method_name)
+        else:
+            t = s.copy(deep=False)
+            t.index = pd.to_datetime(t.index)  # needed for Series.rolling
+            return pd.Series(_pandas_roll(t, window_str, method_name), index=s.index)
+
+    reducer = _ROLLING_REDUCERS.get(method_name)
+    if reducer is not None and s.index.is_monotonic_increasing:
+        values = np.asarray(s.values, dtype=np.double)
+        if not np.isinf(values).any():
+            starts, ends = rolling_window_bounds(s.index, offset)
+            return pd.Series(reducer(values, starts, ends), index=s.index, dtype=np.double)
 
     return rolling_apply(s, offset, function)
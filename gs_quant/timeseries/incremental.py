@@ -0,0 +1,520 @@
+"""
+Copyright 2026 Goldman Sachs.
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+  http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+import datetime as dt
+import math
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from gs_quant.data.stream import DataEvent
+from .econometrics import _get_annualization_factor
+from .helper import Window, Returns, normalize_window
+from ..errors import MqValueError
+
+"""
+Incremental library provides stateful counterparts of rolling timeseries functions. Each object can be seeded from a
+historical series and then updated one observation at a time, producing the values the batch function would produce
+for the same observations, without recomputing whole windows.
+"""
+
+
+def _normalize_window(w: Union[Window, int, str, None]) -> Window:
+    size = w.w if isinstance(w, Window) else w
+    if isinstance(size, int) and size <= 0:
+        raise MqValueError('Window value must be greater than zero.')
+    window = normalize_window(pd.Series(dtype=float), w, default_window=0)
+    # a window of the full series grows with every observation
+    return Window(None if isinstance(window.w, int) and window.w == 0 else window.w, window.r)
+
+
+class _RollingWindow:
+    """Running count, sum and sum of squares of the observations in a rolling window"""
+
+    def __init__(self, size: Union[int, pd.DateOffset, None]):
+        self.__size = size if isinstance(size, int) else None
+        self.__offset = size if isinstance(size, pd.DateOffset) else None
+        self.__points = deque()
+        self.__evicted = 0
+        self.__reset()
+
+    def __reset(self):
+        self.count = 0
+        self.missing = 0
+        self.__shift = None
+        self.__total = 0.0
+        self.__squares = 0.0
+
+    def __len__(self) -> int:
+        return len(self.__points)
+
+    def __include(self, value: float):
+        if value != value:
+            self.missing += 1
+            return
+        if self.__shift is None:
+            self.__shift = value  # sums are kept relative to a shift to limit cancellation
+        diff = value - self.__shift
+        self.count += 1
+        self.__total += diff
+        self.__squares += diff * diff
+
+    def __exclude(self, value: float):
+        if value != value:
+            self.missing -= 1
+            return
+        diff = value - self.__shift
+        self.count -= 1
+        self.__total -= diff
+        self.__squares -= diff * diff
+
+    def add(self, time: pd.Timestamp, value: float):
+        self.__points.append((time, value))
+        self.__include(value)
+        while (self.__size is not None and len(self.__points) > self.__size) or (
+            self.__offset is not None and self.__points[0][0] <= time - self.__offset
+        ):
+            self.__exclude(self.__points.popleft()[1])
+            self.__evicted += 1
+
+        if self.__evicted > len(self.__points):
+            # recompute from the window to stop rounding errors accumulating, amortised over the evictions
+            self.__evicted = 0
+            self.__reset()
+            for _, point in self.__points:
+                self.__include(point)
+
+    @property
+    def mean(self) -> float:
+        return self.__total / self.count + self.__shift if self.count > 0 else np.nan
+
+    @property
+    def mean_square(self) -> float:
+        if self.count < 1:
+            return np.nan
+        return (self.__squares + 2 * self.__shift * self.__total) / self.count + self.__shift * self.__shift
+
+    @property
+    def var(self) -> float:
+        if self.count < 2:
+            return np.nan
+        return max((self.__squares - self.__total * self.__total / self.count) / (self.count - 1), 0.0)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
+
+
+class _Ramp:
+    """Tracks whether observations are past the ramp up of a window"""
+
+    def __init__(self, ramp: Union[int, pd.DateOffset]):
+        self.__ramp = ramp
+        self.__count = 0
+        self.__start = None
+
+    def update(self, time: pd.Timestamp) -> bool:
+        self.__count += 1
+        if isinstance(self.__ramp, pd.DateOffset):
+            if self.__start is None:
+                self.__start = time + self.__ramp
+            return time >= self.__start
+        return self.__count > self.__ramp
+
+
+class IncrementalFunction(metaclass=ABCMeta):
+    """
+    Base class for incremental timeseries functions
+
+    Observations must be provided in increasing time order. Results during the ramp up of the window are NaN.
+    """
+
+    def __init__(self):
+        self.__last_time = None
+        self.value = np.nan
+
+    @abstractmethod
+    def _update(self, time: pd.Timestamp, value: float): ...
+
+    def update(self, time: Union[dt.date, dt.datetime], value: Union[None, str, float]):
+        """
+        Add an observation
+
+        :param time: time of the observation
+        :param value: observed value, None for a missing value
+        :return: value of the function after the observation
+        """
+        time = pd.Timestamp(time)
+        if self.__last_time is not None and time < self.__last_time:
+            raise MqValueError(f'observation at {time} is before the last observation at {self.__last_time}')
+        self.__last_time = time
+        self.value = self._update(time, np.nan if value is None else float(value))
+        return self.value
+
+    def update_event(self, event: DataEvent):
+        """
+        Add an observation from a data update event
+
+        :param event: data update event
+        :return: value of the function after the observation
+        """
+        return self.update(event.time, event.value)
+
+    def update_series(self, series: pd.Series) -> pd.Series:
+        """
+        Add each observation of a series
+
+        :param series: time series of observations, later than any previous observation
+        :return: time series of values of the function after each observation
+        """
+        return pd.Series([self.update(t, v) for t, v in series.items()], index=series.index, dtype=float)
+
+
+class IncrementalMovingAverage(IncrementalFunction):
+    """
+    Incremental moving average
+
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to all observations.
+    :param history: time series of observations to seed the average with
+
+    **Usage**
+
+    Each update gives the value of :func:`moving_average` at the new observation in O(1) time.
+
+    **Examples**
+
+    >>> prices = generate_series(100)
+    >>> average = IncrementalMovingAverage(22, prices)
+    >>> average.update(dt.date.today() + dt.timedelta(days=1), 101.5)
+
+    **See also**
+
+    :func:`moving_average`
+    """
+
+    def __init__(self, w: Union[Window, int, str] = Window(None, 0), history: Optional[pd.Series] = None):
+        super().__init__()
+        w = _normalize_window(w)
+        self.__window = _RollingWindow(w.w)
+        self.__ramp = _Ramp(w.r)
+        if history is not None:
+            self.update_series(history)
+
+    def _update(self, time: pd.Timestamp, value: float) -> float:
+        self.__window.add(time, value)
+        return self.__window.mean if self.__ramp.update(time) else np.nan
+
+
+class IncrementalBollingerBands(IncrementalFunction):
+    """
+    Incremental Bollinger bands
+
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to all observations.
+    :param k: band width in standard deviations (default: 2)
+    :param history: time series of observations to seed the bands with
+
+    **Usage**
+
+    Each update gives the lower and upper values of :func:`bollinger_bands` at the new observation in O(1) time.
+
+    **Examples**
+
+    >>> prices = generate_series(100)
+    >>> bands = IncrementalBollingerBands(20, 2, prices)
+    >>> lower, upper = bands.update(dt.date.today() + dt.timedelta(days=1), 101.5)
+
+    **See also**
+
+    :func:`bollinger_bands`
+    """
+
+    def __init__(self, w: Union[Window, int, str] = Window(None, 0), k: float = 2, history: Optional[pd.Series] = None):
+        super().__init__()
+        w = _normalize_window(w)
+        self.__window = _RollingWindow(w.w)
+        self.__ramp = _Ramp(w.r)
+        self.__k = k
+        self.value = (np.nan, np.nan)
+        if history is not None:
+            self.update_series(history)
+
+    def _update(self, time: pd.Timestamp, value: float) -> Tuple[float, float]:
+        self.__window.add(time, value)
+        if not self.__ramp.update(time):
+            return np.nan, np.nan
+        avg, width = self.__window.mean, self.__k * self.__window.std
+        return avg - width, avg + width
+
+    def update_series(self, series: pd.Series) -> pd.DataFrame:
+        """
+        Add each observation of a series
+
+        :param series: time series of observations, later than any previous observation
+        :return: lower and upper bands after each observation
+        """
+        bands = [self.update(t, v) for t, v in series.items()]
+        return pd.DataFrame(bands, index=series.index, columns=['lower', 'upper'], dtype=float)
+
+
+class IncrementalExponentialMovingAverage(IncrementalFunction):
+    """
+    Incremental exponentially weighted moving average
+
+    :param beta: how much to weigh the previous observations in the time series, thus controlling how much importance we
+        place on the (more distant) past. Must be between 0 (inclusive) and 1 (exclusive)
+    :param history: time series of observations to seed the average with
+
+    **Usage**
+
+    Each update gives the value of :func:`exponential_moving_average` at the new observation in O(1) time. Missing
+    values decay the weight of the previous average as in the batch function.
+
+    **Examples**
+
+    >>> prices = generate_series(100)
+    >>> average = IncrementalExponentialMovingAverage(0.9, prices)
+    >>> average.update(dt.date.today() + dt.timedelta(days=1), 101.5)
+
+    **See also**
+
+    :func:`exponential_moving_average`
+    """
+
+    def __init__(self, beta: float = 0.75, history: Optional[pd.Series] = None):
+        super().__init__()
+        self.__com = 1.0 / (1 - beta) - 1.0
+        self.__alpha = 1.0 / (1.0 + self.__com)
+        self.__weighted = np.nan
+        self.__old_weight = 1.0
+        if history is not None:
+            self.update_series(history)
+
+    def _update(self, time: pd.Timestamp, value: float) -> float:
+        # follows the recursion of pandas' ewm(alpha=1 - beta, adjust=False).mean()
+        is_observation = value == value
+        if self.__weighted == self.__weighted:
+            self.__old_weight *= 1.0 - self.__alpha
+            new_weight = 1.0 - self.__old_weight if self.__com == 1 else self.__alpha
+            if is_observation:
+                if self.__weighted != value:
+                    self.__weighted = (self.__old_weight * self.__weighted + new_weight * value) / (
+                        self.__old_weight + new_weight
+                    )
+                self.__old_weight = 1.0
+        elif is_observation:
+            self.__weighted = value
+        return self.__weighted
+
+
+class _IncrementalSmoothedMovingAverage:
+    """Incremental counterpart of smoothed_moving_average"""
+
+    def __init__(self, w: Window):
+        self.__size = w.w
+        self.__window = _RollingWindow(w.w)
+        self.__ramp = _Ramp(w.r)
+        self.__times = _RollingWindow(w.w)  # observations after the ramp up, which the smoothing counts
+        self.__average = None
+
+    def update(self, time: pd.Timestamp, value: float) -> float:
+        self.__window.add(time, value)
+        if not self.__ramp.update(time):
+            return np.nan
+        self.__times.add(time, value)
+        if self.__average is None:
+            self.__average = self.__window.mean
+        else:
+            count = self.__size if isinstance(self.__size, int) else len(self.__times)
+            self.__average = ((count - 1) * self.__average + value) / count
+        return self.__average
+
+
+class IncrementalRelativeStrengthIndex(IncrementalFunction):
+    """
+    Incremental relative strength index
+
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Defaults to 14.
+    :param history: time series of prices to seed the index with
+
+    **Usage**
+
+    Each update gives the value of :func:`relative_strength_index` at the new price in O(1) time.
+
+    **Examples**
+
+    >>> prices = generate_series(100)
+    >>> rsi = IncrementalRelativeStrengthIndex(14, prices)
+    >>> rsi.update(dt.date.today() + dt.timedelta(days=1), 101.5)
+
+    **See also**
+
+    :func:`relative_strength_index`
+    """
+
+    def __init__(self, w: Union[Window, int, str] = 14, history: Optional[pd.Series] = None):
+        super().__init__()
+        w = _normalize_window(w)
+        if w.w is None:
+            raise MqValueError('window size is required for incremental relative strength index')
+        self.__gains = _IncrementalSmoothedMovingAverage(w)
+        self.__losses = _IncrementalSmoothedMovingAverage(w)
+        self.__previous = None
+        if history is not None:
+            self.update_series(history)
+
+    def _update(self, time: pd.Timestamp, value: float) -> float:
+        previous, self.__previous = self.__previous, value
+        if previous is None:
+            return np.nan
+
+        change = value - previous
+        gains = self.__gains.update(time, 0.0 if change < 0 else change)
+        losses = self.__losses.update(time, 0.0 if change > 0 else -change)
+        if gains != gains:
+            return np.nan
+        if losses == 0:
+            return 100.0
+        return 100 - (100 / (1 + gains / losses))
+
+
+class IncrementalVolatility(IncrementalFunction):
+    """
+    Incremental realized volatility
+
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to all observations.
+    :param returns_type: returns type of the prices (simple, logarithmic or absolute), or None if the observations are
+        returns
+    :param annualization_factor: annualization factor. Inferred from the history if not provided
+    :param assume_zero_mean: if True, uses the root mean square of returns rather than their standard deviation
+    :param history: time series of observations to seed the volatility with
+
+    **Usage**
+
+    Each update gives the value of :func:`volatility` at the new observation in O(1) time. The annualization factor
+    is fixed when the object is created, so it must be provided when there is no history to infer it from.
+
+    **Examples**
+
+    >>> prices = generate_series(100)
+    >>> vol = IncrementalVolatility(22, history=prices)
+    >>> vol.update(dt.date.today() + dt.timedelta(days=1), 101.5)
+
+    **See also**
+
+    :func:`volatility`
+    """
+
+    def __init__(
+        self,
+        w: Union[Window, int, str] = Window(None, 0),
+        returns_type: Optional[Returns] = Returns.SIMPLE,
+        annualization_factor: Optional[int] = None,
+        assume_zero_mean: bool = False,
+        history: Optional[pd.Series] = None,
+    ):
+        super().__init__()
+        if annualization_factor is None:
+            if history is None or len(history) < 2:
+                raise MqValueError('annualization factor is required when there is no history to infer it from')
+            annualization_factor = _get_annualization_factor(history)
+        w = _normalize_window(w)
+        self.__window = _RollingWindow(w.w)
+        self.__ramp = _Ramp(w.r)
+        self.__returns_type = returns_type
+        self.__scale = math.sqrt(annualization_factor) * 100
+        self.__assume_zero_mean = assume_zero_mean
+        self.__previous = None
+        if history is not None:
+            self.update_series(history)
+
+    def __returns(self, value: float) -> float:
+        previous, self.__previous = self.__previous, value
+        if self.__returns_type is None:
+            return value
+        if previous is None:
+            return np.nan
+        if self.__returns_type == Returns.SIMPLE:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return float(np.float64(value) / previous - 1)
+        if self.__returns_type == Returns.LOGARITHMIC:
+            return math.log(value) - math.log(previous)
+        if self.__returns_type == Returns.ABSOLUTE:
+            return value - previous
+        raise MqValueError('Unknown returns type (use simple / logarithmic / absolute)')
+
+    def _update(self, time: pd.Timestamp, value: float) -> float:
+        self.__window.add(time, self.__returns(value))
+        if not self.__ramp.update(time):
+            return np.nan
+        vol = math.sqrt(self.__window.mean_square) if self.__assume_zero_mean else self.__window.std
+        return vol * self.__scale
+
+
+class IncrementalZScores(IncrementalFunction):
+    """
+    Incremental rolling z-scores
+
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+    :param history: time series of observations to seed the z-scores with
+
+    **Usage**
+
+    Each update gives the value of :func:`zscores` at the new observation in O(1) time. A window size is required,
+    as z-scores over the full series depend on observations which have not arrived yet.
+
+    **Examples**
+
+    >>> returns = returns(generate_series(100))
+    >>> scores = IncrementalZScores(22, returns)
+    >>> scores.update(dt.date.today() + dt.timedelta(days=1), 0.01)
+
+    **See also**
+
+    :func:`zscores`
+    """
+
+    def __init__(self, w: Union[Window, int, str], history: Optional[pd.Series] = None):
+        super().__init__()
+        w = _normalize_window(w)
+        if w.w is None:
+            raise MqValueError('window size is required for incremental z-scores')
+        self.__window = _RollingWindow(w.w)
+        self.__ramp = _Ramp(w.r)
+        if history is not None:
+            self.update_series(history)
+
+    def _update(self, time: pd.Timestamp, value: float) -> float:
+        self.__window.add(time, value)
+        if not self.__ramp.update(time):
+            return np.nan
+        if len(self.__window) == 1:
+            return 0.0
+        if self.__window.missing:
+            return np.nan
+        std = self.__window.std
+        return (value - self.__window.mean) / std if std > 0 else np.nan
@@ -512,6 +512,11 @@ def _market_data_timed(q, request_id=None, ignore_errors: bool = False):
     return GsDataApi.get_market_data(*args, ignore_errors=ignore_errors)
 
 
+async def _market_data_timed_async(q, request_id=None, ignore_errors: bool = False):
+    args = [q, request_id] if request_id else [q]
+    return await GsDataApi.get_market_data_async(*args, ignore_errors=ignore_errors)
+
+
 def _extract_series_from_df(df: pd.DataFrame, query_type: QueryType, handle_missing_column=False):
     col_name = query_type.value.replace(' ', '')
     col_name = col_name[0].lower() + col_name[1:]
@@ -17,7 +17,7 @@
 
 import datetime as dt
 from enum import Enum
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -32,6 +32,7 @@ from .helper import (
     Window,
     normalize_window,
     rolling_offset,
+    rolling_offset_frame,
     apply_ramp,
     plot_function,
     rolling_apply,
@@ -53,21 +54,7 @@ try:
 except ImportError:
 
     def rolling_std(x: pd.Series, offset: pd.DateOffset) -> pd.Series:
-        size = len(x)
-        index = x.index
-        results = np.empty(size, dtype=np.double)
-        results[0] = np.nan
-        values = np.array(x.values, dtype=np.double)  # put data into np arrays to save time on slicing later
-
-        start = 0
-        for i in range(1, size):
-            for j in range(start, i + 1):
-                if pd.Timestamp(index[j]) > index[i] - offset:
-                    start = j
-                    break
-            section = values[start : i + 1]
-            results[i] = np.std(section[section == section], ddof=1)
-        return pd.Series(results, index=index, dtype=np.double)
+        return rolling_offset(x, offset, lambda a: np.nanstd(a, ddof=1), 'std')
 
 
 def _concat_series(series: List[pd.Series]):
@@ -1080,6 +1067,312 @@ def percentile(x: pd.Series, n: float, w: Union[Window, int, str] = None) -> Uni
     return apply_ramp(res, w)
 
 
+def _rolling_frame(x: pd.DataFrame, w: Window, method_name: str, **kwargs) -> pd.DataFrame:
+    if isinstance(w.w, pd.DateOffset):
+        return rolling_offset_frame(x, w.w, method_name, **kwargs)
+    return getattr(x.rolling(w.w, 0), method_name)(**kwargs)
+
+
+def _rolling_frame_statistic(x: pd.DataFrame, w: Union[Window, int, str], method_name: str) -> pd.DataFrame:
+    w = normalize_window(x, w)
+    assert x.index.is_monotonic_increasing, "frame index is monotonic increasing"
+    return apply_ramp(_rolling_frame(x, w, method_name).astype(float), w)
+
+
+def min_frame(x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0)) -> pd.DataFrame:
+    """
+    Minimum value of each column of a frame over given window
+
+    :param x: frame: timeseries in columns
+    :param w: window: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value. If w is a string, it should be a relative time duration like '1m', '5d', etc.
+              Window size defaults to length of frame.
+    :return: frame of minimum values
+
+    **Usage**
+
+    Computes :func:`min_` of every column in a single pass over the frame. Each column of the result is equal to
+    :func:`min_` applied to the corresponding column of :math:`x`.
+
+    **Examples**
+
+    Minimum value of price series over the last :math:`22` observations:
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> min_frame(prices, 22)
+
+    **See also**
+
+    :func:`min_` :func:`max_frame`
+
+    """
+    return _rolling_frame_statistic(x, w, 'min')
+
+
+def max_frame(x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0)) -> pd.DataFrame:
+    """
+    Maximum value of each column of a frame over given window
+
+    :param x: frame: timeseries in columns
+    :param w: window: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value. If w is a string, it should be a relative time duration like '1m', '5d', etc.
+              Window size defaults to length of frame.
+    :return: frame of maximum values
+
+    **Usage**
+
+    Computes :func:`max_` of every column in a single pass over the frame. Each column of the result is equal to
+    :func:`max_` applied to the corresponding column of :math:`x`.
+
+    **Examples**
+
+    Maximum value of price series over the last :math:`22` observations:
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> max_frame(prices, 22)
+
+    **See also**
+
+    :func:`max_` :func:`min_frame`
+
+    """
+    return _rolling_frame_statistic(x, w, 'max')
+
+
+def sum_frame(x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0)) -> pd.DataFrame:
+    """
+    Rolling sum of each column of a frame over given window
+
+    :param x: frame: timeseries in columns
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to length of frame.
+    :return: frame of rolling sums
+
+    **Usage**
+
+    Computes :func:`sum_` of every column in a single pass over the frame. Each column of the result is equal to
+    :func:`sum_` applied to the corresponding column of :math:`x`.
+
+    **Examples**
+
+    Generate price series and compute rolling sums over :math:`22` observations
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> sum_frame(prices, 22)
+
+    **See also**
+
+    :func:`sum_` :func:`mean_frame`
+
+    """
+    return _rolling_frame_statistic(x, w, 'sum')
+
+
+def mean_frame(
+    x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0), mean_type: MeanType = MeanType.ARITHMETIC
+) -> pd.DataFrame:
+    """
+    Arithmetic or quadratic mean of each column of a frame over given window
+
+    :param x: frame: timeseries in columns
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to length of frame.
+    :param mean_type: calculate arithmetic mean or quadratic mean (root mean square). Defaults to arithmetic
+    :return: frame of mean values
+
+    **Usage**
+
+    Computes :func:`mean` of every column in a single pass over the frame. Each column of the result is equal to
+    :func:`mean` applied to the corresponding column of :math:`x`.
+
+    **Examples**
+
+    Generate price series and compute mean over :math:`22` observations
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> mean_frame(prices, 22)
+
+    **See also**
+
+    :func:`mean` :func:`std_frame`
+
+    """
+    if mean_type is MeanType.QUADRATIC:
+        return np.sqrt(_rolling_frame_statistic(x**2, w, 'mean'))
+    return _rolling_frame_statistic(x, w, 'mean')
+
+
+def std_frame(x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0)) -> pd.DataFrame:
+    """
+    Rolling standard deviation of each column of a frame over given window
+
+    :param x: frame: timeseries in columns
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to length of frame.
+    :return: frame of standard deviations
+
+    **Usage**
+
+    Computes :func:`std` of every column in a single pass over the frame. Each column of the result is equal to
+    :func:`std` applied to the corresponding column of :math:`x`.
+
+    **Examples**
+
+    Generate price series and compute standard deviation of returns over :math:`22` observations
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> std_frame(prices.pct_change(), 22)
+
+    **See also**
+
+    :func:`std` :func:`var_frame`
+
+    """
+    if x.empty:
+        return x
+    return _rolling_frame_statistic(x, w, 'std')
+
+
+def var_frame(x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0)) -> pd.DataFrame:
+    """
+    Rolling variance of each column of a frame over given window
+
+    :param x: frame: timeseries in columns
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to length of frame.
+    :return: frame of variances
+
+    **Usage**
+
+    Computes :func:`var` of every column in a single pass over the frame. Each column of the result is equal to
+    :func:`var` applied to the corresponding column of :math:`x`.
+
+    **Examples**
+
+    Generate price series and compute variance of returns over :math:`22` observations
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> var_frame(prices.pct_change(), 22)
+
+    **See also**
+
+    :func:`var` :func:`std_frame`
+
+    """
+    return _rolling_frame_statistic(x, w, 'var')
+
+
+def _window_gaps(x: pd.DataFrame, w: Window) -> Tuple[pd.DataFrame, pd.Series]:
+    # number of missing values and number of observations (including missing values) in each window
+    missing = _rolling_frame(x.isna().astype(float), w, 'sum')
+    lengths = _rolling_frame(pd.DataFrame({'length': 1.0}, index=x.index), w, 'sum')['length']
+    return missing, lengths
+
+
+def zscores_frame(x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0)) -> pd.DataFrame:
+    """
+    Rolling z-scores of each column of a frame over a given window
+
+    :param x: frame: timeseries in columns
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to length of frame.
+    :return: frame of z-scores
+
+    **Usage**
+
+    Computes :func:`zscores` of every column in a single pass over the frame, from rolling means and standard
+    deviations. Each column of the result is equal to :func:`zscores` applied to the corresponding column of
+    :math:`x`: windows containing missing values give missing z-scores, and single observation windows give zero.
+
+    **Examples**
+
+    Generate price series and compute z-score of returns over :math:`22` observations
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> zscores_frame(prices.pct_change(), 22)
+
+    **See also**
+
+    :func:`zscores` :func:`percentiles_frame`
+
+    """
+    if x.size < 1:
+        return x
+
+    if isinstance(w, int):
+        w = normalize_window(x, w)
+    elif isinstance(w, str):
+        if not (isinstance(x.index, pd.DatetimeIndex) or isinstance(x.index[0], dt.date)):
+            raise MqValueError("When string is passed window index must be a DatetimeIndex or of type datetime.date")
+        w = normalize_window(x, w)
+    if not w.w:
+        if len(x) == 1:
+            return pd.DataFrame(0.0, index=x.index, columns=x.columns)
+        return ((x - x.mean()) / x.std(ddof=1)).astype(float)
+
+    if not isinstance(w.w, int):
+        w = normalize_window(x, w)
+    assert x.index.is_monotonic_increasing, "frame index is monotonic increasing"
+    values = x.astype(float)
+    scores = (values - _rolling_frame(values, w, 'mean')) / _rolling_frame(values, w, 'std')
+    missing, lengths = _window_gaps(values, w)
+    scores = scores.where(missing == 0)
+    scores[(lengths == 1).values] = 0.0
+    return apply_ramp(scores, w)
+
+
+def percentiles_frame(x: pd.DataFrame, w: Union[Window, int, str] = Window(None, 0)) -> pd.DataFrame:
+    """
+    Rolling percentiles of each column of a frame over given window
+
+    :param x: frame: timeseries in columns
+    :param w: Window or int: size of window and ramp up to use. e.g. Window(22, 10) where 22 is the window size
+              and 10 the ramp up value.  If w is a string, it should be a relative date like '1m', '1d', etc.
+              Window size defaults to length of frame.
+    :return: frame of percentiles
+
+    **Usage**
+
+    Computes :func:`percentiles` of every column over its own history in a single pass over the frame, from rolling
+    ranks. Each column of the result is equal to :func:`percentiles` applied to the corresponding column of
+    :math:`x` with no distribution series.
+
+    **Examples**
+
+    Compute percentile ranks of each series in its own distribution over :math:`22` observations
+
+    >>> prices = pd.concat([generate_series(100), generate_series(100)], axis=1)
+    >>> percentiles_frame(prices, 22)
+
+    **See also**
+
+    :func:`percentiles` :func:`zscores_frame`
+
+    """
+    if x.empty:
+        return x
+
+    w = normalize_window(x, w)
+    if isinstance(w.w, int) and w.w > len(x):
+        return pd.DataFrame(columns=x.columns, dtype=float)
+    assert x.index.is_monotonic_increasing, "frame index is monotonic increasing"
+
+    values = x.astype(float)
+    counts = _rolling_frame(values, w, 'count')
+    # percentileofscore(kind='mean') is the average rank less one half, over the number of observations
+    res = (_rolling_frame(values, w, 'rank', pct=True) - 0.5 / counts) * 100
+    missing, _ = _window_gaps(values, w)
+    valid = missing == 0
+    if isinstance(w.r, int):
+        valid &= counts >= w.r
+    return apply_ramp(res.where(valid), w)
+
+
 class LinearRegression:
     """
     Fit an Ordinary least squares (OLS) linear regression model.